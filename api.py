@@ -1,52 +1,88 @@
 import asyncio
-import secrets
+import os
+import random
 
+import orjson
 import uvicorn
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 
-app = FastAPI()
+try:
+    import uvloop
+except ImportError:
+    # uvloop is not available on Windows, so we fall back to the default asyncio event loop.
+    uvloop = None
 
+app = FastAPI(default_response_class=ORJSONResponse)
 
-@app.get("/users")
-async def read_users() -> list[dict]:
-    await asyncio.sleep(10)
-    return [
+# Endpoints simulate slow responses to demonstrate client timeouts and retries.
+# Set `SIMULATE_LATENCY=0` to disable delays, e.g. when benchmarking the server itself.
+SIMULATE_LATENCY = os.getenv("SIMULATE_LATENCY", "1") != "0"
+
+# The delay jitter isn't security-sensitive, so an in-process PRNG is enough and avoids a syscall per request.
+rng = random.Random()  # noqa: S311
+
+# Payloads are constant, so we serialize them once instead of on every request.
+USERS_CONTENT = orjson.dumps(
+    [
         {"username": "Rick"},
         {"username": "Morty"},
         {"username": "Summer"},
         {"username": "Beth"},
         {"username": "Jerry"},
     ]
-
-
-@app.get("/posts")
-async def read_posts() -> list[dict]:
-    rand = secrets.randbelow(5) + 1  # From 1 to 5
-    await asyncio.sleep(rand * 2)
-    return [
+)
+POSTS_CONTENT = orjson.dumps(
+    [
         {"title": "Understanding Asyncio in Python"},
         {"title": "FastAPI vs Flask: A Comparison"},
         {"title": "Building a REST API with FastAPI"},
         {"title": "Introduction to Python Generators"},
         {"title": "Mastering Python Decorators"},
     ]
+)
+REDIRECT_CONTENT = orjson.dumps({"redirect": "Redirecting"})
+CLIENT_ERROR_CONTENT = orjson.dumps({"error": "Client Error"})
+SERVER_ERROR_CONTENT = orjson.dumps({"error": "Server Error"})
+
+
+@app.get("/users")
+async def read_users() -> Response:
+    if SIMULATE_LATENCY:
+        await asyncio.sleep(10)
+    return Response(content=USERS_CONTENT, media_type="application/json")
+
+
+@app.get("/posts")
+async def read_posts() -> Response:
+    if SIMULATE_LATENCY:
+        rand = rng.randint(1, 5)
+        await asyncio.sleep(rand * 2)
+    return Response(content=POSTS_CONTENT, media_type="application/json")
 
 
-@app.get("/redirect")
-async def read_redirect() -> JSONResponse:
-    return JSONResponse(status_code=300, content={"redirect": "Redirecting"})
+@app.get("/redirect", status_code=300)
+async def read_redirect() -> Response:
+    return Response(content=REDIRECT_CONTENT, status_code=300, media_type="application/json")
 
 
-@app.get("/client-error")
-async def read_client_error() -> JSONResponse:
-    return JSONResponse(status_code=400, content={"error": "Client Error"})
+@app.get("/client-error", status_code=400)
+async def read_client_error() -> Response:
+    return Response(content=CLIENT_ERROR_CONTENT, status_code=400, media_type="application/json")
 
 
-@app.get("/server-error")
-async def read_server_error() -> JSONResponse:
-    return JSONResponse(status_code=500, content={"error": "Server Error"})
+@app.get("/server-error", status_code=500)
+async def read_server_error() -> Response:
+    return Response(content=SERVER_ERROR_CONTENT, status_code=500, media_type="application/json")
 
 
 if __name__ == "__main__":
-    uvicorn.run("api:app", port=5000, reload=True)
+    # Reloading is for development only and can't be combined with multiple workers.
+    uvicorn.run(
+        "api:app",
+        port=5000,
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        reload=os.getenv("RELOAD", "0") == "1",
+        loop="uvloop" if uvloop else "asyncio",
+        http="httptools",
+    )
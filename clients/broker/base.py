@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True)
 class BrokerMessage:
+    # `dataclass(slots=True)` requires Python 3.10+, so slots are declared manually.
+    __slots__ = ("metadata", "body")
+
     metadata: dict[str, Any] | None
     body: str
 
@@ -20,9 +24,13 @@ class BrokerMessageBuilder(ABC):
     """
 
     def build(self, *args: Any, **kwargs: Any) -> BrokerMessage | None:
+        # Filter first, so rejected messages don't pay for metadata and body construction.
+        if not self.filter(*args, **kwargs):
+            return None
+
         metadata = self.build_metadata(*args, **kwargs)
         body = self.build_body(*args, **kwargs)
-        return BrokerMessage(metadata=metadata, body=body) if self.filter(*args, **kwargs) else None
+        return BrokerMessage(metadata=metadata, body=body)
 
     def filter(self, *args: Any, **kwargs: Any) -> bool:
         """Determine whether a `BrokerMessage` should be built.
@@ -49,37 +57,63 @@ class BrokerClientBase:
     It serves as a foundation for both synchronous and asynchronous broker clients.
     """
 
-    def __init__(self, queue_url: str) -> None:
+    __slots__ = ("queue_url",)
+
+    def __init__(self, queue_url: str, **kwargs: Any) -> None:
+        # Pass the remaining arguments along the MRO to support cooperative multiple inheritance.
+        super().__init__(**kwargs)
         self.queue_url = queue_url
 
 
-class BrokerClient(BrokerClientBase, ABC):
-    """Abstract base class for synchronous broker clients."""
+class BrokerClient(BrokerClientBase):
+    """Base class for synchronous broker clients.
+
+    It intentionally doesn't use `ABC`, so that subclasses can be combined with other metaclasses
+    (e.g. `OptionalSingletonMeta`) without defining a combined metaclass.
+    """
+
+    __slots__ = ()
 
-    @abstractmethod
     def connect(self) -> Any:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def disconnect(self) -> Any:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def send_message(self, message: BrokerMessage) -> Any:
-        pass
+        raise NotImplementedError
 
+    def send_messages(self, messages: list[BrokerMessage]) -> list[Any]:
+        """Send multiple messages to the broker.
 
-class AsyncBrokerClient(BrokerClientBase, ABC):
-    """Abstract base class for asynchronous broker clients."""
+        By default, messages are sent one by one. Subclasses can override this method
+        to use the broker's native batch API.
+        """
+        return [self.send_message(message) for message in messages]
+
+
+class AsyncBrokerClient(BrokerClientBase):
+    """Base class for asynchronous broker clients.
+
+    It intentionally doesn't use `ABC`, so that subclasses can be combined with other metaclasses
+    (e.g. `OptionalSingletonMeta`) without defining a combined metaclass.
+    """
+
+    __slots__ = ()
 
-    @abstractmethod
     async def connect(self) -> Any:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     async def disconnect(self) -> Any:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     async def send_message(self, message: BrokerMessage) -> Any:
-        pass
+        raise NotImplementedError
+
+    async def send_messages(self, messages: list[BrokerMessage]) -> list[Any]:
+        """Send multiple messages to the broker.
+
+        By default, messages are sent concurrently one by one. Subclasses can override this method
+        to use the broker's native batch API.
+        """
+        return list(await asyncio.gather(*(self.send_message(message) for message in messages)))
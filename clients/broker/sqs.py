@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from abc import ABCMeta
+import asyncio
+import contextlib
+import queue
+import threading
+import time
 from typing import Any
 
 import aioboto3
 import boto3
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
 from loggers import broker_clients_logger
@@ -12,6 +17,56 @@ from patterns import OptionalSingletonMeta
 
 from .base import AsyncBrokerClient, BrokerClient, BrokerMessage, BrokerMessageBuilder
 
+# SQS accepts at most 10 entries per `SendMessageBatch` request.
+SQS_MAX_BATCH_SIZE = 10
+
+# The default pool of 10 connections limits concurrent sends, and keep-alive avoids reconnecting between them.
+SQS_CLIENT_CONFIG = Config(max_pool_connections=64, tcp_keepalive=True, retries={"mode": "standard"})
+
+# boto3 clients are thread-safe, so SQS clients with the same connection settings share one boto3 client
+# (and its connection pool) instead of opening new connections per instance.
+_shared_clients_lock = threading.Lock()
+_shared_clients: dict[tuple[str, str | None], Any] = {}
+_shared_clients_refs: dict[tuple[str, str | None], int] = {}
+
+# Creating an aioboto3 session is expensive, so it is created once and reused by all async SQS clients.
+# Clients themselves are not shared, since they are bound to the event loop they were created in.
+_shared_async_session: aioboto3.Session | None = None
+
+
+def _acquire_shared_client(region_name: str, endpoint_url: str | None) -> Any:
+    key = (region_name, endpoint_url)
+
+    with _shared_clients_lock:
+        if key not in _shared_clients:
+            _shared_clients[key] = boto3.client(
+                "sqs",
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                config=SQS_CLIENT_CONFIG,
+            )
+        _shared_clients_refs[key] = _shared_clients_refs.get(key, 0) + 1
+        return _shared_clients[key]
+
+
+def _release_shared_client(region_name: str, endpoint_url: str | None) -> None:
+    key = (region_name, endpoint_url)
+
+    with _shared_clients_lock:
+        _shared_clients_refs[key] -= 1
+        # Close the boto3 client only when the last SQS client using it disconnects.
+        if _shared_clients_refs[key] == 0:
+            del _shared_clients_refs[key]
+            _shared_clients.pop(key).close()
+
+
+def _get_shared_async_session() -> aioboto3.Session:
+    global _shared_async_session  # noqa: PLW0603
+
+    if _shared_async_session is None:
+        _shared_async_session = aioboto3.Session()
+    return _shared_async_session
+
 
 class SQSMessageBuilder(BrokerMessageBuilder):
     """Abstract class for building SQS messages.
@@ -25,10 +80,10 @@ class SQSMessageBuilder(BrokerMessageBuilder):
         return {"DataType": "Number", "StringValue": str(value)}
 
     def string_attr(self, value: Any) -> dict[str, Any]:
-        return {"DataType": "String", "StringValue": str(value)}
+        return {"DataType": "String", "StringValue": value if type(value) is str else str(value)}
 
     def string_list_attr(self, values: list[Any]) -> dict[str, Any]:
-        return {"DataType": "String", "StringListValues": [str(value) for value in values]}
+        return {"DataType": "String", "StringListValues": list(map(str, values))}
 
     def binary_attr(self, value: bytes) -> dict[str, Any]:
         return {"DataType": "Binary", "BinaryValue": value}
@@ -44,7 +99,13 @@ class SQSClientBase:
     It serves as a foundation for both synchronous and asynchronous SQS clients.
     """
 
-    def __init__(self, *, log_attributes: bool = False, log_body: bool = False) -> None:
+    # Two bases with non-empty slots can't be combined, so the attributes set here
+    # are declared in the slots of the concrete clients instead.
+    __slots__ = ()
+
+    def __init__(self, *, log_attributes: bool = False, log_body: bool = False, **kwargs: Any) -> None:
+        # Pass the remaining arguments along the MRO to support cooperative multiple inheritance.
+        super().__init__(**kwargs)
         self.log_attributes = log_attributes
         self.log_body = log_body
 
@@ -52,7 +113,9 @@ class SQSClientBase:
         error_code = error.response["Error"]["Code"]
         error_message = error.response["Error"]["Message"]
         broker_clients_logger.error(
-            f"Failed to send SQS message due to ClientError: {error_code} - {error_message}",
+            "Failed to send SQS message due to ClientError: %s - %s",
+            error_code,
+            error_message,
             exc_info=error,
             extra={"error": {"code": error_code, "message": error_message}},
         )
@@ -61,6 +124,11 @@ class SQSClientBase:
         broker_clients_logger.error("Failed to send SQS message due to BotoCoreError", exc_info=error)
 
     def log_success(self, message: BrokerMessage) -> None:
+        # Skip building `extra` in the default case, since this runs for every sent message.
+        if not (self.log_attributes or self.log_body):
+            broker_clients_logger.info("Sent SQS message successfully")
+            return
+
         extra = {}
 
         if self.log_attributes:
@@ -70,17 +138,62 @@ class SQSClientBase:
 
         broker_clients_logger.info("Sent SQS message successfully", extra=extra)
 
+    def log_batch_entry_error(self, entry: dict[str, Any]) -> None:
+        error_code = entry["Code"]
+        error_message = entry["Message"]
+        broker_clients_logger.error(
+            "Failed to send SQS message in batch: %s - %s",
+            error_code,
+            error_message,
+            extra={"error": {"code": error_code, "message": error_message}},
+        )
+
+    def log_batch_result(self, messages: list[BrokerMessage], response: dict[str, Any]) -> None:
+        for entry in response.get("Successful", []):
+            self.log_success(messages[int(entry["Id"])])
+        for entry in response.get("Failed", []):
+            self.log_batch_entry_error(entry)
+
+    def batch_entries(self, messages: list[BrokerMessage]) -> list[dict[str, Any]]:
+        # Entry IDs only have to be unique within a batch, so we use message indexes to map results back.
+        return [
+            {"Id": str(index), "MessageAttributes": message.metadata, "MessageBody": message.body}
+            for index, message in enumerate(messages)
+        ]
+
+    def split_into_batches(self, messages: list[BrokerMessage]) -> list[list[BrokerMessage]]:
+        return [messages[i : i + SQS_MAX_BATCH_SIZE] for i in range(0, len(messages), SQS_MAX_BATCH_SIZE)]
+
 
-class SQSClientMeta(OptionalSingletonMeta, ABCMeta):
+class SQSClientMeta(OptionalSingletonMeta):
     """Meta class for SQS clients.
 
-    This class combines `OptionalSingletonMeta` and `ABCMeta` to prevent conflicts
-    with the inheritance of `BrokerClient` and the use of `OptionalSingletonMeta`.
+    This class provides optional singleton behavior for SQS clients.
     """
 
 
 class SQSClient(SQSClientBase, BrokerClient, metaclass=SQSClientMeta):
-    """Synchronous SQS client."""
+    """Synchronous SQS client.
+
+    When `buffered` is enabled, `send_message` only puts messages into a bounded in-memory queue,
+    and a background thread sends them in batches. This decouples producers from SQS latency,
+    at the cost of `send_message` no longer returning the SQS response.
+    """
+
+    __slots__ = (
+        "log_attributes",
+        "log_body",
+        "region_name",
+        "endpoint_url",
+        "buffered",
+        "buffer_size",
+        "flush_interval",
+        "_client",
+        "_buffer",
+        "_buffer_lock",
+        "_stop",
+        "_flusher",
+    )
 
     def __init__(
         self,
@@ -90,23 +203,104 @@ class SQSClient(SQSClientBase, BrokerClient, metaclass=SQSClientMeta):
         endpoint_url: str | None = None,
         log_attributes: bool = False,
         log_body: bool = False,
+        buffered: bool = False,
+        buffer_size: int = 1000,
+        flush_interval: float = 0.05,
     ) -> None:
-        BrokerClient.__init__(self, queue_url)
-        SQSClientBase.__init__(self, log_attributes=log_attributes, log_body=log_body)
+        super().__init__(queue_url=queue_url, log_attributes=log_attributes, log_body=log_body)
 
         self.region_name = region_name
         self.endpoint_url = endpoint_url
+        self.buffered = buffered
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
         self._client = None
+        self._buffer: queue.Queue[BrokerMessage | None] | None = None
+        # Producers check the stop signal and put their messages under this lock, so that no message is put
+        # into the buffer once `disconnect` has signalled the flusher to stop.
+        self._buffer_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
 
     def connect(self) -> None:
         if self._client is None:
-            self._client = boto3.client("sqs", region_name=self.region_name, endpoint_url=self.endpoint_url)
+            self._client = _acquire_shared_client(self.region_name, self.endpoint_url)
+
+        if self.buffered and self._flusher is None:
+            self._buffer = queue.Queue(maxsize=self.buffer_size)
+            self._stop.clear()
+            # A daemon thread doesn't keep the process alive if the client is never disconnected.
+            self._flusher = threading.Thread(target=self._flush_buffer, name="sqs-client-flusher", daemon=True)
+            self._flusher.start()
 
     def disconnect(self) -> None:
+        if self._flusher is not None:
+            with self._buffer_lock:
+                self._stop.set()
+            # Wake the flusher up if it waits for messages. No messages are put after the stop signal,
+            # so the flusher sends all buffered messages before it gets to `None`.
+            self._buffer.put(None)
+            self._flusher.join()
+            self._buffer = None
+            self._flusher = None
+
         if self._client is not None:
-            self._client.close()
+            _release_shared_client(self.region_name, self.endpoint_url)
+            self._client = None
+
+    def _drain_buffer(self) -> list[BrokerMessage] | None:
+        # Once stopped, nothing is put into the buffer anymore, so an empty buffer means all messages were sent.
+        if self._stop.is_set() and self._buffer.empty():
+            return None
+
+        # Wait for the first message, then collect more until the batch is full or the flush interval expires.
+        message = self._buffer.get()
+        if message is None:
+            self._buffer.task_done()
+            return None
+
+        messages = [message]
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(messages) < SQS_MAX_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                message = self._buffer.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if message is None:
+                # The stop signal comes after all messages, so this batch is the last one.
+                self._buffer.task_done()
+                break
+            messages.append(message)
+
+        return messages
+
+    def _flush_buffer(self) -> None:
+        while (messages := self._drain_buffer()) is not None:
+            self._send_buffered_batch(messages)
+
+    def _send_buffered_batch(self, messages: list[BrokerMessage]) -> None:
+        try:
+            self.send_message_batch(messages)
+        except Exception:  # noqa: BLE001
+            # Keep flushing after unexpected errors. Otherwise buffered messages would never be sent,
+            # producers would block on a full buffer and `disconnect` would wait for the buffer forever.
+            broker_clients_logger.exception("Failed to send buffered SQS messages")
+        finally:
+            for _ in messages:
+                self._buffer.task_done()
 
     def send_message(self, message: BrokerMessage) -> Any:
+        if (buffer := self._buffer) is not None:
+            with self._buffer_lock:
+                if not self._stop.is_set():
+                    buffer.put(message)
+                    return None
+            # The flusher is stopping and may already be gone, so the message is sent directly.
+
         try:
             response = self._client.send_message(
                 QueueUrl=self.queue_url,
@@ -123,9 +317,48 @@ class SQSClient(SQSClientBase, BrokerClient, metaclass=SQSClientMeta):
             self.log_success(message)
             return response
 
+    def send_message_batch(self, messages: list[BrokerMessage]) -> Any:
+        try:
+            response = self._client.send_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=self.batch_entries(messages),
+            )
+        except ClientError as error:
+            self.log_client_error(error)
+            return None
+        except BotoCoreError as error:
+            self.log_boto_core_error(error)
+            return None
+        else:
+            self.log_batch_result(messages, response)
+            return response
+
+    def send_messages(self, messages: list[BrokerMessage]) -> list[Any]:
+        return [self.send_message_batch(batch) for batch in self.split_into_batches(messages)]
+
 
 class AsyncSQSClient(SQSClientBase, AsyncBrokerClient, metaclass=SQSClientMeta):
-    """Asynchronous SQS client."""
+    """Asynchronous SQS client.
+
+    When `buffered` is enabled, `send_message` only puts messages into a bounded in-memory queue,
+    and a background task sends them in batches. This decouples producers from SQS latency,
+    at the cost of `send_message` no longer returning the SQS response.
+    """
+
+    __slots__ = (
+        "log_attributes",
+        "log_body",
+        "region_name",
+        "endpoint_url",
+        "buffered",
+        "buffer_size",
+        "flush_interval",
+        "_client",
+        "_client_kwargs",
+        "_buffer",
+        "_stopping",
+        "_flusher",
+    )
 
     def __init__(
         self,
@@ -135,29 +368,86 @@ class AsyncSQSClient(SQSClientBase, AsyncBrokerClient, metaclass=SQSClientMeta):
         endpoint_url: str | None = None,
         log_attributes: bool = False,
         log_body: bool = False,
+        buffered: bool = False,
+        buffer_size: int = 1000,
+        flush_interval: float = 0.05,
     ) -> None:
-        AsyncBrokerClient.__init__(self, queue_url)
-        SQSClientBase.__init__(self, log_attributes=log_attributes, log_body=log_body)
+        super().__init__(queue_url=queue_url, log_attributes=log_attributes, log_body=log_body)
 
         self.region_name = region_name
         self.endpoint_url = endpoint_url
+        self.buffered = buffered
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
         self._client = None
+        # Built once, so reconnecting doesn't repack the client arguments.
+        self._client_kwargs = {"region_name": region_name, "endpoint_url": endpoint_url, "config": SQS_CLIENT_CONFIG}
+        self._buffer: asyncio.Queue[BrokerMessage] | None = None
+        self._stopping = False
+        self._flusher: asyncio.Task[None] | None = None
 
     async def connect(self) -> None:
         if self._client is None:
-            session = aioboto3.Session()
+            session = _get_shared_async_session()
             # Since aioboto3 enforces the use of the async context manager, we need to call `__aenter__`.
-            self._client = await session.client(
-                "sqs",
-                region_name=self.region_name,
-                endpoint_url=self.endpoint_url,
-            ).__aenter__()
+            self._client = await session.client("sqs", **self._client_kwargs).__aenter__()
+
+        if self.buffered and self._flusher is None:
+            self._buffer = asyncio.Queue(maxsize=self.buffer_size)
+            self._stopping = False
+            self._flusher = asyncio.create_task(self._flush_buffer())
 
     async def disconnect(self) -> None:
+        if self._flusher is not None:
+            # Messages sent from now on bypass the buffer, so that none are left in it once the flusher is stopped.
+            self._stopping = True
+            # Send all buffered messages before stopping the flusher.
+            await self._buffer.join()
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._buffer = None
+            self._flusher = None
+
         if self._client is not None:
             await self._client.__aexit__(None, None, None)
 
+    async def _drain_buffer(self) -> list[BrokerMessage]:
+        loop = asyncio.get_running_loop()
+
+        # Wait for the first message, then collect more until the batch is full or the flush interval expires.
+        messages = [await self._buffer.get()]
+        deadline = loop.time() + self.flush_interval
+
+        while len(messages) < SQS_MAX_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                messages.append(await asyncio.wait_for(self._buffer.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return messages
+
+    async def _flush_buffer(self) -> None:
+        while True:
+            messages = await self._drain_buffer()
+            try:
+                await self.send_message_batch(messages)
+            except Exception:  # noqa: BLE001
+                # Keep flushing after unexpected errors. Otherwise buffered messages would never be sent,
+                # producers would block on a full buffer and `disconnect` would wait for the buffer forever.
+                broker_clients_logger.exception("Failed to send buffered SQS messages")
+            finally:
+                for _ in messages:
+                    self._buffer.task_done()
+
     async def send_message(self, message: BrokerMessage) -> Any:
+        if self._buffer is not None and not self._stopping:
+            await self._buffer.put(message)
+            return None
+
         try:
             response = await self._client.send_message(
                 QueueUrl=self.queue_url,
@@ -173,3 +463,30 @@ class AsyncSQSClient(SQSClientBase, AsyncBrokerClient, metaclass=SQSClientMeta):
         else:
             self.log_success(message)
             return response
+
+    async def send_message_batch(self, messages: list[BrokerMessage]) -> Any:
+        try:
+            response = await self._client.send_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=self.batch_entries(messages),
+            )
+        except ClientError as error:
+            self.log_client_error(error)
+            return None
+        except BotoCoreError as error:
+            self.log_boto_core_error(error)
+            return None
+        else:
+            self.log_batch_result(messages, response)
+            return response
+
+    async def send_messages(self, messages: list[BrokerMessage]) -> list[Any]:
+        # Batches are sent concurrently, but not more at once than there are connections in the pool.
+        semaphore = asyncio.Semaphore(SQS_CLIENT_CONFIG.max_pool_connections)
+
+        async def send_message_batch(batch: list[BrokerMessage]) -> Any:
+            async with semaphore:
+                return await self.send_message_batch(batch)
+
+        batches = self.split_into_batches(messages)
+        return list(await asyncio.gather(*(send_message_batch(batch) for batch in batches)))
@@ -1,20 +1,67 @@
-from httpx import Auth, BasicAuth
-
-from .base import (
-    AsyncHttpClient,
-    AsyncHttpRetryStrategy,
-    BrokerHttpMessageBuilder,
-    HttpClient,
-    HttpRequestLogConfig,
-    HttpResponseLogConfig,
-    HttpRetryStrategy,
-)
-from .request import EnhancedRequest, Request
-from .response import EnhancedResponse, Response
-from .supplier import (
-    AsyncSupplierClient,
-    SQSSupplierMessageBuilder,
-    SupplierClient,
-    SupplierRequestLogConfig,
-    SupplierResponseLogConfig,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from httpx import Auth, BasicAuth
+
+    from .base import (
+        AsyncHttpClient,
+        AsyncHttpRetryStrategy,
+        BrokerHttpMessageBuilder,
+        HttpClient,
+        HttpRequestLogConfig,
+        HttpResponseLogConfig,
+        HttpRetryStrategy,
+        default_client,
+    )
+    from .request import EnhancedRequest, Request
+    from .response import EnhancedResponse, Response
+    from .supplier import (
+        AsyncSupplierClient,
+        SQSSupplierMessageBuilder,
+        SupplierClient,
+        SupplierRequestLogConfig,
+        SupplierResponseLogConfig,
+    )
+
+# Names are imported from their modules on first access, so that importing the package (or one of its modules)
+# doesn't load the whole package, e.g. supplier clients with their tracing dependencies.
+_LAZY_IMPORTS = {
+    "Auth": "httpx",
+    "BasicAuth": "httpx",
+    "AsyncHttpClient": ".base",
+    "AsyncHttpRetryStrategy": ".base",
+    "BrokerHttpMessageBuilder": ".base",
+    "HttpClient": ".base",
+    "HttpRequestLogConfig": ".base",
+    "HttpResponseLogConfig": ".base",
+    "HttpRetryStrategy": ".base",
+    "default_client": ".base",
+    "EnhancedRequest": ".request",
+    "Request": ".request",
+    "EnhancedResponse": ".response",
+    "Response": ".response",
+    "AsyncSupplierClient": ".supplier",
+    "SQSSupplierMessageBuilder": ".supplier",
+    "SupplierClient": ".supplier",
+    "SupplierRequestLogConfig": ".supplier",
+    "SupplierResponseLogConfig": ".supplier",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    # Cache the name in the module, so that `__getattr__` is only called on first access.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,20 +1,40 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import logging
+import threading
+import weakref
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Literal
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
 import httpx
+import orjson
 from typing_extensions import Self
 
-from clients.broker import AsyncBrokerClient, BrokerClient, BrokerMessageBuilder
+from clients.broker import AsyncBrokerClient, BrokerClient, BrokerMessage, BrokerMessageBuilder
 from loggers import http_clients_logger
 from retry import AsyncRetryStrategy, RetryState, RetryStrategy, retry_on_exception, retry_on_result
-from utils.unset import UNSET, Unset, setattr_if_not_unset
+from utils.unset import UNSET, Unset, setattrs_if_not_unset
 
 from .request import EnhancedRequest
 from .response import EnhancedResponse
 
+try:
+    from httpx_aiohttp import AiohttpTransport
+except ImportError:
+    # httpx-aiohttp is an optional dependency, only needed for the aiohttp transport of asynchronous clients.
+    AiohttpTransport = None
+
+try:
+    import hishel
+except ImportError:
+    # hishel is an optional dependency, only needed for caching responses.
+    hishel = None
+
 if TYPE_CHECKING:
     from types import TracebackType
 
@@ -32,6 +52,139 @@ if TYPE_CHECKING:
         UrlType,
     )
 
+# HTTPX defaults to 100 connections with 20 kept alive, so concurrent requests quickly exhaust the pool
+# and keep reopening connections (and repeating TLS handshakes).
+DEFAULT_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0)
+
+# Maps HTTPX client arguments to the HTTP client settings they are taken from.
+HTTPX_CLIENT_SETTINGS = (
+    ("base_url", "base_url"),
+    ("params", "base_params"),
+    ("headers", "base_headers"),
+    ("cookies", "cookies"),
+    ("auth", "auth"),
+    ("proxy", "proxy"),
+    ("cert", "cert"),
+    ("timeout", "timeout"),
+    ("limits", "limits"),
+    ("http2", "http2"),
+)
+
+
+def _httpx_client_kwargs(settings: Any) -> dict[str, Any]:
+    """Collect HTTPX client arguments from the settings of an HTTP client class or instance.
+
+    Settings are read when the HTTPX client is opened rather than cached in `configure`,
+    since they can also be assigned directly or overridden per instance.
+    """
+    return {argument: getattr(settings, setting) for argument, setting in HTTPX_CLIENT_SETTINGS}
+
+
+def _retried_request(retry_state: RetryState) -> tuple[EnhancedRequest, DetailsType]:
+    # Clients pass the request by keyword, but a strategy can also retry a callable taking it positionally.
+    kwargs = retry_state.kwargs
+    return kwargs["request"] if "request" in kwargs else retry_state.args[0], kwargs["details"]
+
+
+@lru_cache(maxsize=1024)
+def _request_label(name: str | None, tag: str | None) -> str:
+    # Requests are usually named per endpoint, so the same few labels are built over and over.
+    prefix = name or "UNNAMED"
+    return f"{prefix}-{tag}" if tag else prefix
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+    try:
+        hash(value)
+    except TypeError:
+        # Settings like `httpx.Limits` and `httpx.Timeout` are unhashable, but their representation holds their values.
+        return repr(value)
+    return value
+
+
+def _settings_key(settings: Any) -> tuple[Any, ...]:
+    """Build a hashable key from the settings an HTTPX client is opened with."""
+    kwargs = _httpx_client_kwargs(settings)
+    kwargs["cache"] = settings.cache
+    return tuple((argument, _hashable(value)) for argument, value in kwargs.items())
+
+
+# Global clients kept open by `HttpClient.close_global(keep_warm=True)`, by their settings key, so that opening
+# a global client with the same settings again reuses their warm connection pools instead of cold ones.
+_warm_clients: dict[tuple[Any, ...], httpx.Client] = {}
+
+
+@atexit.register
+def _close_warm_clients() -> None:
+    for client in _warm_clients.values():
+        client.close()
+
+
+def _pop_transport_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    # HTTPX doesn't apply these arguments to a custom transport, so the transport takes them instead.
+    # Proxies in particular must be removed from the client, since HTTPX would mount its own proxy transport.
+    return {argument: kwargs.pop(argument) for argument in ("cert", "limits", "proxy", "http2")}
+
+
+def _check_cache_support() -> None:
+    if hishel is None:
+        raise ImportError("Response caching requires the hishel package")
+
+
+def _httpx_sync_client_kwargs(settings: Any) -> dict[str, Any]:
+    kwargs = _httpx_client_kwargs(settings)
+
+    if settings.cache:
+        _check_cache_support()
+        kwargs["transport"] = hishel.CacheTransport(
+            transport=httpx.HTTPTransport(**_pop_transport_kwargs(kwargs)),
+            storage=hishel.InMemoryStorage() if settings.cache is True else settings.cache,
+        )
+
+    return kwargs
+
+
+def _httpx_async_client_kwargs(settings: Any) -> dict[str, Any]:
+    kwargs = _httpx_client_kwargs(settings)
+
+    if not settings.aiohttp_transport and not settings.cache:
+        return kwargs
+
+    transport_kwargs = _pop_transport_kwargs(kwargs)
+
+    if settings.aiohttp_transport:
+        if AiohttpTransport is None:
+            raise ImportError("The aiohttp transport requires the httpx-aiohttp package")
+
+        proxy = transport_kwargs["proxy"]
+        transport_kwargs["proxy"] = httpx.Proxy(proxy) if isinstance(proxy, (str, httpx.URL)) else proxy
+        # aiohttp only speaks HTTP/1.1.
+        del transport_kwargs["http2"]
+        transport = AiohttpTransport(**transport_kwargs)
+    else:
+        transport = httpx.AsyncHTTPTransport(**transport_kwargs)
+
+    if settings.cache:
+        _check_cache_support()
+        transport = hishel.AsyncCacheTransport(
+            transport=transport,
+            storage=hishel.AsyncInMemoryStorage() if settings.cache is True else settings.cache,
+        )
+
+    kwargs["transport"] = transport
+    return kwargs
+
+
+# Status groups that retry strategies can retry on, with the response checks for them.
+STATUS_GROUP_CHECKS: tuple[tuple[str, Callable[[EnhancedResponse], bool]], ...] = (
+    ("info", attrgetter("is_info")),
+    ("redirect", attrgetter("is_redirect")),
+    ("client_error", attrgetter("is_client_error")),
+    ("server_error", attrgetter("is_server_error")),
+)
+
 
 class HttpRetryStrategy(RetryStrategy):
     """Retry strategy class for synchronous HTTP clients.
@@ -45,22 +198,43 @@ class HttpRetryStrategy(RetryStrategy):
         *,
         attempts: int = 0,
         delay: int = 0,
+        exponential: bool = False,
+        max_delay: float | None = None,
+        jitter: float = 0,
+        full_jitter: bool = False,
         on_timeouts: bool = False,
         on_network_errors: bool = False,
         on_protocol_errors: bool = False,
         on_statuses: set[Literal["info", "redirect", "client_error", "server_error"]] | None = None,
     ) -> None:
-        super().__init__(attempts=attempts, delay=delay)
+        super().__init__(
+            attempts=attempts,
+            delay=delay,
+            exponential=exponential,
+            max_delay=max_delay,
+            jitter=jitter,
+            full_jitter=full_jitter,
+        )
 
         self.on_timeouts = on_timeouts
         self.on_network_errors = on_network_errors
         self.on_protocol_errors = on_protocol_errors
         self.on_statuses = on_statuses or set()
 
+    @property
+    def on_statuses(self) -> set[Literal["info", "redirect", "client_error", "server_error"]]:
+        return self._on_statuses
+
+    @on_statuses.setter
+    def on_statuses(self, on_statuses: set[Literal["info", "redirect", "client_error", "server_error"]]) -> None:
+        self._on_statuses = on_statuses
+        # Resolve the checks for the status groups once, since `retry_on_status` runs for every response.
+        self._status_checks = tuple(check for group, check in STATUS_GROUP_CHECKS if group in on_statuses)
+
     @retry_on_exception(exc_types=(httpx.ConnectError, httpx.ConnectTimeout))
     def retry_on_connection_error(self, error: Exception) -> bool:
         http_clients_logger.info(
-            f"Marking HTTP request for retry due to connection error: {type(error).__name__} - {error}"
+            "Marking HTTP request for retry due to connection error: %s - %s", type(error).__name__, error
         )
         return True
 
@@ -68,7 +242,7 @@ class HttpRetryStrategy(RetryStrategy):
     def retry_on_timeout_error(self, error: Exception) -> bool:
         if self.on_timeouts:
             http_clients_logger.info(
-                f"Marking HTTP request for retry due to timeout error: {type(error).__name__} - {error}"
+                "Marking HTTP request for retry due to timeout error: %s - %s", type(error).__name__, error
             )
             return True
 
@@ -78,7 +252,7 @@ class HttpRetryStrategy(RetryStrategy):
     def retry_on_network_error(self, error: Exception) -> bool:
         if self.on_network_errors:
             http_clients_logger.info(
-                f"Marking HTTP request for retry due to network error: {type(error).__name__} - {error}"
+                "Marking HTTP request for retry due to network error: %s - %s", type(error).__name__, error
             )
             return True
 
@@ -88,7 +262,7 @@ class HttpRetryStrategy(RetryStrategy):
     def retry_on_protocol_error(self, error: Exception) -> bool:
         if self.on_protocol_errors:
             http_clients_logger.info(
-                f"Marking HTTP request for retry due to protocol error: {type(error).__name__} - {error}"
+                "Marking HTTP request for retry due to protocol error: %s - %s", type(error).__name__, error
             )
             return True
 
@@ -96,36 +270,37 @@ class HttpRetryStrategy(RetryStrategy):
 
     @retry_on_result
     def retry_on_status(self, result: EnhancedResponse) -> bool:
-        if result.is_success or not self.on_statuses:
+        if result.is_success or not self._status_checks:
             return False
 
-        if (
-            ("info" in self.on_statuses and result.is_info)
-            or ("redirect" in self.on_statuses and result.is_redirect)
-            or ("client_error" in self.on_statuses and result.is_client_error)
-            or ("server_error" in self.on_statuses and result.is_server_error)
-        ):
-            http_clients_logger.info(f"Marking HTTP request for retry due to status code: {result.status_code}")
+        if any(check(result) for check in self._status_checks):
+            http_clients_logger.info("Marking HTTP request for retry due to status code: %s", result.status_code)
             return True
 
         return False
 
     def before(self, retry_state: RetryState) -> None:
-        request = retry_state.kwargs.get("request") or retry_state.args[0]
-        details = retry_state.kwargs["details"]
+        request, details = _retried_request(retry_state)
 
         http_clients_logger.info(
-            f"Retrying HTTP request [{details['request_label']}] ({retry_state.attempt_number}/{self.attempts}): "
-            f"{request.method} {request.url}"
+            "Retrying HTTP request [%s] (%d/%d): %s %s",
+            details["request_label"],
+            retry_state.attempt_number,
+            self.attempts,
+            request.method,
+            request.url,
         )
 
     def error_callback(self, retry_state: RetryState) -> None:
-        request = retry_state.kwargs.get("request") or retry_state.args[0]
-        details = retry_state.kwargs["details"]
+        request, details = _retried_request(retry_state)
 
         http_clients_logger.error(
-            f"All retry attempts ({retry_state.attempt_number}/{self.attempts}) failed for HTTP request "
-            f"[{details['request_label']}]: {request.method} {request.url}"
+            "All retry attempts (%d/%d) failed for HTTP request [%s]: %s %s",
+            retry_state.attempt_number,
+            self.attempts,
+            details["request_label"],
+            request.method,
+            request.url,
         )
 
         self.raise_retry_error(retry_state)
@@ -143,22 +318,43 @@ class AsyncHttpRetryStrategy(AsyncRetryStrategy):
         *,
         attempts: int = 0,
         delay: int = 0,
+        exponential: bool = False,
+        max_delay: float | None = None,
+        jitter: float = 0,
+        full_jitter: bool = False,
         on_timeouts: bool = False,
         on_network_errors: bool = False,
         on_protocol_errors: bool = False,
         on_statuses: set[Literal["info", "redirect", "client_error", "server_error"]] | None = None,
     ) -> None:
-        super().__init__(attempts=attempts, delay=delay)
+        super().__init__(
+            attempts=attempts,
+            delay=delay,
+            exponential=exponential,
+            max_delay=max_delay,
+            jitter=jitter,
+            full_jitter=full_jitter,
+        )
 
         self.on_timeouts = on_timeouts
         self.on_network_errors = on_network_errors
         self.on_protocol_errors = on_protocol_errors
         self.on_statuses = on_statuses or set()
 
+    @property
+    def on_statuses(self) -> set[Literal["info", "redirect", "client_error", "server_error"]]:
+        return self._on_statuses
+
+    @on_statuses.setter
+    def on_statuses(self, on_statuses: set[Literal["info", "redirect", "client_error", "server_error"]]) -> None:
+        self._on_statuses = on_statuses
+        # Resolve the checks for the status groups once, since `retry_on_status` runs for every response.
+        self._status_checks = tuple(check for group, check in STATUS_GROUP_CHECKS if group in on_statuses)
+
     @retry_on_exception(exc_types=(httpx.ConnectError, httpx.ConnectTimeout))
     def retry_on_connection_error(self, error: Exception) -> bool:
         http_clients_logger.info(
-            f"Marking HTTP request for retry due to connection error: {type(error).__name__} - {error}"
+            "Marking HTTP request for retry due to connection error: %s - %s", type(error).__name__, error
         )
         return True
 
@@ -166,7 +362,7 @@ class AsyncHttpRetryStrategy(AsyncRetryStrategy):
     def retry_on_timeout_error(self, error: Exception) -> bool:
         if self.on_timeouts:
             http_clients_logger.info(
-                f"Marking HTTP request for retry due to timeout error: {type(error).__name__} - {error}"
+                "Marking HTTP request for retry due to timeout error: %s - %s", type(error).__name__, error
             )
             return True
 
@@ -176,7 +372,7 @@ class AsyncHttpRetryStrategy(AsyncRetryStrategy):
     def retry_on_network_error(self, error: Exception) -> bool:
         if self.on_network_errors:
             http_clients_logger.info(
-                f"Marking HTTP request for retry due to network error: {type(error).__name__} - {error}"
+                "Marking HTTP request for retry due to network error: %s - %s", type(error).__name__, error
             )
             return True
 
@@ -186,7 +382,7 @@ class AsyncHttpRetryStrategy(AsyncRetryStrategy):
     def retry_on_protocol_error(self, error: Exception) -> bool:
         if self.on_protocol_errors:
             http_clients_logger.info(
-                f"Marking HTTP request for retry due to protocol error: {type(error).__name__} - {error}"
+                "Marking HTTP request for retry due to protocol error: %s - %s", type(error).__name__, error
             )
             return True
 
@@ -194,46 +390,71 @@ class AsyncHttpRetryStrategy(AsyncRetryStrategy):
 
     @retry_on_result
     def retry_on_status(self, result: EnhancedResponse) -> bool:
-        if result.is_success or not self.on_statuses:
+        if result.is_success or not self._status_checks:
             return False
 
-        if (
-            ("info" in self.on_statuses and result.is_info)
-            or ("redirect" in self.on_statuses and result.is_redirect)
-            or ("client_error" in self.on_statuses and result.is_client_error)
-            or ("server_error" in self.on_statuses and result.is_server_error)
-        ):
-            http_clients_logger.info(f"Marking HTTP request for retry due to status code: {result.status_code}")
+        if any(check(result) for check in self._status_checks):
+            http_clients_logger.info("Marking HTTP request for retry due to status code: %s", result.status_code)
             return True
 
         return False
 
     def before(self, retry_state: RetryState) -> None:
-        request = retry_state.kwargs.get("request") or retry_state.args[0]
-        details = retry_state.kwargs["details"]
+        request, details = _retried_request(retry_state)
 
         http_clients_logger.info(
-            f"Retrying HTTP request [{details['request_label']}] ({retry_state.attempt_number}/{self.attempts}): "
-            f"{request.method} {request.url}"
+            "Retrying HTTP request [%s] (%d/%d): %s %s",
+            details["request_label"],
+            retry_state.attempt_number,
+            self.attempts,
+            request.method,
+            request.url,
         )
 
     def error_callback(self, retry_state: RetryState) -> None:
-        request = retry_state.kwargs.get("request") or retry_state.args[0]
-        details = retry_state.kwargs["details"]
+        request, details = _retried_request(retry_state)
 
         http_clients_logger.error(
-            f"All retry attempts ({retry_state.attempt_number}/{self.attempts}) failed for HTTP request "
-            f"[{details['request_label']}]: {request.method} {request.url}"
+            "All retry attempts (%d/%d) failed for HTTP request [%s]: %s %s",
+            retry_state.attempt_number,
+            self.attempts,
+            details["request_label"],
+            request.method,
+            request.url,
         )
 
         self.raise_retry_error(retry_state)
 
 
-@dataclass
+# Log fields as (config field, log key, getter) triples, in the order they are logged.
+REQUEST_LOG_FIELDS: tuple[tuple[str, str, Callable[[EnhancedRequest, DetailsType], Any]], ...] = (
+    ("request_name", "name", lambda _request, details: details["request_name"]),
+    ("request_tag", "tag", lambda _request, details: details["request_tag"]),
+    ("request_method", "method", lambda request, _details: request.method),
+    ("request_url", "url", lambda request, _details: request.url),
+    ("request_headers", "headers", lambda request, _details: request.headers),
+    ("request_body", "body", lambda request, _details: request.text),
+)
+RESPONSE_LOG_REQUEST_FIELDS: tuple[tuple[str, str, Callable[[EnhancedResponse, DetailsType], Any]], ...] = (
+    ("request_name", "name", lambda _response, details: details["request_name"]),
+    ("request_tag", "tag", lambda _response, details: details["request_tag"]),
+    ("request_method", "method", lambda response, _details: response.request.method),
+    ("request_url", "url", lambda response, _details: response.request.url),
+)
+RESPONSE_LOG_RESPONSE_FIELDS: tuple[tuple[str, str, Callable[[EnhancedResponse, DetailsType], Any]], ...] = (
+    ("response_status_code", "status_code", lambda response, _details: response.status_code),
+    ("response_headers", "headers", lambda response, _details: response.headers),
+    ("response_body", "body", lambda response, _details: response.text),
+    ("response_elapsed_time", "elapsed_time", lambda response, _details: response.elapsed.total_seconds()),
+)
+
+
+@dataclass(frozen=True)
 class HttpRequestLogConfig:
     """Configuration for logging HTTP request details.
 
     This dataclass defines which aspects of an HTTP request should be logged.
+    It is immutable, so that the enabled fields can be resolved once; replace the config to change them.
     """
 
     request_name: bool = True
@@ -243,12 +464,18 @@ class HttpRequestLogConfig:
     request_headers: bool = False
     request_body: bool = False
 
+    @cached_property
+    def request_fields(self) -> tuple[tuple[str, Callable[[EnhancedRequest, DetailsType], Any]], ...]:
+        """Log keys and getters of the enabled request fields, so that logging doesn't check every option."""
+        return tuple((key, getter) for field, key, getter in REQUEST_LOG_FIELDS if getattr(self, field))
 
-@dataclass
+
+@dataclass(frozen=True)
 class HttpResponseLogConfig:
     """Configuration for logging HTTP response details.
 
     This dataclass defines which aspects of an HTTP response should be logged.
+    It is immutable, so that the enabled fields can be resolved once; replace the config to change them.
     """
 
     request_name: bool = True
@@ -261,6 +488,16 @@ class HttpResponseLogConfig:
     response_body: bool = False
     response_elapsed_time: bool = True
 
+    @cached_property
+    def request_fields(self) -> tuple[tuple[str, Callable[[EnhancedResponse, DetailsType], Any]], ...]:
+        """Log keys and getters of the enabled request fields, so that logging doesn't check every option."""
+        return tuple((key, getter) for field, key, getter in RESPONSE_LOG_REQUEST_FIELDS if getattr(self, field))
+
+    @cached_property
+    def response_fields(self) -> tuple[tuple[str, Callable[[EnhancedResponse, DetailsType], Any]], ...]:
+        """Log keys and getters of the enabled response fields, so that logging doesn't check every option."""
+        return tuple((key, getter) for field, key, getter in RESPONSE_LOG_RESPONSE_FIELDS if getattr(self, field))
+
 
 class BrokerHttpMessageBuilder(BrokerMessageBuilder):
     """Abstract class for building broker messages from HTTP client requests and responses.
@@ -269,6 +506,21 @@ class BrokerHttpMessageBuilder(BrokerMessageBuilder):
     from HTTP client requests and responses.
     """
 
+    def build(self, request: EnhancedRequest, response: EnhancedResponse, details: DetailsType) -> BrokerMessage | None:
+        # Arguments are passed explicitly to avoid packing and unpacking `*args` and `**kwargs` on each call.
+        if not self.filter(request, response, details):
+            return None
+
+        return self.build_unfiltered(request, response, details)
+
+    def build_unfiltered(
+        self, request: EnhancedRequest, response: EnhancedResponse, details: DetailsType
+    ) -> BrokerMessage:
+        """Build a message without filtering it, for callers that have already checked `filter`."""
+        metadata = self.build_metadata(request, response, details)
+        body = self.build_body(request, response, details)
+        return BrokerMessage(metadata=metadata, body=body)
+
     def filter(self, request: EnhancedRequest, response: EnhancedResponse, details: DetailsType) -> bool:
         return True
 
@@ -290,57 +542,94 @@ class HttpClientBase:
     It serves as a foundation for both synchronous and asynchronous HTTP clients.
     """
 
-    def request_log(self, request: EnhancedRequest, details: DetailsType) -> tuple[str, dict[str, Any]]:
-        extra = {"request": {}}
-
-        if self.request_log_config.request_name:
-            extra["request"]["name"] = details["request_name"]
-        if self.request_log_config.request_tag:
-            extra["request"]["tag"] = details["request_tag"]
-        if self.request_log_config.request_method:
-            extra["request"]["method"] = request.method
-        if self.request_log_config.request_url:
-            extra["request"]["url"] = request.url
-        if self.request_log_config.request_headers:
-            extra["request"]["headers"] = request.headers
-        if self.request_log_config.request_body:
-            extra["request"]["body"] = request.text
-
-        if not extra["request"]:
-            del extra["request"]
-
-        return f"Sending HTTP request [{details['request_label']}]: {request.method} {request.url}", extra
-
-    def response_log(self, response: EnhancedResponse, details: DetailsType) -> tuple[str, dict[str, Any]]:
-        extra = {"request": {}, "response": {}}
-
-        if self.response_log_config.request_name:
-            extra["request"]["name"] = details["request_name"]
-        if self.response_log_config.request_tag:
-            extra["request"]["tag"] = details["request_tag"]
-        if self.response_log_config.request_method:
-            extra["request"]["method"] = response.request.method
-        if self.response_log_config.request_url:
-            extra["request"]["url"] = response.request.url
-
-        if self.response_log_config.response_status_code:
-            extra["response"]["status_code"] = response.status_code
-        if self.response_log_config.response_headers:
-            extra["response"]["headers"] = response.headers
-        if self.response_log_config.response_body:
-            extra["response"]["body"] = response.text
-        if self.response_log_config.response_elapsed_time:
-            extra["response"]["elapsed_time"] = response.elapsed.total_seconds()
-
-        if not extra["request"]:
-            del extra["request"]
-        if not extra["response"]:
-            del extra["response"]
-
-        return (
-            f"HTTP response received [{details['request_label']}]: "
-            f"{response.request.method} {response.request.url} -> {response.status_code}"
-        ), extra
+    def _resolve_details(self, name: str | None, tag: str | None, details: DetailsType | None) -> DetailsType:
+        details = details or {}
+
+        details.setdefault("request_name", name)
+        details.setdefault("request_tag", tag)
+        # Not `setdefault`, so that the label is only resolved when it's missing.
+        if "request_label" not in details:
+            details["request_label"] = _request_label(name, tag)
+
+        return details
+
+    def _build_request(
+        self,
+        method: MethodType,
+        url: UrlType,
+        *,
+        params: ParamsType | None,
+        headers: HeadersType | None,
+        content: ContentBodyType | None,
+        json: JsonBodyType | None,
+        timeout: TimeoutType | None | Unset,
+    ) -> EnhancedRequest:
+        # Encode JSON bodies with orjson, which is much faster than the standard `json` module used by HTTPX.
+        orjson_encoded = False
+        if content is None and json is not None:
+            try:
+                # Like the standard `json` module, accept (and stringify) non-string dictionary keys.
+                content = orjson.dumps(json, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # Leave bodies orjson can't encode (e.g. integers over 64 bits) to HTTPX.
+                # `orjson.JSONEncodeError` is a subclass of `TypeError`.
+                pass
+            else:
+                orjson_encoded = True
+                json = None
+
+        # Building requests doesn't do I/O, so synchronous and asynchronous HTTPX clients do it the same way.
+        request = self._client.build_request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            content=content,
+            json=json,
+            timeout=timeout if timeout is not UNSET else self.timeout,
+        )
+        if orjson_encoded:
+            # Like HTTPX, don't override a content type set in request or client headers.
+            request.headers.setdefault("Content-Type", "application/json")
+
+        return EnhancedRequest(request)
+
+    def request_log(
+        self, request: EnhancedRequest, details: DetailsType, *, target: str | None = None
+    ) -> tuple[str, dict[str, Any]]:
+        extra = {}
+
+        request_extra = {key: getter(request, details) for key, getter in self.request_log_config.request_fields}
+        if request_extra:
+            extra["request"] = request_extra
+
+        target = target or f"{request.method} {request.url}"
+
+        return f"{self._request_log_header(details)}: {target}", extra
+
+    def response_log(
+        self, response: EnhancedResponse, details: DetailsType, *, target: str | None = None
+    ) -> tuple[str, dict[str, Any]]:
+        extra = {}
+        log_config = self.response_log_config
+
+        request_extra = {key: getter(response, details) for key, getter in log_config.request_fields}
+        if request_extra:
+            extra["request"] = request_extra
+        response_extra = {key: getter(response, details) for key, getter in log_config.response_fields}
+        if response_extra:
+            extra["response"] = response_extra
+
+        target = target or f"{response.request.method} {response.request.url}"
+
+        return f"{self._response_log_header(details)}: {target} -> {response.status_code}", extra
+
+    # Subclasses extend the log message headers through these hooks instead of reformatting whole messages.
+    def _request_log_header(self, details: DetailsType) -> str:
+        return f"Sending HTTP request [{details['request_label']}]"
+
+    def _response_log_header(self, details: DetailsType) -> str:
+        return f"HTTP response received [{details['request_label']}]"
 
 
 class HttpClient(HttpClientBase):
@@ -349,6 +638,9 @@ class HttpClient(HttpClientBase):
     This client provides an intuitive and extended interface for executing synchronous HTTP requests while maintaining
     the core capabilities of the HTTPX `Client`. It is not a complete wrapper around HTTPX that would allow for
     replacing HTTPX with another library. Instead, it simply extends the HTTPX `Client` with the features we need.
+
+    The HTTP method shortcuts (`get`, `post`, etc.) intentionally delegate to `request` instead of calling HTTPX
+    directly, so that logging, retries, broker messages and subclass extensions of `request` apply to all of them.
     """
 
     base_url: UrlType = ""
@@ -359,6 +651,11 @@ class HttpClient(HttpClientBase):
     proxy: ProxyType | None = None
     cert: CertType | None = None
     timeout: TimeoutType | None = 5.0
+    limits: httpx.Limits = DEFAULT_LIMITS
+    http2: bool = True
+    # Caches responses according to their Cache-Control headers (requires hishel).
+    # Pass `True` to cache in memory, or a hishel storage to choose where responses are kept.
+    cache: bool | hishel.BaseStorage = False
 
     retry_strategy: RetryStrategy | None = None
     request_log_config: HttpRequestLogConfig = HttpRequestLogConfig()
@@ -367,6 +664,16 @@ class HttpClient(HttpClientBase):
     broker_message_builder: BrokerHttpMessageBuilder | None = None
 
     _global_client: httpx.Client | None = None
+    # The settings key the global client was opened with, to keep it warm under that key once closed.
+    _global_client_key: tuple[Any, ...] | None = None
+    # Whether `close_global` is registered to run at exit, which is needed only once per class. It's only read from
+    # the class's own namespace, since subclasses inherit the flag but have global clients of their own.
+    _close_global_registered: bool = False
+    # The client used to send requests. `open_global` sets it on the class and `open` on the instance,
+    # so an open local client shadows the global one without resolving them on every request.
+    _client: httpx.Client | None = None
+    # Opening clients is rare, so all synchronous HTTP clients share one lock.
+    _open_lock = threading.Lock()
 
     def __init__(
         self,
@@ -379,6 +686,9 @@ class HttpClient(HttpClientBase):
         proxy: ProxyType | None | Unset = UNSET,
         cert: CertType | None | Unset = UNSET,
         timeout: TimeoutType | None | Unset = UNSET,
+        limits: httpx.Limits | Unset = UNSET,
+        http2: bool | Unset = UNSET,
+        cache: bool | hishel.BaseStorage | Unset = UNSET,
         retry_strategy: RetryStrategy | None | Unset = UNSET,
         request_log_config: HttpRequestLogConfig | None | Unset = UNSET,
         response_log_config: HttpResponseLogConfig | Unset = UNSET,
@@ -387,20 +697,25 @@ class HttpClient(HttpClientBase):
     ) -> None:
         """Configure local settings for the HTTP client."""
         # Instance-level attributes do not delete class-level attributes; they simply shadow them.
-        setattr_if_not_unset(self, "base_url", base_url)
-        setattr_if_not_unset(self, "base_params", base_params)
-        setattr_if_not_unset(self, "base_headers", base_headers)
-        setattr_if_not_unset(self, "cookies", cookies)
-        setattr_if_not_unset(self, "auth", auth)
-        setattr_if_not_unset(self, "proxy", proxy)
-        setattr_if_not_unset(self, "cert", cert)
-        setattr_if_not_unset(self, "timeout", timeout)
-
-        setattr_if_not_unset(self, "retry_strategy", retry_strategy)
-        setattr_if_not_unset(self, "request_log_config", request_log_config)
-        setattr_if_not_unset(self, "response_log_config", response_log_config)
-        setattr_if_not_unset(self, "broker_client", broker_client)
-        setattr_if_not_unset(self, "broker_message_builder", broker_message_builder)
+        setattrs_if_not_unset(
+            self,
+            base_url=base_url,
+            base_params=base_params,
+            base_headers=base_headers,
+            cookies=cookies,
+            auth=auth,
+            proxy=proxy,
+            cert=cert,
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            cache=cache,
+            retry_strategy=retry_strategy,
+            request_log_config=request_log_config,
+            response_log_config=response_log_config,
+            broker_client=broker_client,
+            broker_message_builder=broker_message_builder,
+        )
 
         self._local_client: httpx.Client | None = None
 
@@ -416,6 +731,9 @@ class HttpClient(HttpClientBase):
         proxy: ProxyType | None | Unset = UNSET,
         cert: CertType | None | Unset = UNSET,
         timeout: TimeoutType | None | Unset = UNSET,
+        limits: httpx.Limits | Unset = UNSET,
+        http2: bool | Unset = UNSET,
+        cache: bool | hishel.BaseStorage | Unset = UNSET,
         retry_strategy: RetryStrategy | None | Unset = UNSET,
         request_log_config: HttpRequestLogConfig | None | Unset = UNSET,
         response_log_config: HttpResponseLogConfig | Unset = UNSET,
@@ -423,67 +741,75 @@ class HttpClient(HttpClientBase):
         broker_message_builder: BrokerHttpMessageBuilder | None | Unset = UNSET,
     ) -> None:
         """Configure global settings for the HTTP client."""
-        setattr_if_not_unset(cls, "base_url", base_url)
-        setattr_if_not_unset(cls, "base_params", base_params)
-        setattr_if_not_unset(cls, "base_headers", base_headers)
-        setattr_if_not_unset(cls, "cookies", cookies)
-        setattr_if_not_unset(cls, "auth", auth)
-        setattr_if_not_unset(cls, "proxy", proxy)
-        setattr_if_not_unset(cls, "cert", cert)
-        setattr_if_not_unset(cls, "timeout", timeout)
-
-        setattr_if_not_unset(cls, "retry_strategy", retry_strategy)
-        setattr_if_not_unset(cls, "request_log_config", request_log_config)
-        setattr_if_not_unset(cls, "response_log_config", response_log_config)
-        setattr_if_not_unset(cls, "broker_client", broker_client)
-        setattr_if_not_unset(cls, "broker_message_builder", broker_message_builder)
+        setattrs_if_not_unset(
+            cls,
+            base_url=base_url,
+            base_params=base_params,
+            base_headers=base_headers,
+            cookies=cookies,
+            auth=auth,
+            proxy=proxy,
+            cert=cert,
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            cache=cache,
+            retry_strategy=retry_strategy,
+            request_log_config=request_log_config,
+            response_log_config=response_log_config,
+            broker_client=broker_client,
+            broker_message_builder=broker_message_builder,
+        )
 
     @classmethod
     def open_global(cls) -> None:
+        # Double-checked locking keeps concurrent threads from opening (and leaking) more than one client,
+        # without taking the lock once the client is open.
         if not cls._global_client:
-            cls._global_client = httpx.Client(
-                base_url=cls.base_url,
-                params=cls.base_params,
-                headers=cls.base_headers,
-                cookies=cls.cookies,
-                auth=cls.auth,
-                proxy=cls.proxy,
-                cert=cls.cert,
-                timeout=cls.timeout,
-            )
+            with cls._open_lock:
+                if not cls._global_client:
+                    cls._global_client_key = _settings_key(cls)
+                    client = _warm_clients.pop(cls._global_client_key, None)
+                    if client is None:
+                        client = httpx.Client(**_httpx_sync_client_kwargs(cls))
+                    if not cls.__dict__.get("_close_global_registered", False):
+                        # Release pooled connections even if `close_global` is never called.
+                        atexit.register(cls.close_global)
+                        cls._close_global_registered = True
+                    cls._global_client = cls._client = client
 
     @classmethod
-    def close_global(cls) -> None:
-        if cls._global_client:
+    def close_global(cls, *, keep_warm: bool = False) -> None:
+        """Close the global client.
+
+        With `keep_warm`, the client is detached from the class but kept open, so that the next `open_global`
+        with the same settings (on any synchronous client class) reuses its connection pool. Idle connections
+        still expire as configured by `limits`.
+        """
+        if not cls._global_client:
+            return
+
+        if keep_warm:
+            with cls._open_lock:
+                _warm_clients[cls._global_client_key] = cls._global_client
+                cls._global_client = cls._client = None
+        else:
             cls._global_client.close()
 
     def open(self) -> None:
         if not self._local_client:
-            self._local_client = httpx.Client(
-                base_url=self.base_url,
-                params=self.base_params,
-                headers=self.base_headers,
-                cookies=self.cookies,
-                auth=self.auth,
-                proxy=self.proxy,
-                cert=self.cert,
-                timeout=self.timeout,
-            )
+            with self._open_lock:
+                if not self._local_client:
+                    self._local_client = self._client = httpx.Client(**_httpx_sync_client_kwargs(self))
+                    # Release pooled connections once the client is garbage collected, even if it was never closed.
+                    weakref.finalize(self, self._local_client.close)
 
     def close(self) -> None:
         if self._local_client:
             self._local_client.close()
 
-    @property
-    def _client(self) -> httpx.Client:
-        if not self._local_client and not self._global_client:
-            # Automatically open the local client if neither local nor global clients are open.
-            self.open()
-        return self._local_client or self._global_client
-
     def __enter__(self) -> Self:
         self.open()
-        self._local_client.__enter__()
         return self
 
     def __exit__(
@@ -492,20 +818,26 @@ class HttpClient(HttpClientBase):
         exc_value: BaseException | None = None,
         traceback: TracebackType | None = None,
     ) -> None:
-        self._local_client.__exit__(exc_type, exc_value, traceback)
         self.close()
 
     def _send_request(
         self, request: EnhancedRequest, *, auth: httpx.Auth | None = None, details: DetailsType
     ) -> EnhancedResponse:
-        request_log_message, request_log_extra = self.request_log(request, details)
-        http_clients_logger.info(request_log_message, extra=request_log_extra)
+        # Building log records reads (and may decode) headers and bodies, so skip it when INFO records are dropped.
+        log_enabled = http_clients_logger.isEnabledFor(logging.INFO)
+
+        if log_enabled:
+            # The target is formatted once and shared by the request and response logs.
+            log_target = f"{request.method} {request.url}"
+            request_log_message, request_log_extra = self.request_log(request, details, target=log_target)
+            http_clients_logger.info(request_log_message, extra=request_log_extra)
 
         response = self._client.send(request.origin, auth=auth)
         enhanced_response = EnhancedResponse(response)
 
-        response_log_message, response_log_extra = self.response_log(enhanced_response, details)
-        http_clients_logger.info(response_log_message, extra=response_log_extra)
+        if log_enabled:
+            response_log_message, response_log_extra = self.response_log(enhanced_response, details, target=log_target)
+            http_clients_logger.info(response_log_message, extra=response_log_extra)
 
         return enhanced_response
 
@@ -525,44 +857,29 @@ class HttpClient(HttpClientBase):
         retry_strategy: RetryStrategy | None | Unset = UNSET,
         details: DetailsType | None = None,
     ) -> EnhancedResponse:
-        details = details or {}
+        details = self._resolve_details(name, tag, details)
 
-        if "request_name" not in details:
-            details["request_name"] = name
-        if "request_tag" not in details:
-            details["request_tag"] = tag
-        if "request_label" not in details:
-            prefix = name or "UNNAMED"
-            details["request_label"] = f"{prefix}-{tag}" if tag else prefix
+        if self._client is None:
+            # Automatically open the local client if neither local nor global clients are open.
+            self.open()
 
-        request = self._client.build_request(
-            method,
-            url,
-            params=params,
-            headers=headers,
-            content=content,
-            json=json,
-            timeout=timeout if timeout is not UNSET else self.timeout,
+        enhanced_request = self._build_request(
+            method, url, params=params, headers=headers, content=content, json=json, timeout=timeout
         )
-        enhanced_request = EnhancedRequest(request)
-
-        send_request_kwargs = {
-            "request": enhanced_request,
-            "auth": auth if auth is not UNSET else self.auth,
-            "details": details,
-        }
 
+        auth = auth if auth is not UNSET else self.auth
         retry_strategy = retry_strategy if retry_strategy is not UNSET else self.retry_strategy
-        response = (
-            retry_strategy.retry(self._send_request, **send_request_kwargs)
-            if retry_strategy
-            else self._send_request(**send_request_kwargs)
-        )
+
+        if retry_strategy:
+            # The request is passed by keyword, which is where retry callbacks look for it.
+            response = retry_strategy.retry(self._send_request, request=enhanced_request, auth=auth, details=details)
+        else:
+            response = self._send_request(enhanced_request, auth=auth, details=details)
 
         if self.broker_client and self.broker_message_builder:
             message = self.broker_message_builder.build(enhanced_request, response, details)
             if message:
-                http_clients_logger.info(f"Sending HTTP request [{details['request_label']}] message to broker")
+                http_clients_logger.info("Sending HTTP request [%s] message to broker", details["request_label"])
                 self.broker_client.send_message(message=message)
 
         return response
@@ -710,12 +1027,21 @@ class HttpClient(HttpClientBase):
         )
 
 
+# A ready-to-use client for callers that need no settings of their own, so that they share one connection pool
+# instead of opening an HTTPX client per call. If the global client is open by its first request, it uses that one.
+# Otherwise it opens its own client on the first request and keeps it for the lifetime of the process.
+default_client = HttpClient()
+
+
 class AsyncHttpClient(HttpClientBase):
     """A wrapper around the HTTPX `AsyncClient`, designed to streamline and extend its functionality to meet our needs.
 
     This client provides an intuitive and extended interface for executing asynchronous HTTP requests while maintaining
     the core capabilities of the HTTPX `AsyncClient`. It is not a complete wrapper around HTTPX that would allow for
     replacing HTTPX with another library. Instead, it simply extends the HTTPX `AsyncClient` with the features we need.
+
+    The HTTP method shortcuts (`get`, `post`, etc.) intentionally delegate to `request` instead of calling HTTPX
+    directly, so that logging, retries, broker messages and subclass extensions of `request` apply to all of them.
     """
 
     base_url: UrlType = ""
@@ -726,6 +1052,13 @@ class AsyncHttpClient(HttpClientBase):
     proxy: ProxyType | None = None
     cert: CertType | None = None
     timeout: TimeoutType | None = 5.0
+    limits: httpx.Limits = DEFAULT_LIMITS
+    http2: bool = True
+    # Sends requests through aiohttp, which copes better with very high concurrency (requires httpx-aiohttp).
+    aiohttp_transport: bool = False
+    # Caches responses according to their Cache-Control headers (requires hishel).
+    # Pass `True` to cache in memory, or a hishel storage to choose where responses are kept.
+    cache: bool | hishel.AsyncBaseStorage = False
 
     retry_strategy: AsyncRetryStrategy | None = None
     request_log_config: HttpRequestLogConfig = HttpRequestLogConfig()
@@ -734,6 +1067,9 @@ class AsyncHttpClient(HttpClientBase):
     broker_message_builder: BrokerHttpMessageBuilder | None = None
 
     _global_client: httpx.AsyncClient | None = None
+    # The client used to send requests. `open_global` sets it on the class and `open` on the instance,
+    # so an open local client shadows the global one without resolving them on every request.
+    _client: httpx.AsyncClient | None = None
 
     def __init__(
         self,
@@ -746,6 +1082,10 @@ class AsyncHttpClient(HttpClientBase):
         proxy: ProxyType | None | Unset = UNSET,
         cert: CertType | None | Unset = UNSET,
         timeout: TimeoutType | None | Unset = UNSET,
+        limits: httpx.Limits | Unset = UNSET,
+        http2: bool | Unset = UNSET,
+        aiohttp_transport: bool | Unset = UNSET,
+        cache: bool | hishel.AsyncBaseStorage | Unset = UNSET,
         retry_strategy: AsyncRetryStrategy | None | Unset = UNSET,
         request_log_config: HttpRequestLogConfig | None | Unset = UNSET,
         response_log_config: HttpResponseLogConfig | Unset = UNSET,
@@ -754,22 +1094,31 @@ class AsyncHttpClient(HttpClientBase):
     ) -> None:
         """Configure local settings for the HTTP client."""
         # Instance-level attributes do not delete class-level attributes; they simply shadow them.
-        setattr_if_not_unset(self, "base_url", base_url)
-        setattr_if_not_unset(self, "base_params", base_params)
-        setattr_if_not_unset(self, "base_headers", base_headers)
-        setattr_if_not_unset(self, "cookies", cookies)
-        setattr_if_not_unset(self, "auth", auth)
-        setattr_if_not_unset(self, "proxy", proxy)
-        setattr_if_not_unset(self, "cert", cert)
-        setattr_if_not_unset(self, "timeout", timeout)
-
-        setattr_if_not_unset(self, "retry_strategy", retry_strategy)
-        setattr_if_not_unset(self, "request_log_config", request_log_config)
-        setattr_if_not_unset(self, "response_log_config", response_log_config)
-        setattr_if_not_unset(self, "broker_client", broker_client)
-        setattr_if_not_unset(self, "broker_message_builder", broker_message_builder)
+        setattrs_if_not_unset(
+            self,
+            base_url=base_url,
+            base_params=base_params,
+            base_headers=base_headers,
+            cookies=cookies,
+            auth=auth,
+            proxy=proxy,
+            cert=cert,
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            aiohttp_transport=aiohttp_transport,
+            cache=cache,
+            retry_strategy=retry_strategy,
+            request_log_config=request_log_config,
+            response_log_config=response_log_config,
+            broker_client=broker_client,
+            broker_message_builder=broker_message_builder,
+        )
 
         self._local_client: httpx.AsyncClient | None = None
+        # Broker messages being sent in the background. The event loop only keeps weak references to tasks,
+        # so they are kept here until they are done.
+        self._broker_tasks: set[asyncio.Task[None]] = set()
 
     @classmethod
     def configure(
@@ -783,6 +1132,10 @@ class AsyncHttpClient(HttpClientBase):
         proxy: ProxyType | None | Unset = UNSET,
         cert: CertType | None | Unset = UNSET,
         timeout: TimeoutType | None | Unset = UNSET,
+        limits: httpx.Limits | Unset = UNSET,
+        http2: bool | Unset = UNSET,
+        aiohttp_transport: bool | Unset = UNSET,
+        cache: bool | hishel.AsyncBaseStorage | Unset = UNSET,
         retry_strategy: AsyncRetryStrategy | None | Unset = UNSET,
         request_log_config: HttpRequestLogConfig | None | Unset = UNSET,
         response_log_config: HttpResponseLogConfig | Unset = UNSET,
@@ -790,67 +1143,57 @@ class AsyncHttpClient(HttpClientBase):
         broker_message_builder: BrokerHttpMessageBuilder | None | Unset = UNSET,
     ) -> None:
         """Configure global settings for the HTTP client."""
-        setattr_if_not_unset(cls, "base_url", base_url)
-        setattr_if_not_unset(cls, "base_params", base_params)
-        setattr_if_not_unset(cls, "base_headers", base_headers)
-        setattr_if_not_unset(cls, "cookies", cookies)
-        setattr_if_not_unset(cls, "auth", auth)
-        setattr_if_not_unset(cls, "proxy", proxy)
-        setattr_if_not_unset(cls, "cert", cert)
-        setattr_if_not_unset(cls, "timeout", timeout)
-
-        setattr_if_not_unset(cls, "retry_strategy", retry_strategy)
-        setattr_if_not_unset(cls, "request_log_config", request_log_config)
-        setattr_if_not_unset(cls, "response_log_config", response_log_config)
-        setattr_if_not_unset(cls, "broker_client", broker_client)
-        setattr_if_not_unset(cls, "broker_message_builder", broker_message_builder)
+        setattrs_if_not_unset(
+            cls,
+            base_url=base_url,
+            base_params=base_params,
+            base_headers=base_headers,
+            cookies=cookies,
+            auth=auth,
+            proxy=proxy,
+            cert=cert,
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            aiohttp_transport=aiohttp_transport,
+            cache=cache,
+            retry_strategy=retry_strategy,
+            request_log_config=request_log_config,
+            response_log_config=response_log_config,
+            broker_client=broker_client,
+            broker_message_builder=broker_message_builder,
+        )
 
     @classmethod
     def open_global(cls) -> None:
         if not cls._global_client:
-            cls._global_client = httpx.AsyncClient(
-                base_url=cls.base_url,
-                params=cls.base_params,
-                headers=cls.base_headers,
-                cookies=cls.cookies,
-                auth=cls.auth,
-                proxy=cls.proxy,
-                cert=cls.cert,
-                timeout=cls.timeout,
-            )
+            cls._global_client = cls._client = httpx.AsyncClient(**_httpx_async_client_kwargs(cls))
 
     @classmethod
     async def close_global(cls) -> None:
         if cls._global_client:
             await cls._global_client.aclose()
 
+    async def flush(self) -> None:
+        """Wait for broker messages that are still being sent in the background.
+
+        Closing the client waits for them as well, but a client that only uses the global client is never closed,
+        so it should be flushed before the broker client is disconnected.
+        """
+        if self._broker_tasks:
+            await asyncio.gather(*self._broker_tasks, return_exceptions=True)
+
     def open(self) -> None:
         if not self._local_client:
-            self._local_client = httpx.AsyncClient(
-                base_url=self.base_url,
-                params=self.base_params,
-                headers=self.base_headers,
-                cookies=self.cookies,
-                auth=self.auth,
-                proxy=self.proxy,
-                cert=self.cert,
-                timeout=self.timeout,
-            )
+            self._local_client = self._client = httpx.AsyncClient(**_httpx_async_client_kwargs(self))
 
     async def close(self) -> None:
+        await self.flush()
         if self._local_client:
             await self._local_client.aclose()
 
-    @property
-    def _client(self) -> httpx.AsyncClient:
-        if not self._local_client and not self._global_client:
-            # Automatically open the local client if neither local nor global clients are open.
-            self.open()
-        return self._local_client or self._global_client
-
     async def __aenter__(self) -> Self:
         self.open()
-        await self._local_client.__aenter__()
         return self
 
     async def __aexit__(
@@ -859,20 +1202,26 @@ class AsyncHttpClient(HttpClientBase):
         exc_value: BaseException | None = None,
         traceback: TracebackType | None = None,
     ) -> None:
-        await self._local_client.__aexit__(exc_type, exc_value, traceback)
         await self.close()
 
     async def _send_request(
         self, request: EnhancedRequest, *, auth: httpx.Auth | None = None, details: DetailsType
     ) -> EnhancedResponse:
-        request_log_message, request_log_extra = self.request_log(request, details)
-        http_clients_logger.info(request_log_message, extra=request_log_extra)
+        # Building log records reads (and may decode) headers and bodies, so skip it when INFO records are dropped.
+        log_enabled = http_clients_logger.isEnabledFor(logging.INFO)
+
+        if log_enabled:
+            # The target is formatted once and shared by the request and response logs.
+            log_target = f"{request.method} {request.url}"
+            request_log_message, request_log_extra = self.request_log(request, details, target=log_target)
+            http_clients_logger.info(request_log_message, extra=request_log_extra)
 
         response = await self._client.send(request.origin, auth=auth)
         enhanced_response = EnhancedResponse(response)
 
-        response_log_message, response_log_extra = self.response_log(enhanced_response, details)
-        http_clients_logger.info(response_log_message, extra=response_log_extra)
+        if log_enabled:
+            response_log_message, response_log_extra = self.response_log(enhanced_response, details, target=log_target)
+            http_clients_logger.info(response_log_message, extra=response_log_extra)
 
         return enhanced_response
 
@@ -892,48 +1241,65 @@ class AsyncHttpClient(HttpClientBase):
         retry_strategy: AsyncRetryStrategy | None | Unset = UNSET,
         details: DetailsType | None = None,
     ) -> EnhancedResponse:
-        details = details or {}
+        details = self._resolve_details(name, tag, details)
 
-        if "request_name" not in details:
-            details["request_name"] = name
-        if "request_tag" not in details:
-            details["request_tag"] = tag
-        if "request_label" not in details:
-            prefix = name or "UNNAMED"
-            details["request_label"] = f"{prefix}-{tag}" if tag else prefix
+        if self._client is None:
+            # Automatically open the local client if neither local nor global clients are open.
+            self.open()
 
-        request = self._client.build_request(
-            method,
-            url,
-            params=params,
-            headers=headers,
-            content=content,
-            json=json,
-            timeout=timeout if timeout is not UNSET else self.timeout,
+        enhanced_request = self._build_request(
+            method, url, params=params, headers=headers, content=content, json=json, timeout=timeout
         )
-        enhanced_request = EnhancedRequest(request)
-
-        send_request_kwargs = {
-            "request": enhanced_request,
-            "auth": auth if auth is not UNSET else self.auth,
-            "details": details,
-        }
 
+        auth = auth if auth is not UNSET else self.auth
         retry_strategy = retry_strategy if retry_strategy is not UNSET else self.retry_strategy
-        response = await (
-            retry_strategy.retry(self._send_request, **send_request_kwargs)
-            if retry_strategy
-            else self._send_request(**send_request_kwargs)
-        )
 
-        if self.broker_client and self.broker_message_builder:
-            message = self.broker_message_builder.build(enhanced_request, response, details)
-            if message:
-                http_clients_logger.info(f"Sending HTTP request [{details['request_label']}] message to broker")
-                await self.broker_client.send_message(message=message)
+        if retry_strategy:
+            # The request is passed by keyword, which is where retry callbacks look for it.
+            response = await retry_strategy.retry(
+                self._send_request, request=enhanced_request, auth=auth, details=details
+            )
+        else:
+            response = await self._send_request(enhanced_request, auth=auth, details=details)
+
+        # Requests that are filtered out (usually most of them) don't need a task, so the filter is checked here first.
+        if (
+            self.broker_client
+            and self.broker_message_builder
+            and self.broker_message_builder.filter(enhanced_request, response, details)
+        ):
+            # Don't hold the response back until the message is built and the broker has received it.
+            task = asyncio.create_task(self._send_broker_message(enhanced_request, response, details))
+            self._broker_tasks.add(task)
+            task.add_done_callback(self._broker_task_done)
 
         return response
 
+    def _broker_task_done(self, task: asyncio.Task[None]) -> None:
+        self._broker_tasks.discard(task)
+        if not task.cancelled() and (error := task.exception()):
+            http_clients_logger.error("Failed to send HTTP request message to broker", exc_info=error)
+
+    async def _send_broker_message(
+        self, request: EnhancedRequest, response: EnhancedResponse, details: DetailsType
+    ) -> None:
+        # Building a message may mask and compress whole bodies, which would block the event loop, so it runs
+        # in a thread of the default executor.
+        message = await asyncio.to_thread(self._build_broker_message, request, response, details)
+        if message:
+            http_clients_logger.info("Sending HTTP request [%s] message to broker", details["request_label"])
+            await self.broker_client.send_message(message=message)
+
+    def _build_broker_message(
+        self, request: EnhancedRequest, response: EnhancedResponse, details: DetailsType
+    ) -> BrokerMessage | None:
+        builder = self.broker_message_builder
+        # The message has already passed the filter in `request`, so it isn't filtered again, unless the builder
+        # overrides `build`, which is then used just like by the synchronous client.
+        if builder.__class__.build is not BrokerHttpMessageBuilder.build:
+            return builder.build(request, response, details)
+        return builder.build_unfiltered(request, response, details)
+
     async def get(
         self,
         url: UrlType,
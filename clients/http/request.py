@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+import email.message
+
 import httpx
 
 Request = httpx.Request
@@ -10,8 +14,12 @@ class EnhancedRequest:
     and methods, with additional functionality for improved usability in handling HTTP requests.
     """
 
+    # A wrapper is allocated for every request, so it skips the per-instance dictionary.
+    __slots__ = ("_request", "_url")
+
     def __init__(self, request: Request) -> None:
         self._request = request
+        self._url: str | None = None
 
     @property
     def origin(self) -> Request:
@@ -19,11 +27,15 @@ class EnhancedRequest:
 
     @property
     def method(self) -> str:
-        return str(self._request.method)
+        # HTTPX already stores the method as an upper-case string.
+        return self._request.method
 
     @property
     def url(self) -> str:
-        return str(self._request.url)
+        # Logs read the URL on every attempt, so it is converted to a string only once.
+        if self._url is None:
+            self._url = str(self._request.url)
+        return self._url
 
     @property
     def headers(self) -> dict[str, str]:
@@ -36,3 +48,14 @@ class EnhancedRequest:
     @property
     def text(self) -> str:
         return self._request.content.decode()
+
+    @property
+    def charset(self) -> str | None:
+        """The charset declared in the Content-Type header, if any."""
+        content_type = self._request.headers.get("Content-Type")
+        if content_type is None:
+            return None
+        # Parsed the same way HTTPX parses the charset of responses.
+        message = email.message.Message()
+        message["Content-Type"] = content_type
+        return message.get_content_charset()
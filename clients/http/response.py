@@ -1,11 +1,21 @@
-import datetime as dt
-from typing import Any
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any
 
 import httpx
+import orjson
 import xmltodict
 
+if TYPE_CHECKING:
+    import datetime as dt
+    from collections.abc import Iterator
+
 Response = httpx.Response
 
+# orjson parses integers beyond 64 bits as (imprecise) floats, so bodies with digit runs that long are left to HTTPX.
+_LONG_INTEGER_PATTERN = re.compile(rb"\d{19}")
+
 
 class EnhancedResponse:
     """Enhanced HTTPX `Response` Wrapper.
@@ -14,8 +24,13 @@ class EnhancedResponse:
     and methods, with additional functionality for improved usability in handling HTTP responses.
     """
 
+    # A wrapper is allocated for every response, so it skips the per-instance dictionary.
+    __slots__ = ("_cookies", "_headers", "_response")
+
     def __init__(self, response: Response) -> None:
         self._response = response
+        self._headers: dict[str, str] | None = None
+        self._cookies: dict[str, str] | None = None
 
     @property
     def origin(self) -> Response:
@@ -27,11 +42,21 @@ class EnhancedResponse:
 
     @property
     def headers(self) -> dict[str, str]:
-        return dict(self._response.headers)
+        # A received response doesn't change, so its headers and cookies are converted to dictionaries only once.
+        # Callers get copies, which are cheaper than converting again and keep the cached ones unchanged.
+        if self._headers is None:
+            self._headers = dict(self._response.headers)
+        return self._headers.copy()
+
+    def get_header(self, name: str, default: str | None = None) -> str | None:
+        """Get a single header (case-insensitively) without converting all headers to a dictionary."""
+        return self._response.headers.get(name, default)
 
     @property
     def cookies(self) -> dict[str, str]:
-        return dict(self._response.cookies)
+        if self._cookies is None:
+            self._cookies = dict(self._response.cookies)
+        return self._cookies.copy()
 
     @property
     def request(self) -> httpx.Request:
@@ -71,13 +96,29 @@ class EnhancedResponse:
 
     @property
     def text(self) -> str:
+        # HTTPX decodes the body only once and caches the text itself.
         return self._response.text
 
+    def iter_text(self, chunk_size: int = 65536) -> Iterator[str]:
+        """Decode the body in chunks, so that large bodies are not held in memory as one more (decoded) copy."""
+        return self._response.iter_text(chunk_size)
+
     def json(self, **kwargs: Any) -> Any:
-        return self._response.json(**kwargs)
+        content = self._response.content
+        if kwargs or _LONG_INTEGER_PATTERN.search(content):
+            # orjson doesn't support the `json.loads` options, so HTTPX parses the body when any are given.
+            return self._response.json(**kwargs)
+        # Parse JSON bodies with orjson, which is much faster than the standard `json` module used by HTTPX.
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson only reads UTF-8 and rejects `NaN` and `Infinity`, which the standard `json` module accepts,
+            # so HTTPX parses (or rejects) such bodies the way it always has.
+            return self._response.json()
 
     def xml(self, **kwargs: Any) -> dict[str, Any]:
-        return dict(xmltodict.parse(self.content, **kwargs))
+        # xmltodict already returns a plain dictionary, so it isn't copied into another one.
+        return xmltodict.parse(self.content, **kwargs)
 
     def raise_for_status(self) -> None:
         self._response.raise_for_status()
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
-import datetime as dt
-import json
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from ddtrace import tracer
 
 from clients.broker import SQSMessageBuilder
-from utils.text import compress_and_encode, mask_card_number, mask_series_code
-from utils.unset import UNSET, Unset, setattr_if_not_unset
+from utils.text import compress_and_encode, mask_sensitive_data
+from utils.unset import UNSET, Unset, setattrs_if_not_unset
 
 from .base import (
+    DEFAULT_LIMITS,
     AsyncHttpClient,
     BrokerHttpMessageBuilder,
     HttpClient,
@@ -21,6 +22,7 @@ from .base import (
 )
 
 if TYPE_CHECKING:
+    import hishel
     import httpx
 
     from clients.broker import AsyncBrokerClient, BrokerClient
@@ -43,7 +45,7 @@ if TYPE_CHECKING:
     )
 
 
-@dataclass
+@dataclass(frozen=True)
 class SupplierRequestLogConfig(HttpRequestLogConfig):
     """Configuration for logging supplier-specific HTTP request details.
 
@@ -54,7 +56,7 @@ class SupplierRequestLogConfig(HttpRequestLogConfig):
     supplier_code: bool = True
 
 
-@dataclass
+@dataclass(frozen=True)
 class SupplierResponseLogConfig(HttpResponseLogConfig):
     """Configuration for logging supplier-specific HTTP response details.
 
@@ -65,6 +67,21 @@ class SupplierResponseLogConfig(HttpResponseLogConfig):
     supplier_code: bool = True
 
 
+# Request details that are added to supplier messages as (detail, attribute) pairs, when they are set.
+OPTIONAL_MESSAGE_ATTRIBUTES = (
+    ("tenant_id", "TenantId"),
+    ("tenant_name", "TenantName"),
+    ("order_id", "OrderId"),
+    ("booking_ref", "BookingRef"),
+)
+
+
+@lru_cache(maxsize=1)
+def _utc_timestamp(seconds: int) -> str:
+    # Messages built within the same second share a timestamp, so it's only formatted once per second.
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(seconds))
+
+
 class SQSSupplierMessageBuilder(BrokerHttpMessageBuilder, SQSMessageBuilder):
     """A specific implementation of the `SQSMessageBuilder` for the raw-supplier-message-storage service.
 
@@ -79,9 +96,12 @@ class SQSSupplierMessageBuilder(BrokerHttpMessageBuilder, SQSMessageBuilder):
         *,
         allowed_request_names: set[str | None] | None = None,
         disallowed_request_tags: set[str | None] | None = None,
+        compression_level: int = 1,
     ) -> None:
         self.allowed_request_names = allowed_request_names or set()
         self.disallowed_request_tags = disallowed_request_tags or set()
+        # The fastest zlib level, since every message is compressed. Its output is only slightly larger.
+        self.compression_level = compression_level
 
     def filter(self, request: EnhancedRequest, response: EnhancedResponse, details: DetailsType) -> bool:
         return (
@@ -92,39 +112,28 @@ class SQSSupplierMessageBuilder(BrokerHttpMessageBuilder, SQSMessageBuilder):
     def build_metadata(
         self, request: EnhancedRequest, response: EnhancedResponse, details: DetailsType
     ) -> dict[str, Any] | None:
-        request_label = details["request_label"]
-        supplier_label = details["supplier_label"]
-        trace_id = details["trace_id"]
-        timestamp = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        # Bound once, since it's called for every attribute of every message.
+        string_attr = self.string_attr
 
         attributes = {
-            "MessageType": self.string_attr(request_label),
-            "SupplierCode": self.string_attr(supplier_label),
-            "TraceId": self.string_attr(trace_id),
-            "TimeStamp": self.string_attr(timestamp),
+            "MessageType": string_attr(details["request_label"]),
+            "SupplierCode": string_attr(details["supplier_label"]),
+            "TraceId": string_attr(details["trace_id"]),
+            "TimeStamp": string_attr(_utc_timestamp(int(time.time()))),
         }
 
-        if tenant_id := details.get("tenant_id"):
-            attributes["TenantId"] = self.string_attr(tenant_id)
-
-        if tenant_name := details.get("tenant_name"):
-            attributes["TenantName"] = self.string_attr(tenant_name)
-
-        if order_id := details.get("order_id"):
-            attributes["OrderId"] = self.string_attr(order_id)
-
-        if booking_ref := details.get("booking_ref"):
-            attributes["BookingRef"] = self.string_attr(booking_ref)
+        for detail, attribute in OPTIONAL_MESSAGE_ATTRIBUTES:
+            if value := details.get(detail):
+                attributes[attribute] = string_attr(value)
 
         return attributes
 
     def build_body(self, request: EnhancedRequest, response: EnhancedResponse, details: DetailsType) -> str:
-        return json.dumps(
-            {
-                "request": compress_and_encode(mask_card_number(mask_series_code(request.text))),
-                "response": compress_and_encode(response.content),
-            }
-        )
+        masked_request_content = mask_sensitive_data(request.content, request.charset)
+        request_body = compress_and_encode(masked_request_content, self.compression_level)
+        response_body = compress_and_encode(response.content, self.compression_level)
+        # Both values are base64, which never needs JSON escaping, so the fixed-shape body is formatted directly.
+        return f'{{"request":"{request_body}","response":"{response_body}"}}'
 
 
 class SupplierClientBase(HttpClientBase):
@@ -134,23 +143,41 @@ class SupplierClientBase(HttpClientBase):
     It serves as a foundation for both synchronous and asynchronous HTTP supplier clients.
     """
 
-    def request_log(self, request: EnhancedRequest, details: DetailsType) -> tuple[str, dict[str, Any]]:
-        message, extra = super().request_log(request, details)
-        header, body = message.split(":", maxsplit=1)
+    def _trace_id(self) -> int:
+        # Requests usually run within a trace already (e.g. of an incoming request), so its ID is read directly.
+        # A span is only started, and finished right away, to get a new trace ID when there is no active trace.
+        context = tracer.current_trace_context()
+        if context and context.trace_id:
+            return context.trace_id
+
+        with tracer.trace("SupplierClient.request", service=self.service_name) as span:
+            return span.trace_id
+
+    def request_log(
+        self, request: EnhancedRequest, details: DetailsType, *, target: str | None = None
+    ) -> tuple[str, dict[str, Any]]:
+        message, extra = super().request_log(request, details, target=target)
 
         if self.request_log_config.supplier_code:
             extra["supplier_code"] = details["supplier_code"]
 
-        return f"{header} to [{details['supplier_label']}] supplier:{body}", extra
+        return message, extra
 
-    def response_log(self, response: EnhancedResponse, details: DetailsType) -> tuple[str, dict[str, Any]]:
-        message, extra = super().response_log(response, details)
-        header, body = message.split(":", maxsplit=1)
+    def response_log(
+        self, response: EnhancedResponse, details: DetailsType, *, target: str | None = None
+    ) -> tuple[str, dict[str, Any]]:
+        message, extra = super().response_log(response, details, target=target)
 
         if self.response_log_config.supplier_code:
             extra["supplier_code"] = details["supplier_code"]
 
-        return f"{header} from [{details['supplier_label']}] supplier:{body}", extra
+        return message, extra
+
+    def _request_log_header(self, details: DetailsType) -> str:
+        return f"Sending HTTP request [{details['request_label']}] to [{details['supplier_label']}] supplier"
+
+    def _response_log_header(self, details: DetailsType) -> str:
+        return f"HTTP response received [{details['request_label']}] from [{details['supplier_label']}] supplier"
 
 
 class SupplierClient(SupplierClientBase, HttpClient):
@@ -172,6 +199,9 @@ class SupplierClient(SupplierClientBase, HttpClient):
     proxy: ProxyType | None = None
     cert: CertType | None = None
     timeout: TimeoutType | None = 5.0
+    limits: httpx.Limits = DEFAULT_LIMITS
+    http2: bool = True
+    cache: bool | hishel.BaseStorage = False
 
     retry_strategy: RetryStrategy | None = None
     request_log_config: SupplierRequestLogConfig = SupplierRequestLogConfig()
@@ -180,6 +210,8 @@ class SupplierClient(SupplierClientBase, HttpClient):
     broker_message_builder: BrokerHttpMessageBuilder | None = None
 
     _global_client: httpx.Client | None = None
+    _global_client_key: tuple[Any, ...] | None = None
+    _client: httpx.Client | None = None
 
     def __init__(
         self,
@@ -194,6 +226,9 @@ class SupplierClient(SupplierClientBase, HttpClient):
         proxy: ProxyType | None | Unset = UNSET,
         cert: CertType | None | Unset = UNSET,
         timeout: TimeoutType | None | Unset = UNSET,
+        limits: httpx.Limits | Unset = UNSET,
+        http2: bool | Unset = UNSET,
+        cache: bool | hishel.BaseStorage | Unset = UNSET,
         retry_strategy: RetryStrategy | None | Unset = UNSET,
         request_log_config: SupplierRequestLogConfig | None | Unset = UNSET,
         response_log_config: SupplierResponseLogConfig | Unset = UNSET,
@@ -201,8 +236,7 @@ class SupplierClient(SupplierClientBase, HttpClient):
         broker_message_builder: BrokerHttpMessageBuilder | None | Unset = UNSET,
     ) -> None:
         """Configure local settings for the HTTP client."""
-        setattr_if_not_unset(self, "service_name", service_name)
-        setattr_if_not_unset(self, "supplier_code", supplier_code)
+        setattrs_if_not_unset(self, service_name=service_name, supplier_code=supplier_code)
 
         super().__init__(
             base_url=base_url,
@@ -213,6 +247,9 @@ class SupplierClient(SupplierClientBase, HttpClient):
             proxy=proxy,
             cert=cert,
             timeout=timeout,
+            limits=limits,
+            http2=http2,
+            cache=cache,
             retry_strategy=retry_strategy,
             request_log_config=request_log_config,
             response_log_config=response_log_config,
@@ -234,6 +271,9 @@ class SupplierClient(SupplierClientBase, HttpClient):
         proxy: ProxyType | None | Unset = UNSET,
         cert: CertType | None | Unset = UNSET,
         timeout: TimeoutType | None | Unset = UNSET,
+        limits: httpx.Limits | Unset = UNSET,
+        http2: bool | Unset = UNSET,
+        cache: bool | hishel.BaseStorage | Unset = UNSET,
         retry_strategy: RetryStrategy | None | Unset = UNSET,
         request_log_config: SupplierRequestLogConfig | None | Unset = UNSET,
         response_log_config: SupplierResponseLogConfig | Unset = UNSET,
@@ -241,8 +281,7 @@ class SupplierClient(SupplierClientBase, HttpClient):
         broker_message_builder: BrokerHttpMessageBuilder | None | Unset = UNSET,
     ) -> None:
         """Configure global settings for the HTTP client."""
-        setattr_if_not_unset(cls, "service_name", service_name)
-        setattr_if_not_unset(cls, "supplier_code", supplier_code)
+        setattrs_if_not_unset(cls, service_name=service_name, supplier_code=supplier_code)
 
         return super().configure(
             base_url=base_url,
@@ -253,6 +292,9 @@ class SupplierClient(SupplierClientBase, HttpClient):
             proxy=proxy,
             cert=cert,
             timeout=timeout,
+            limits=limits,
+            http2=http2,
+            cache=cache,
             retry_strategy=retry_strategy,
             request_log_config=request_log_config,
             response_log_config=response_log_config,
@@ -280,14 +322,11 @@ class SupplierClient(SupplierClientBase, HttpClient):
         details = details or {}
         supplier_code = supplier_code if supplier_code is not UNSET else self.supplier_code
 
-        if "supplier_code" not in details:
-            details["supplier_code"] = supplier_code
-        if "supplier_label" not in details:
-            details["supplier_label"] = supplier_code or "UNKNOWN"
+        details.setdefault("supplier_code", supplier_code)
+        details.setdefault("supplier_label", supplier_code or "UNKNOWN")
 
         if "trace_id" not in details:
-            with tracer.trace("SupplierClient.request", service=self.service_name) as span:
-                details["trace_id"] = span.trace_id
+            details["trace_id"] = self._trace_id()
 
         return super().request(
             method,
@@ -476,6 +515,10 @@ class AsyncSupplierClient(SupplierClientBase, AsyncHttpClient):
     proxy: ProxyType | None = None
     cert: CertType | None = None
     timeout: TimeoutType | None = 5.0
+    limits: httpx.Limits = DEFAULT_LIMITS
+    http2: bool = True
+    aiohttp_transport: bool = False
+    cache: bool | hishel.AsyncBaseStorage = False
 
     retry_strategy: AsyncRetryStrategy | None = None
     request_log_config: SupplierRequestLogConfig = SupplierRequestLogConfig()
@@ -484,6 +527,7 @@ class AsyncSupplierClient(SupplierClientBase, AsyncHttpClient):
     broker_message_builder: BrokerHttpMessageBuilder | None = None
 
     _global_client: httpx.AsyncClient | None = None
+    _client: httpx.AsyncClient | None = None
 
     def __init__(
         self,
@@ -498,6 +542,10 @@ class AsyncSupplierClient(SupplierClientBase, AsyncHttpClient):
         proxy: ProxyType | None | Unset = UNSET,
         cert: CertType | None | Unset = UNSET,
         timeout: TimeoutType | None | Unset = UNSET,
+        limits: httpx.Limits | Unset = UNSET,
+        http2: bool | Unset = UNSET,
+        aiohttp_transport: bool | Unset = UNSET,
+        cache: bool | hishel.AsyncBaseStorage | Unset = UNSET,
         retry_strategy: AsyncRetryStrategy | None | Unset = UNSET,
         request_log_config: SupplierRequestLogConfig | None | Unset = UNSET,
         response_log_config: SupplierResponseLogConfig | Unset = UNSET,
@@ -505,8 +553,7 @@ class AsyncSupplierClient(SupplierClientBase, AsyncHttpClient):
         broker_message_builder: BrokerHttpMessageBuilder | None | Unset = UNSET,
     ) -> None:
         """Configure local settings for the HTTP client."""
-        setattr_if_not_unset(self, "service_name", service_name)
-        setattr_if_not_unset(self, "supplier_code", supplier_code)
+        setattrs_if_not_unset(self, service_name=service_name, supplier_code=supplier_code)
 
         super().__init__(
             base_url=base_url,
@@ -517,6 +564,10 @@ class AsyncSupplierClient(SupplierClientBase, AsyncHttpClient):
             proxy=proxy,
             cert=cert,
             timeout=timeout,
+            limits=limits,
+            http2=http2,
+            aiohttp_transport=aiohttp_transport,
+            cache=cache,
             retry_strategy=retry_strategy,
             request_log_config=request_log_config,
             response_log_config=response_log_config,
@@ -538,6 +589,10 @@ class AsyncSupplierClient(SupplierClientBase, AsyncHttpClient):
         proxy: ProxyType | None | Unset = UNSET,
         cert: CertType | None | Unset = UNSET,
         timeout: TimeoutType | None | Unset = UNSET,
+        limits: httpx.Limits | Unset = UNSET,
+        http2: bool | Unset = UNSET,
+        aiohttp_transport: bool | Unset = UNSET,
+        cache: bool | hishel.AsyncBaseStorage | Unset = UNSET,
         retry_strategy: AsyncRetryStrategy | None | Unset = UNSET,
         request_log_config: SupplierRequestLogConfig | None | Unset = UNSET,
         response_log_config: SupplierResponseLogConfig | Unset = UNSET,
@@ -545,8 +600,7 @@ class AsyncSupplierClient(SupplierClientBase, AsyncHttpClient):
         broker_message_builder: BrokerHttpMessageBuilder | None | Unset = UNSET,
     ) -> None:
         """Configure global settings for the HTTP client."""
-        setattr_if_not_unset(cls, "service_name", service_name)
-        setattr_if_not_unset(cls, "supplier_code", supplier_code)
+        setattrs_if_not_unset(cls, service_name=service_name, supplier_code=supplier_code)
 
         return super().configure(
             base_url=base_url,
@@ -557,6 +611,10 @@ class AsyncSupplierClient(SupplierClientBase, AsyncHttpClient):
             proxy=proxy,
             cert=cert,
             timeout=timeout,
+            limits=limits,
+            http2=http2,
+            aiohttp_transport=aiohttp_transport,
+            cache=cache,
             retry_strategy=retry_strategy,
             request_log_config=request_log_config,
             response_log_config=response_log_config,
@@ -584,14 +642,11 @@ class AsyncSupplierClient(SupplierClientBase, AsyncHttpClient):
         details = details or {}
         supplier_code = supplier_code if supplier_code is not UNSET else self.supplier_code
 
-        if "supplier_code" not in details:
-            details["supplier_code"] = supplier_code
-        if "supplier_label" not in details:
-            details["supplier_label"] = supplier_code or "UNKNOWN"
+        details.setdefault("supplier_code", supplier_code)
+        details.setdefault("supplier_label", supplier_code or "UNKNOWN")
 
         if "trace_id" not in details:
-            with tracer.trace("SupplierClient.request", service=self.service_name) as span:
-                details["trace_id"] = span.trace_id
+            details["trace_id"] = self._trace_id()
 
         return await super().request(
             method,
@@ -1,4 +1,24 @@
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 http_clients_logger = logging.getLogger("utils.clients.http")
 broker_clients_logger = logging.getLogger("utils.clients.broker")
+
+
+def enqueue_handlers(logger: logging.Logger) -> QueueListener:
+    """Replace the handlers of a logger with a queue handler, so that logging calls only enqueue records.
+
+    The returned listener passes queued records to the original handlers from a background thread,
+    which keeps handler I/O (console, files, network sinks) out of the request path. Start it to handle records
+    and stop it on shutdown to flush the records left in the queue. Only the listener thread calls the original
+    handlers, so they don't need to be safe for concurrent use.
+    """
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, *logger.handlers, respect_handler_level=True)
+
+    for handler in logger.handlers.copy():
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(records))
+
+    return listener
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import logging.config
+import os
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
@@ -16,8 +17,15 @@ from clients.http import (
     SupplierRequestLogConfig,
     SupplierResponseLogConfig,
 )
+from loggers import broker_clients_logger, enqueue_handlers, http_clients_logger
 from routers import http_client_router, supplier_client_router
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is not available on Windows, so we fall back to the default asyncio event loop.
+    uvloop = None
+
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
@@ -60,6 +68,11 @@ logging.config.dictConfig(
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     print("Startup")
 
+    # Client logs are written by background threads, so that requests don't wait for console output.
+    log_listeners = [enqueue_handlers(http_clients_logger), enqueue_handlers(broker_clients_logger)]
+    for log_listener in log_listeners:
+        log_listener.start()
+
     HttpClient.configure(base_url="https://httpbin.org", timeout=None)
     HttpClient.open_global()
 
@@ -99,6 +112,9 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
 
     sqs_clinet.disconnect()
 
+    for log_listener in log_listeners:
+        log_listener.stop()
+
     print("Shutdown")
 
 
@@ -109,4 +125,12 @@ app.include_router(supplier_client_router)
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", port=8000, reload=True)
+    # Reloading is for development only and can't be combined with multiple workers.
+    uvicorn.run(
+        "main:app",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        reload=os.getenv("RELOAD", "0") == "1",
+        loop="uvloop" if uvloop else "asyncio",
+        http="httptools",
+    )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from functools import cached_property, partial, wraps
-from typing import Any, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from tenacity import (
     AsyncRetrying,
@@ -16,10 +16,16 @@ from tenacity import (
     retry_if_result,
     retry_never,
     stop_after_attempt,
+    wait_exponential_jitter,
     wait_fixed,
+    wait_random,
+    wait_random_exponential,
 )
 from tenacity import RetryCallState as RetryState
 
+if TYPE_CHECKING:
+    from tenacity.wait import wait_base
+
 RETRY_ATTR = "__retry__"
 RETRY_ON_EXCEPTION_ATTR = "__retry_on_exception__"
 RETRY_ON_RESULT_ATTR = "__retry_on_result__"
@@ -148,9 +154,46 @@ class RetryStrategyBase(metaclass=RetryStrategyMeta):
     asynchronous retry strategies.
     """
 
-    def __init__(self, *, attempts: int = 0, delay: int = 0) -> None:
+    def __init__(
+        self,
+        *,
+        attempts: int = 0,
+        delay: int = 0,
+        exponential: bool = False,
+        max_delay: float | None = None,
+        jitter: float = 0,
+        full_jitter: bool = False,
+    ) -> None:
         self.attempts = attempts
         self.delay = delay
+        # Doubles the delay on each retry, so that retries back off from an overloaded service.
+        self.exponential = exponential
+        # Caps exponentially growing delays.
+        self.max_delay = max_delay
+        # Adds a random delay of up to `jitter` seconds, so that clients failing together don't retry in lockstep.
+        self.jitter = jitter
+        # Waits a random time between zero and the (exponential) delay instead ("full jitter"), which spreads out
+        # retries of many clients the most. It replaces `jitter`.
+        self.full_jitter = full_jitter
+
+    @property
+    def _wait(self) -> wait_base:
+        max_delay = self.max_delay if self.max_delay is not None else float("inf")
+
+        if self.full_jitter:
+            if self.exponential:
+                return wait_random_exponential(multiplier=self.delay, max=max_delay)
+            return wait_random(0, self.delay)
+
+        if self.exponential:
+            return wait_exponential_jitter(
+                initial=self.delay,
+                max=max_delay,
+                jitter=self.jitter,
+            )
+
+        wait = wait_fixed(self.delay)
+        return wait + wait_random(0, self.jitter) if self.jitter else wait
 
     @property
     def _retry(self) -> retry_base:
@@ -174,7 +217,7 @@ class RetryStrategyBase(metaclass=RetryStrategyMeta):
     def _retrying_kwargs(self) -> dict[str, Any]:
         return {
             "stop": stop_after_attempt(self.attempts),
-            "wait": wait_fixed(self.delay),
+            "wait": self._wait,
             # By default, it retries on any exception.
             "retry": retry_if_exception_type() if self._retry is retry_never else self._retry,
             # Define the `before` method if you want to execute something before each retry.
@@ -2,14 +2,16 @@ import asyncio
 
 from fastapi import APIRouter
 
-from clients.http import AsyncHttpClient, HttpClient, HttpRetryStrategy
+from clients.http import AsyncHttpClient, HttpClient, HttpRetryStrategy, default_client
 from retry import RetryStrategy
 
+# Use cases with synchronous clients are plain functions, so FastAPI runs them in its threadpool
+# instead of blocking the event loop for the whole request.
 router = APIRouter(prefix="/http")
 
 
 @router.get("/global")
-async def global_usecase() -> dict:
+def global_usecase() -> dict:
     client = HttpClient()
 
     # By default client uses the global httpx client.
@@ -18,8 +20,16 @@ async def global_usecase() -> dict:
     return response.json()
 
 
+@router.get("/default")
+def default_usecase() -> dict:
+    # The default client is the simplest way to send a request, and it reuses connections across calls.
+    response = default_client.get("https://httpbin.org/get")
+
+    return response.json()
+
+
 @router.get("/local")
-async def local_usecase() -> dict:
+def local_usecase() -> dict:
     client = HttpClient()
 
     # It opens a local httpx client, instead of using the global one.
@@ -46,7 +56,7 @@ async def local_async_usecase() -> list[dict]:
 
 
 @router.get("/local/context-manager")
-async def local_context_manager_usecase() -> list[dict]:
+def local_context_manager_usecase() -> list[dict]:
     # Context manager automatically opens and closes a local httpx client.
     with HttpClient(base_url="https://jsonplaceholder.typicode.com") as client:
         response = client.get("/todos", params={"_limit": 5})
@@ -55,7 +65,7 @@ async def local_context_manager_usecase() -> list[dict]:
 
 
 @router.get("/local/timeout")
-async def local_timeout_usecase() -> list[dict]:
+def local_timeout_usecase() -> list[dict]:
     # Local client timeout takes precedence over the global timeout.
     client = HttpClient(timeout=5)
 
@@ -68,7 +78,7 @@ async def local_timeout_usecase() -> list[dict]:
 
 
 @router.get("/local/retry")
-async def local_retry_usecase() -> list[dict]:
+def local_retry_usecase() -> list[dict]:
     with HttpClient(
         base_url="http://127.0.0.1:5000",
         timeout=5,
@@ -81,7 +91,7 @@ async def local_retry_usecase() -> list[dict]:
 
 
 @router.get("/local/error")
-async def local_error_usecase() -> dict:
+def local_error_usecase() -> dict:
     with HttpClient(
         base_url="http://127.0.0.1:5000",
         retry_strategy=HttpRetryStrategy(attempts=3, delay=1, on_statuses={"server_error"}),
@@ -5,11 +5,13 @@ from fastapi import APIRouter
 from clients.broker import AsyncSQSClient
 from clients.http import AsyncHttpRetryStrategy, AsyncSupplierClient, SQSSupplierMessageBuilder, SupplierClient
 
+# Use cases with synchronous clients are plain functions, so FastAPI runs them in its threadpool
+# instead of blocking the event loop for the whole request.
 router = APIRouter(prefix="/supplier")
 
 
 @router.get("/global")
-async def global_usecase() -> dict:
+def global_usecase() -> dict:
     client = SupplierClient()
 
     response = client.get("/get")
@@ -18,7 +20,7 @@ async def global_usecase() -> dict:
 
 
 @router.get("/local")
-async def local_usecase() -> dict:
+def local_usecase() -> dict:
     client = SupplierClient()
 
     client.open()
@@ -56,7 +58,7 @@ async def local_async_usecase() -> list[dict]:
 
 
 @router.get("/local/custom_supplier_code")
-async def local_custom_supplier_code_usecase(supplier_code: str) -> dict:
+def local_custom_supplier_code_usecase(supplier_code: str) -> dict:
     client = SupplierClient()
 
     client.open()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC
+from dataclasses import FrozenInstanceError
 from typing import TYPE_CHECKING, Any
 
 import pytest
@@ -19,6 +20,18 @@ class SampleBrokerMessageBuilder(BrokerMessageBuilder):
         return "body"
 
 
+class TestBrokerMessage:
+    def test_has_no_instance_dict(self) -> None:
+        message = BrokerMessage(metadata={"key": "value"}, body="body")
+        assert not hasattr(message, "__dict__")
+
+    def test_is_immutable(self) -> None:
+        message = BrokerMessage(metadata={"key": "value"}, body="body")
+
+        with pytest.raises(FrozenInstanceError):
+            message.body = "new body"  # type: ignore[misc]
+
+
 class TestBrokerMessageBuilder:
     def test_is_abstract(self) -> None:
         assert issubclass(BrokerMessageBuilder, ABC)
@@ -52,8 +65,13 @@ class TestBrokerMessageBuilder:
         assert result == expected
 
         mock_filter.assert_called_once_with(arg1, kwarg1=kwarg1)
-        spy_build_metadata.assert_called_once_with(arg1, kwarg1=kwarg1)
-        spy_build_body.assert_called_once_with(arg1, kwarg1=kwarg1)
+
+        if filter_result:
+            spy_build_metadata.assert_called_once_with(arg1, kwarg1=kwarg1)
+            spy_build_body.assert_called_once_with(arg1, kwarg1=kwarg1)
+        else:
+            spy_build_metadata.assert_not_called()
+            spy_build_body.assert_not_called()
 
     def test_filter_default_returns_true(self) -> None:
         instance = SampleBrokerMessageBuilder()
@@ -61,28 +79,64 @@ class TestBrokerMessageBuilder:
 
 
 class TestBrokerClient:
-    def test_is_abstract(self) -> None:
-        assert issubclass(BrokerClient, ABC)
+    def test_is_not_abstract(self) -> None:
+        assert not issubclass(BrokerClient, ABC)
 
     def test_inherits_broker_client_base(self) -> None:
-        assert issubclass(BrokerClient, ABC)
+        assert issubclass(BrokerClient, BrokerClientBase)
 
-    def test_has_abstract_methods(self) -> None:
-        assert len(BrokerClient.__abstractmethods__) == 3
-        assert "connect" in BrokerClient.__abstractmethods__
-        assert "disconnect" in BrokerClient.__abstractmethods__
-        assert "send_message" in BrokerClient.__abstractmethods__
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("connect", ()),
+            ("disconnect", ()),
+            ("send_message", (BrokerMessage(metadata=None, body="body"),)),
+        ],
+    )
+    def test_methods_are_not_implemented(self, method: str, args: tuple[Any, ...]) -> None:
+        instance = BrokerClient("queue_url")
+
+        with pytest.raises(NotImplementedError):
+            getattr(instance, method)(*args)
+
+    def test_send_messages_sends_each_message(self, mocker: MockerFixture) -> None:
+        instance = BrokerClient("queue_url")
+
+        mock_send_message = mocker.patch.object(BrokerClient, "send_message", side_effect=["r1", "r2"])
+        messages = [BrokerMessage(metadata=None, body="1"), BrokerMessage(metadata=None, body="2")]
+
+        assert instance.send_messages(messages) == ["r1", "r2"]
+        assert mock_send_message.call_args_list == [mocker.call(messages[0]), mocker.call(messages[1])]
 
 
 class TestAsyncBrokerClient:
-    def test_is_abstract(self) -> None:
-        assert issubclass(AsyncBrokerClient, ABC)
+    def test_is_not_abstract(self) -> None:
+        assert not issubclass(AsyncBrokerClient, ABC)
 
     def test_inherits_broker_client_base(self) -> None:
         assert issubclass(AsyncBrokerClient, BrokerClientBase)
 
-    def test_has_abstract_methods(self) -> None:
-        assert len(AsyncBrokerClient.__abstractmethods__) == 3
-        assert "connect" in AsyncBrokerClient.__abstractmethods__
-        assert "disconnect" in AsyncBrokerClient.__abstractmethods__
-        assert "send_message" in AsyncBrokerClient.__abstractmethods__
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("connect", ()),
+            ("disconnect", ()),
+            ("send_message", (BrokerMessage(metadata=None, body="body"),)),
+        ],
+    )
+    async def test_methods_are_not_implemented(self, method: str, args: tuple[Any, ...]) -> None:
+        instance = AsyncBrokerClient("queue_url")
+
+        with pytest.raises(NotImplementedError):
+            await getattr(instance, method)(*args)
+
+    @pytest.mark.asyncio
+    async def test_send_messages_sends_each_message(self, mocker: MockerFixture) -> None:
+        instance = AsyncBrokerClient("queue_url")
+
+        mock_send_message = mocker.patch.object(AsyncBrokerClient, "send_message", side_effect=["r1", "r2"])
+        messages = [BrokerMessage(metadata=None, body="1"), BrokerMessage(metadata=None, body="2")]
+
+        assert await instance.send_messages(messages) == ["r1", "r2"]
+        assert mock_send_message.call_args_list == [mocker.call(messages[0]), mocker.call(messages[1])]
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 from abc import ABCMeta
 from typing import TYPE_CHECKING, Any
 
 import pytest
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
+from clients.broker import sqs
 from clients.broker.base import AsyncBrokerClient, BrokerClient, BrokerMessage, BrokerMessageBuilder
-from clients.broker.sqs import AsyncSQSClient, SQSClient, SQSClientBase, SQSClientMeta, SQSMessageBuilder
+from clients.broker.sqs import (
+    SQS_CLIENT_CONFIG,
+    SQS_MAX_BATCH_SIZE,
+    AsyncSQSClient,
+    SQSClient,
+    SQSClientBase,
+    SQSClientMeta,
+    SQSMessageBuilder,
+)
 from loggers import broker_clients_logger
 from patterns import OptionalSingletonMeta
 
@@ -18,6 +30,13 @@ if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_clients(mocker: MockerFixture) -> None:
+    mocker.patch.object(sqs, "_shared_clients", {})
+    mocker.patch.object(sqs, "_shared_clients_refs", {})
+    mocker.patch.object(sqs, "_shared_async_session", None)
+
+
 @pytest.fixture
 def sample_broker_message() -> BrokerMessage:
     return BrokerMessage(metadata={"key": "value"}, body="body")
@@ -50,6 +69,11 @@ class SampleSQSMessageBuilder(SQSMessageBuilder):
         return "body"
 
 
+class SampleSQSClientBase(SQSClientBase):
+    # `SQSClientBase` leaves its attributes to the slots of concrete clients, so it can't be used on its own.
+    pass
+
+
 class TestSQSMessageBuilder:
     def test_inherits_broker_message_builder(self) -> None:
         assert issubclass(SQSMessageBuilder, BrokerMessageBuilder)
@@ -99,7 +123,7 @@ class TestSQSClientBase:
         spy_logger_error = mocker.spy(broker_clients_logger, "error")
 
         with caplog.at_level(logging.ERROR):
-            SQSClientBase().log_client_error(sample_client_error)
+            SampleSQSClientBase().log_client_error(sample_client_error)
 
         assert len(caplog.records) == 1
         log_record = caplog.records[0]
@@ -109,7 +133,9 @@ class TestSQSClientBase:
         assert sample_client_error.response["Error"]["Message"] in log_record.message
 
         spy_logger_error.assert_called_once_with(
-            log_record.message,
+            "Failed to send SQS message due to ClientError: %s - %s",
+            sample_client_error.response["Error"]["Code"],
+            sample_client_error.response["Error"]["Message"],
             exc_info=sample_client_error,
             extra={
                 "error": {
@@ -125,7 +151,7 @@ class TestSQSClientBase:
         spy_logger_error = mocker.spy(broker_clients_logger, "error")
 
         with caplog.at_level(logging.ERROR):
-            SQSClientBase().log_boto_core_error(sample_boto_core_error)
+            SampleSQSClientBase().log_boto_core_error(sample_boto_core_error)
 
         assert len(caplog.records) == 1
         log_record = caplog.records[0]
@@ -139,13 +165,23 @@ class TestSQSClientBase:
         spy_info = mocker.spy(broker_clients_logger, "info")
 
         with caplog.at_level(logging.INFO):
-            SQSClientBase().log_success(sample_broker_message)
+            SampleSQSClientBase().log_success(sample_broker_message)
 
         assert len(caplog.records) == 1
         log_record = caplog.records[0]
 
         assert "success" in log_record.message
-        spy_info.assert_called_once_with(caplog.records[0].message, extra={})
+        spy_info.assert_called_once_with(caplog.records[0].message)
+
+    def test_log_success_with_partial_extra(
+        self, mocker: MockerFixture, caplog: pytest.LogCaptureFixture, sample_broker_message: BrokerMessage
+    ) -> None:
+        spy_info = mocker.spy(broker_clients_logger, "info")
+
+        with caplog.at_level(logging.INFO):
+            SampleSQSClientBase(log_body=True).log_success(sample_broker_message)
+
+        spy_info.assert_called_once_with(caplog.records[0].message, extra={"body": sample_broker_message.body})
 
     def test_log_success_with_extra(
         self, mocker: MockerFixture, caplog: pytest.LogCaptureFixture, sample_broker_message: BrokerMessage
@@ -153,7 +189,7 @@ class TestSQSClientBase:
         spy_info = mocker.spy(broker_clients_logger, "info")
 
         with caplog.at_level(logging.INFO):
-            SQSClientBase(log_attributes=True, log_body=True).log_success(sample_broker_message)
+            SampleSQSClientBase(log_attributes=True, log_body=True).log_success(sample_broker_message)
 
         assert len(caplog.records) == 1
         log_record = caplog.records[0]
@@ -167,13 +203,62 @@ class TestSQSClientBase:
             },
         )
 
+    def test_log_batch_entry_error(self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.ERROR):
+            SampleSQSClientBase().log_batch_entry_error(
+                {"Id": "0", "Code": "InternalError", "Message": "Internal error"}
+            )
+
+        assert len(caplog.records) == 1
+        log_record = caplog.records[0]
+
+        assert log_record.message == "Failed to send SQS message in batch: InternalError - Internal error"
+        assert log_record.error == {"code": "InternalError", "message": "Internal error"}
+
+    def test_log_batch_result(self, mocker: MockerFixture) -> None:
+        instance = SampleSQSClientBase()
+        mock_log_success = mocker.patch.object(instance, "log_success")
+        mock_log_batch_entry_error = mocker.patch.object(instance, "log_batch_entry_error")
+
+        messages = [BrokerMessage(metadata=None, body="1"), BrokerMessage(metadata=None, body="2")]
+        failed_entry = {"Id": "0", "Code": "InternalError", "Message": "Internal error", "SenderFault": False}
+
+        instance.log_batch_result(messages, {"Successful": [{"Id": "1"}], "Failed": [failed_entry]})
+
+        mock_log_success.assert_called_once_with(messages[1])
+        mock_log_batch_entry_error.assert_called_once_with(failed_entry)
+
+    def test_batch_entries(self) -> None:
+        messages = [BrokerMessage(metadata={"key": "value"}, body="1"), BrokerMessage(metadata=None, body="2")]
+
+        assert SampleSQSClientBase().batch_entries(messages) == [
+            {"Id": "0", "MessageAttributes": {"key": "value"}, "MessageBody": "1"},
+            {"Id": "1", "MessageAttributes": None, "MessageBody": "2"},
+        ]
+
+    @pytest.mark.parametrize(
+        ("messages_count", "expected_batch_sizes"),
+        [
+            (0, []),
+            (SQS_MAX_BATCH_SIZE, [SQS_MAX_BATCH_SIZE]),
+            (SQS_MAX_BATCH_SIZE * 2 + 1, [SQS_MAX_BATCH_SIZE, SQS_MAX_BATCH_SIZE, 1]),
+        ],
+    )
+    def test_split_into_batches(self, messages_count: int, expected_batch_sizes: list[int]) -> None:
+        messages = [BrokerMessage(metadata=None, body=str(i)) for i in range(messages_count)]
+
+        batches = SampleSQSClientBase().split_into_batches(messages)
+
+        assert [len(batch) for batch in batches] == expected_batch_sizes
+        assert [message for batch in batches for message in batch] == messages
+
 
 class TestSQSClientMeta:
     def test_inherits_optional_singleton_meta(self) -> None:
         assert issubclass(SQSClientMeta, OptionalSingletonMeta)
 
-    def test_inherits_abc_meta(self) -> None:
-        assert issubclass(SQSClientMeta, ABCMeta)
+    def test_does_not_inherit_abc_meta(self) -> None:
+        assert not issubclass(SQSClientMeta, ABCMeta)
 
 
 class TestSQSClient:
@@ -194,13 +279,26 @@ class TestSQSClient:
     def test_uses_sqs_client_meta_metaclass(self) -> None:
         assert isinstance(SQSClient, SQSClientMeta)
 
+    def test_init_sets_attributes_of_all_bases(self) -> None:
+        instance = SQSClient("queue_url", "region_name", log_attributes=True, log_body=True)
+
+        assert instance.queue_url == "queue_url"
+        assert instance.region_name == "region_name"
+        assert instance.log_attributes is True
+        assert instance.log_body is True
+
+    def test_has_no_instance_dict(self, sample_sqs_client: SQSClient) -> None:
+        assert not hasattr(sample_sqs_client, "__dict__")
+
     def test_connect_initializes_client_on_first_call(
         self, sample_sqs_client: SQSClient, mock_boto3_client: MagicMock
     ) -> None:
         sample_sqs_client.connect()
 
         assert sample_sqs_client._client is not None
-        mock_boto3_client.assert_called_once_with("sqs", region_name="region_name", endpoint_url="endpoint_url")
+        mock_boto3_client.assert_called_once_with(
+            "sqs", region_name="region_name", endpoint_url="endpoint_url", config=SQS_CLIENT_CONFIG
+        )
 
     def test_connect_does_not_reinitialize_client_on_second_call(
         self, sample_sqs_client: SQSClient, mock_boto3_client: MagicMock
@@ -209,7 +307,29 @@ class TestSQSClient:
         sample_sqs_client.connect()
 
         assert sample_sqs_client._client is not None
-        mock_boto3_client.assert_called_once_with("sqs", region_name="region_name", endpoint_url="endpoint_url")
+        mock_boto3_client.assert_called_once_with(
+            "sqs", region_name="region_name", endpoint_url="endpoint_url", config=SQS_CLIENT_CONFIG
+        )
+
+    def test_connect_shares_client_between_instances_with_same_settings(self, mock_boto3_client: MagicMock) -> None:
+        instance_1 = SQSClient("queue_url_1", "region_name", endpoint_url="endpoint_url")
+        instance_2 = SQSClient("queue_url_2", "region_name", endpoint_url="endpoint_url")
+
+        instance_1.connect()
+        instance_2.connect()
+
+        assert instance_1._client is instance_2._client
+        mock_boto3_client.assert_called_once_with(
+            "sqs", region_name="region_name", endpoint_url="endpoint_url", config=SQS_CLIENT_CONFIG
+        )
+
+    def test_connect_does_not_share_client_between_instances_with_different_settings(
+        self, mock_boto3_client: MagicMock
+    ) -> None:
+        SQSClient("queue_url", "region_name_1").connect()
+        SQSClient("queue_url", "region_name_2").connect()
+
+        assert mock_boto3_client.call_count == 2
 
     def test_disconnect_closes_client_when_client_is_open(
         self, sample_sqs_client: SQSClient, mock_boto3_client: MagicMock
@@ -217,6 +337,21 @@ class TestSQSClient:
         sample_sqs_client.connect()
         sample_sqs_client.disconnect()
 
+        assert sample_sqs_client._client is None
+        mock_boto3_client.return_value.close.assert_called_once()
+
+    def test_disconnect_closes_shared_client_only_after_last_instance(self, mock_boto3_client: MagicMock) -> None:
+        instance_1 = SQSClient("queue_url_1", "region_name")
+        instance_2 = SQSClient("queue_url_2", "region_name")
+
+        instance_1.connect()
+        instance_2.connect()
+
+        instance_1.disconnect()
+        instance_1.disconnect()
+        mock_boto3_client.return_value.close.assert_not_called()
+
+        instance_2.disconnect()
         mock_boto3_client.return_value.close.assert_called_once()
 
     def test_disconnect_does_not_close_client_when_client_is_not_open(
@@ -232,14 +367,14 @@ class TestSQSClient:
         mock_boto3_client: MagicMock,
         sample_broker_message: BrokerMessage,
     ) -> None:
-        spy_log_success = mocker.spy(sample_sqs_client, "log_success")
+        spy_log_success = mocker.spy(SQSClient, "log_success")
         mock_boto3_client.return_value.send_message.return_value = "response"
 
         sample_sqs_client.connect()
         result = sample_sqs_client.send_message(sample_broker_message)
 
         assert result == "response"
-        spy_log_success.assert_called_once_with(sample_broker_message)
+        spy_log_success.assert_called_once_with(sample_sqs_client, sample_broker_message)
 
     def test_send_message_client_error_logs_error(
         self,
@@ -249,14 +384,14 @@ class TestSQSClient:
         sample_broker_message: BrokerMessage,
         sample_client_error: ClientError,
     ) -> None:
-        spy_log_client_error = mocker.spy(sample_sqs_client, "log_client_error")
+        spy_log_client_error = mocker.spy(SQSClient, "log_client_error")
         mock_boto3_client.return_value.send_message.side_effect = sample_client_error
 
         sample_sqs_client.connect()
         result = sample_sqs_client.send_message(sample_broker_message)
 
         assert result is None
-        spy_log_client_error.assert_called_once_with(sample_client_error)
+        spy_log_client_error.assert_called_once_with(sample_sqs_client, sample_client_error)
 
     def test_send_message_boto_core_error_logs_error(
         self,
@@ -266,14 +401,167 @@ class TestSQSClient:
         sample_broker_message: BrokerMessage,
         sample_boto_core_error: BotoCoreError,
     ) -> None:
-        spy_log_boto_core_error = mocker.spy(sample_sqs_client, "log_boto_core_error")
+        spy_log_boto_core_error = mocker.spy(SQSClient, "log_boto_core_error")
         mock_boto3_client.return_value.send_message.side_effect = sample_boto_core_error
 
         sample_sqs_client.connect()
         result = sample_sqs_client.send_message(sample_broker_message)
 
         assert result is None
-        spy_log_boto_core_error.assert_called_once_with(sample_boto_core_error)
+        spy_log_boto_core_error.assert_called_once_with(sample_sqs_client, sample_boto_core_error)
+
+    def test_send_message_batch_success_returns_response(
+        self,
+        mocker: MockerFixture,
+        sample_sqs_client: SQSClient,
+        mock_boto3_client: MagicMock,
+        sample_broker_message: BrokerMessage,
+    ) -> None:
+        spy_log_batch_result = mocker.spy(SQSClient, "log_batch_result")
+        mock_boto3_client.return_value.send_message_batch.return_value = {"Successful": [{"Id": "0"}]}
+
+        sample_sqs_client.connect()
+        result = sample_sqs_client.send_message_batch([sample_broker_message])
+
+        assert result == {"Successful": [{"Id": "0"}]}
+        mock_boto3_client.return_value.send_message_batch.assert_called_once_with(
+            QueueUrl="queue_url",
+            Entries=[{"Id": "0", "MessageAttributes": {"key": "value"}, "MessageBody": "body"}],
+        )
+        spy_log_batch_result.assert_called_once_with(
+            sample_sqs_client, [sample_broker_message], {"Successful": [{"Id": "0"}]}
+        )
+
+    def test_send_message_batch_client_error_logs_error(
+        self,
+        mocker: MockerFixture,
+        sample_sqs_client: SQSClient,
+        mock_boto3_client: MagicMock,
+        sample_broker_message: BrokerMessage,
+        sample_client_error: ClientError,
+    ) -> None:
+        spy_log_client_error = mocker.spy(SQSClient, "log_client_error")
+        mock_boto3_client.return_value.send_message_batch.side_effect = sample_client_error
+
+        sample_sqs_client.connect()
+        result = sample_sqs_client.send_message_batch([sample_broker_message])
+
+        assert result is None
+        spy_log_client_error.assert_called_once_with(sample_sqs_client, sample_client_error)
+
+    def test_send_messages_sends_batches(
+        self,
+        mocker: MockerFixture,
+        sample_sqs_client: SQSClient,
+        sample_broker_message: BrokerMessage,
+    ) -> None:
+        mock_send_message_batch = mocker.patch.object(SQSClient, "send_message_batch", return_value="response")
+        messages = [sample_broker_message] * (SQS_MAX_BATCH_SIZE + 1)
+
+        result = sample_sqs_client.send_messages(messages)
+
+        assert result == ["response", "response"]
+        assert mock_send_message_batch.call_args_list == [
+            mocker.call(messages[:SQS_MAX_BATCH_SIZE]),
+            mocker.call(messages[SQS_MAX_BATCH_SIZE:]),
+        ]
+
+    def test_buffered_send_message_sends_messages_in_batches(
+        self, mocker: MockerFixture, mock_boto3_client: MagicMock, sample_broker_message: BrokerMessage
+    ) -> None:
+        instance = SQSClient("queue_url", "region_name", buffered=True, flush_interval=0.01)
+        mock_send_message_batch = mocker.patch.object(SQSClient, "send_message_batch")
+
+        instance.connect()
+        results = [instance.send_message(sample_broker_message) for _ in range(SQS_MAX_BATCH_SIZE + 1)]
+        instance.disconnect()
+
+        assert results == [None] * (SQS_MAX_BATCH_SIZE + 1)
+        sent_messages = [message for call in mock_send_message_batch.call_args_list for message in call.args[0]]
+        assert sent_messages == [sample_broker_message] * (SQS_MAX_BATCH_SIZE + 1)
+        assert all(len(call.args[0]) <= SQS_MAX_BATCH_SIZE for call in mock_send_message_batch.call_args_list)
+        mock_boto3_client.return_value.send_message.assert_not_called()
+
+    def test_buffered_send_message_batch_error_does_not_stop_flusher(
+        self, mocker: MockerFixture, mock_boto3_client: MagicMock, sample_broker_message: BrokerMessage
+    ) -> None:
+        instance = SQSClient("queue_url", "region_name", buffered=True, flush_interval=0.01)
+        error = RuntimeError("Unexpected error")
+        mock_send_message_batch = mocker.patch.object(SQSClient, "send_message_batch", side_effect=[error, None])
+        mock_logger_exception = mocker.patch.object(broker_clients_logger, "exception")
+
+        instance.connect()
+        instance.send_message(sample_broker_message)
+        instance._buffer.join()
+        instance.send_message(sample_broker_message)
+
+        disconnect = threading.Thread(target=instance.disconnect)
+        disconnect.start()
+        disconnect.join(timeout=1)
+
+        assert not disconnect.is_alive()
+        assert mock_send_message_batch.call_count == 2
+        mock_logger_exception.assert_called_once_with("Failed to send buffered SQS messages")
+
+    def test_buffered_disconnect_with_full_buffer_sends_all_messages(
+        self, mocker: MockerFixture, mock_boto3_client: MagicMock, sample_broker_message: BrokerMessage
+    ) -> None:
+        instance = SQSClient("queue_url", "region_name", buffered=True, buffer_size=1, flush_interval=0.01)
+        broker_available = threading.Event()
+        mock_send_message_batch = mocker.patch.object(
+            SQSClient, "send_message_batch", side_effect=lambda _: broker_available.wait()
+        )
+
+        instance.connect()
+        producers = [threading.Thread(target=instance.send_message, args=(sample_broker_message,)) for _ in range(5)]
+        for producer in producers:
+            producer.start()
+        disconnect = threading.Thread(target=instance.disconnect)
+        disconnect.start()
+        broker_available.set()
+        for producer in producers:
+            producer.join(timeout=1)
+        disconnect.join(timeout=1)
+
+        assert not disconnect.is_alive()
+        sent_messages = [message for call in mock_send_message_batch.call_args_list for message in call.args[0]]
+        direct_messages = mock_boto3_client.return_value.send_message.call_count
+        assert len(sent_messages) + direct_messages == 5
+
+    def test_buffered_send_message_after_disconnect_starts_sends_message_directly(
+        self, mocker: MockerFixture, mock_boto3_client: MagicMock, sample_broker_message: BrokerMessage
+    ) -> None:
+        instance = SQSClient("queue_url", "region_name", buffered=True, flush_interval=0.01)
+        broker_available = threading.Event()
+        mocker.patch.object(SQSClient, "send_message_batch", side_effect=lambda _: broker_available.wait())
+
+        instance.connect()
+        instance.send_message(sample_broker_message)
+        disconnect = threading.Thread(target=instance.disconnect)
+        disconnect.start()
+        instance._stop.wait(timeout=1)
+        instance.send_message(sample_broker_message)
+        broker_available.set()
+        disconnect.join(timeout=1)
+
+        assert not disconnect.is_alive()
+        mock_boto3_client.return_value.send_message.assert_called_once_with(
+            QueueUrl="queue_url",
+            MessageAttributes=sample_broker_message.metadata,
+            MessageBody=sample_broker_message.body,
+        )
+
+    def test_buffered_disconnect_stops_flusher(self, mock_boto3_client: MagicMock) -> None:
+        instance = SQSClient("queue_url", "region_name", buffered=True)
+
+        instance.connect()
+        flusher = instance._flusher
+        instance.disconnect()
+
+        assert flusher is not None
+        assert not flusher.is_alive()
+        assert instance._flusher is None
+        assert instance._buffer is None
 
 
 class TestAsyncSQSClient:
@@ -281,6 +569,16 @@ class TestAsyncSQSClient:
     def sample_async_sqs_client(self) -> AsyncSQSClient:
         return AsyncSQSClient("queue_url", "region_name", endpoint_url="endpoint_url")
 
+    def test_has_no_instance_dict(self, sample_async_sqs_client: AsyncSQSClient) -> None:
+        assert not hasattr(sample_async_sqs_client, "__dict__")
+
+    def test_init_builds_client_kwargs(self, sample_async_sqs_client: AsyncSQSClient) -> None:
+        assert sample_async_sqs_client._client_kwargs == {
+            "region_name": "region_name",
+            "endpoint_url": "endpoint_url",
+            "config": SQS_CLIENT_CONFIG,
+        }
+
     @pytest.fixture
     def mock_aioboto3_session(self, mocker: MockerFixture) -> MagicMock:
         return mocker.patch("aioboto3.Session")
@@ -302,7 +600,7 @@ class TestAsyncSQSClient:
 
         assert sample_async_sqs_client._client is not None
         mock_aioboto3_session.return_value.client.assert_called_once_with(
-            "sqs", region_name="region_name", endpoint_url="endpoint_url"
+            "sqs", region_name="region_name", endpoint_url="endpoint_url", config=SQS_CLIENT_CONFIG
         )
 
     @pytest.mark.asyncio
@@ -314,9 +612,17 @@ class TestAsyncSQSClient:
 
         assert sample_async_sqs_client._client is not None
         mock_aioboto3_session.return_value.client.assert_called_once_with(
-            "sqs", region_name="region_name", endpoint_url="endpoint_url"
+            "sqs", region_name="region_name", endpoint_url="endpoint_url", config=SQS_CLIENT_CONFIG
         )
 
+    @pytest.mark.asyncio
+    async def test_connect_shares_session_between_instances(self, mock_aioboto3_session: MagicMock) -> None:
+        await AsyncSQSClient("queue_url_1", "region_name").connect()
+        await AsyncSQSClient("queue_url_2", "region_name").connect()
+
+        mock_aioboto3_session.assert_called_once_with()
+        assert mock_aioboto3_session.return_value.client.call_count == 2
+
     @pytest.mark.asyncio
     async def test_disconnect_closes_client_when_client_is_open(
         self, sample_async_sqs_client: AsyncSQSClient, mock_aioboto3_session: MagicMock
@@ -342,7 +648,7 @@ class TestAsyncSQSClient:
         mock_aioboto3_session: MagicMock,
         sample_broker_message: BrokerMessage,
     ) -> None:
-        spy_log_success = mocker.spy(sample_async_sqs_client, "log_success")
+        spy_log_success = mocker.spy(AsyncSQSClient, "log_success")
         mock_aioboto3_session.return_value.client.return_value.__aenter__.return_value.send_message.return_value = (
             "response"
         )
@@ -351,7 +657,7 @@ class TestAsyncSQSClient:
         result = await sample_async_sqs_client.send_message(sample_broker_message)
 
         assert result == "response"
-        spy_log_success.assert_called_once_with(sample_broker_message)
+        spy_log_success.assert_called_once_with(sample_async_sqs_client, sample_broker_message)
 
     @pytest.mark.asyncio
     async def test_send_message_client_error_logs_error(
@@ -362,7 +668,7 @@ class TestAsyncSQSClient:
         sample_broker_message: BrokerMessage,
         sample_client_error: ClientError,
     ) -> None:
-        spy_log_client_error = mocker.spy(sample_async_sqs_client, "log_client_error")
+        spy_log_client_error = mocker.spy(AsyncSQSClient, "log_client_error")
         mock_aioboto3_session.return_value.client.return_value.__aenter__.return_value.send_message.side_effect = (
             sample_client_error
         )
@@ -371,7 +677,7 @@ class TestAsyncSQSClient:
         result = await sample_async_sqs_client.send_message(sample_broker_message)
 
         assert result is None
-        spy_log_client_error.assert_called_once_with(sample_client_error)
+        spy_log_client_error.assert_called_once_with(sample_async_sqs_client, sample_client_error)
 
     @pytest.mark.asyncio
     async def test_send_message_boto_core_error_logs_error(
@@ -382,7 +688,7 @@ class TestAsyncSQSClient:
         sample_broker_message: BrokerMessage,
         sample_boto_core_error: BotoCoreError,
     ) -> None:
-        spy_log_boto_core_error = mocker.spy(sample_async_sqs_client, "log_boto_core_error")
+        spy_log_boto_core_error = mocker.spy(AsyncSQSClient, "log_boto_core_error")
         mock_aioboto3_session.return_value.client.return_value.__aenter__.return_value.send_message.side_effect = (
             sample_boto_core_error
         )
@@ -391,4 +697,168 @@ class TestAsyncSQSClient:
         result = await sample_async_sqs_client.send_message(sample_broker_message)
 
         assert result is None
-        spy_log_boto_core_error.assert_called_once_with(sample_boto_core_error)
+        spy_log_boto_core_error.assert_called_once_with(sample_async_sqs_client, sample_boto_core_error)
+
+    @pytest.mark.asyncio
+    async def test_send_message_batch_success_returns_response(
+        self,
+        mocker: MockerFixture,
+        sample_async_sqs_client: AsyncSQSClient,
+        mock_aioboto3_session: MagicMock,
+        sample_broker_message: BrokerMessage,
+    ) -> None:
+        spy_log_batch_result = mocker.spy(AsyncSQSClient, "log_batch_result")
+        mock_client = mock_aioboto3_session.return_value.client.return_value.__aenter__.return_value
+        mock_client.send_message_batch.return_value = {"Successful": [{"Id": "0"}]}
+
+        await sample_async_sqs_client.connect()
+        result = await sample_async_sqs_client.send_message_batch([sample_broker_message])
+
+        assert result == {"Successful": [{"Id": "0"}]}
+        mock_client.send_message_batch.assert_called_once_with(
+            QueueUrl="queue_url",
+            Entries=[{"Id": "0", "MessageAttributes": {"key": "value"}, "MessageBody": "body"}],
+        )
+        spy_log_batch_result.assert_called_once_with(
+            sample_async_sqs_client, [sample_broker_message], {"Successful": [{"Id": "0"}]}
+        )
+
+    @pytest.mark.asyncio
+    async def test_send_message_batch_boto_core_error_logs_error(
+        self,
+        mocker: MockerFixture,
+        sample_async_sqs_client: AsyncSQSClient,
+        mock_aioboto3_session: MagicMock,
+        sample_broker_message: BrokerMessage,
+        sample_boto_core_error: BotoCoreError,
+    ) -> None:
+        spy_log_boto_core_error = mocker.spy(AsyncSQSClient, "log_boto_core_error")
+        mock_client = mock_aioboto3_session.return_value.client.return_value.__aenter__.return_value
+        mock_client.send_message_batch.side_effect = sample_boto_core_error
+
+        await sample_async_sqs_client.connect()
+        result = await sample_async_sqs_client.send_message_batch([sample_broker_message])
+
+        assert result is None
+        spy_log_boto_core_error.assert_called_once_with(sample_async_sqs_client, sample_boto_core_error)
+
+    @pytest.mark.asyncio
+    async def test_send_messages_sends_batches(
+        self,
+        mocker: MockerFixture,
+        sample_async_sqs_client: AsyncSQSClient,
+        sample_broker_message: BrokerMessage,
+    ) -> None:
+        mock_send_message_batch = mocker.patch.object(AsyncSQSClient, "send_message_batch", return_value="response")
+        messages = [sample_broker_message] * (SQS_MAX_BATCH_SIZE + 1)
+
+        result = await sample_async_sqs_client.send_messages(messages)
+
+        assert result == ["response", "response"]
+        assert mock_send_message_batch.call_args_list == [
+            mocker.call(messages[:SQS_MAX_BATCH_SIZE]),
+            mocker.call(messages[SQS_MAX_BATCH_SIZE:]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_send_messages_limits_concurrent_batches(
+        self,
+        mocker: MockerFixture,
+        sample_async_sqs_client: AsyncSQSClient,
+        sample_broker_message: BrokerMessage,
+    ) -> None:
+        mocker.patch.object(sqs, "SQS_CLIENT_CONFIG", Config(max_pool_connections=2))
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def send_message_batch(_messages: list[BrokerMessage]) -> str:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return "response"
+
+        mocker.patch.object(AsyncSQSClient, "send_message_batch", side_effect=send_message_batch)
+
+        result = await sample_async_sqs_client.send_messages([sample_broker_message] * SQS_MAX_BATCH_SIZE * 5)
+
+        assert result == ["response"] * 5
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_buffered_send_message_sends_messages_in_batches(
+        self, mocker: MockerFixture, mock_aioboto3_session: MagicMock, sample_broker_message: BrokerMessage
+    ) -> None:
+        instance = AsyncSQSClient("queue_url", "region_name", buffered=True, flush_interval=0.01)
+        mock_send_message_batch = mocker.patch.object(AsyncSQSClient, "send_message_batch")
+
+        await instance.connect()
+        results = [await instance.send_message(sample_broker_message) for _ in range(SQS_MAX_BATCH_SIZE + 1)]
+        await instance.disconnect()
+
+        assert results == [None] * (SQS_MAX_BATCH_SIZE + 1)
+        assert mock_send_message_batch.call_args_list == [
+            mocker.call([sample_broker_message] * SQS_MAX_BATCH_SIZE),
+            mocker.call([sample_broker_message]),
+        ]
+        mock_aioboto3_session.return_value.client.return_value.__aenter__.return_value.send_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_buffered_send_message_batch_error_does_not_stop_flusher(
+        self, mocker: MockerFixture, mock_aioboto3_session: MagicMock, sample_broker_message: BrokerMessage
+    ) -> None:
+        instance = AsyncSQSClient("queue_url", "region_name", buffered=True, flush_interval=0.01)
+        error = RuntimeError("Unexpected error")
+        mock_send_message_batch = mocker.patch.object(AsyncSQSClient, "send_message_batch", side_effect=[error, None])
+        mock_logger_exception = mocker.patch.object(broker_clients_logger, "exception")
+
+        await instance.connect()
+        await instance.send_message(sample_broker_message)
+        await asyncio.wait_for(instance._buffer.join(), timeout=1)
+        await instance.send_message(sample_broker_message)
+        await asyncio.wait_for(instance.disconnect(), timeout=1)
+
+        assert mock_send_message_batch.call_count == 2
+        mock_logger_exception.assert_called_once_with("Failed to send buffered SQS messages")
+
+    @pytest.mark.asyncio
+    async def test_buffered_send_message_after_disconnect_starts_sends_message_directly(
+        self, mocker: MockerFixture, mock_aioboto3_session: MagicMock, sample_broker_message: BrokerMessage
+    ) -> None:
+        instance = AsyncSQSClient("queue_url", "region_name", buffered=True, flush_interval=0.01)
+        broker_available = asyncio.Event()
+
+        async def send_message_batch(_: list[BrokerMessage]) -> None:
+            await broker_available.wait()
+
+        mocker.patch.object(AsyncSQSClient, "send_message_batch", side_effect=send_message_batch)
+
+        await instance.connect()
+        await instance.send_message(sample_broker_message)
+        disconnect = asyncio.create_task(instance.disconnect())
+        await asyncio.sleep(0)
+        await instance.send_message(sample_broker_message)
+        broker_available.set()
+        await asyncio.wait_for(disconnect, timeout=1)
+
+        mock_client = mock_aioboto3_session.return_value.client.return_value.__aenter__.return_value
+        mock_client.send_message.assert_awaited_once_with(
+            QueueUrl="queue_url",
+            MessageAttributes=sample_broker_message.metadata,
+            MessageBody=sample_broker_message.body,
+        )
+
+    @pytest.mark.asyncio
+    async def test_buffered_disconnect_stops_flusher(self, mock_aioboto3_session: MagicMock) -> None:
+        instance = AsyncSQSClient("queue_url", "region_name", buffered=True)
+
+        await instance.connect()
+        flusher = instance._flusher
+        await instance.disconnect()
+
+        assert flusher is not None
+        assert flusher.cancelled()
+        assert instance._flusher is None
+        assert instance._buffer is None
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
+import gc
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
 
-from clients.broker.base import AsyncBrokerClient, BrokerClient, BrokerMessageBuilder
+from clients.broker.base import AsyncBrokerClient, BrokerClient, BrokerMessage, BrokerMessageBuilder
 from clients.http.base import (
     AsyncHttpClient,
     AsyncHttpRetryStrategy,
@@ -18,9 +24,13 @@ from clients.http.base import (
     HttpRequestLogConfig,
     HttpResponseLogConfig,
     HttpRetryStrategy,
+    _request_label,
+    _warm_clients,
+    default_client,
 )
 from clients.http.request import EnhancedRequest, Request
 from clients.http.response import EnhancedResponse, Response
+from loggers import http_clients_logger
 from retry.base import AsyncRetryStrategy, RetryError, RetryState, RetryStrategy
 from utils.unset import UNSET
 
@@ -53,6 +63,23 @@ def sample_details() -> DetailsType:
     }
 
 
+class TestRequestLabel:
+    @pytest.mark.parametrize(
+        ("name", "tag", "expected_label"),
+        [
+            ("REQUEST", "TEST", "REQUEST-TEST"),
+            ("REQUEST", None, "REQUEST"),
+            (None, "TEST", "UNNAMED-TEST"),
+            (None, None, "UNNAMED"),
+        ],
+    )
+    def test_builds_label(self, name: str | None, tag: str | None, expected_label: str) -> None:
+        assert _request_label(name, tag) == expected_label
+
+    def test_is_cached(self) -> None:
+        assert _request_label("REQUEST", "TEST") is _request_label("REQUEST", "TEST")
+
+
 class TestHttpRetryStrategy:
     @pytest.fixture
     def sample_retry_state(self, sample_request: EnhancedRequest, sample_details: DetailsType) -> RetryState:
@@ -61,6 +88,14 @@ class TestHttpRetryStrategy:
     def test_inherits_retry_strategy(self) -> None:
         assert issubclass(HttpRetryStrategy, RetryStrategy)
 
+    def test_init_passes_backoff_settings(self) -> None:
+        retry_strategy = HttpRetryStrategy(delay=1, exponential=True, max_delay=10, jitter=0.5, full_jitter=True)
+
+        assert retry_strategy.exponential is True
+        assert retry_strategy.max_delay == 10
+        assert retry_strategy.jitter == 0.5
+        assert retry_strategy.full_jitter is True
+
     @pytest.mark.parametrize(
         ("error", "expected"),
         [
@@ -170,6 +205,13 @@ class TestHttpRetryStrategy:
             assert "status code" in caplog.text
             assert str(status_code) in caplog.text
 
+    def test_retry_on_status_after_on_statuses_reassigned(self) -> None:
+        retry_strategy = HttpRetryStrategy(on_statuses={"client_error"})
+        retry_strategy.on_statuses = {"server_error"}
+
+        assert retry_strategy.retry_on_status(EnhancedResponse(Response(status_code=500))) is True
+        assert retry_strategy.retry_on_status(EnhancedResponse(Response(status_code=400))) is False
+
     def test_before_logs_retry_attempt(self, caplog: pytest.LogCaptureFixture, sample_retry_state: RetryState) -> None:
         with caplog.at_level(logging.INFO):
             HttpRetryStrategy(attempts=3).before(sample_retry_state)
@@ -179,6 +221,22 @@ class TestHttpRetryStrategy:
         assert "1/3" in caplog.text
         assert "GET http://example.com" in caplog.text
 
+    def test_before_with_keyword_request_logs_retry_attempt(self, caplog: pytest.LogCaptureFixture) -> None:
+        retry_state = RetryState(
+            None,
+            None,
+            (),
+            {
+                "request": EnhancedRequest(Request("GET", "http://example.com")),
+                "details": {"request_label": "REQUEST-TEST"},
+            },
+        )
+
+        with caplog.at_level(logging.INFO):
+            HttpRetryStrategy(attempts=3).before(retry_state)
+
+        assert "GET http://example.com" in caplog.text
+
     def test_error_callback_logs_failure(
         self, caplog: pytest.LogCaptureFixture, sample_retry_state: RetryState
     ) -> None:
@@ -205,6 +263,14 @@ class TestAsyncHttpRetryStrategy:
     def test_inherits_async_retry_strategy(self) -> None:
         assert issubclass(AsyncHttpRetryStrategy, AsyncRetryStrategy)
 
+    def test_init_passes_backoff_settings(self) -> None:
+        retry_strategy = AsyncHttpRetryStrategy(delay=1, exponential=True, max_delay=10, jitter=0.5, full_jitter=True)
+
+        assert retry_strategy.exponential is True
+        assert retry_strategy.max_delay == 10
+        assert retry_strategy.jitter == 0.5
+        assert retry_strategy.full_jitter is True
+
     @pytest.mark.parametrize(
         ("error", "expected"),
         [
@@ -314,6 +380,13 @@ class TestAsyncHttpRetryStrategy:
             assert "status code" in caplog.text
             assert str(status_code) in caplog.text
 
+    def test_retry_on_status_after_on_statuses_reassigned(self) -> None:
+        retry_strategy = AsyncHttpRetryStrategy(on_statuses={"client_error"})
+        retry_strategy.on_statuses = {"server_error"}
+
+        assert retry_strategy.retry_on_status(EnhancedResponse(Response(status_code=500))) is True
+        assert retry_strategy.retry_on_status(EnhancedResponse(Response(status_code=400))) is False
+
     def test_before_logs_retry_attempt(self, caplog: pytest.LogCaptureFixture, sample_retry_state: RetryState) -> None:
         with caplog.at_level(logging.INFO):
             AsyncHttpRetryStrategy(attempts=3).before(sample_retry_state)
@@ -323,6 +396,22 @@ class TestAsyncHttpRetryStrategy:
         assert "1/3" in caplog.text
         assert "GET http://example.com" in caplog.text
 
+    def test_before_with_keyword_request_logs_retry_attempt(self, caplog: pytest.LogCaptureFixture) -> None:
+        retry_state = RetryState(
+            None,
+            None,
+            (),
+            {
+                "request": EnhancedRequest(Request("GET", "http://example.com")),
+                "details": {"request_label": "REQUEST-TEST"},
+            },
+        )
+
+        with caplog.at_level(logging.INFO):
+            AsyncHttpRetryStrategy(attempts=3).before(retry_state)
+
+        assert "GET http://example.com" in caplog.text
+
     def test_error_callback_logs_failure(
         self, caplog: pytest.LogCaptureFixture, sample_retry_state: RetryState
     ) -> None:
@@ -346,6 +435,40 @@ class SampleBrokerHttpMessageBuilder(BrokerHttpMessageBuilder):
         return "body"
 
 
+class TestHttpRequestLogConfig:
+    def test_request_fields_include_only_enabled_fields(self) -> None:
+        log_config = HttpRequestLogConfig(request_tag=False, request_body=True)
+
+        assert [key for key, _ in log_config.request_fields] == ["name", "method", "url", "body"]
+
+    def test_request_fields_are_cached(self) -> None:
+        log_config = HttpRequestLogConfig()
+
+        assert log_config.request_fields is log_config.request_fields
+
+    def test_is_immutable(self) -> None:
+        with pytest.raises(FrozenInstanceError):
+            HttpRequestLogConfig().request_headers = True
+
+
+class TestHttpResponseLogConfig:
+    def test_fields_include_only_enabled_fields(self) -> None:
+        log_config = HttpResponseLogConfig(request_name=False, response_body=True, response_elapsed_time=False)
+
+        assert [key for key, _ in log_config.request_fields] == ["tag", "method", "url"]
+        assert [key for key, _ in log_config.response_fields] == ["status_code", "body"]
+
+    def test_fields_are_cached(self) -> None:
+        log_config = HttpResponseLogConfig()
+
+        assert log_config.request_fields is log_config.request_fields
+        assert log_config.response_fields is log_config.response_fields
+
+    def test_is_immutable(self) -> None:
+        with pytest.raises(FrozenInstanceError):
+            HttpResponseLogConfig().response_body = True
+
+
 class TestBrokerHttpMessageBuilder:
     def test_inherits_broker_message_builder(self) -> None:
         assert issubclass(BrokerHttpMessageBuilder, BrokerMessageBuilder)
@@ -355,6 +478,57 @@ class TestBrokerHttpMessageBuilder:
         assert "build_metadata" in BrokerHttpMessageBuilder.__abstractmethods__
         assert "build_body" in BrokerHttpMessageBuilder.__abstractmethods__
 
+    @pytest.mark.parametrize(
+        ("filter_result", "expected"),
+        [
+            (True, BrokerMessage(metadata={"key": "value"}, body="body")),
+            (False, None),
+        ],
+    )
+    def test_build(
+        self,
+        filter_result: bool,
+        expected: BrokerMessage | None,
+        mocker: MockerFixture,
+        sample_request: EnhancedRequest,
+        sample_response: EnhancedResponse,
+        sample_details: DetailsType,
+    ) -> None:
+        instance = SampleBrokerHttpMessageBuilder()
+
+        mock_filter = mocker.patch.object(instance, "filter")
+        spy_build_metadata = mocker.spy(instance, "build_metadata")
+        spy_build_body = mocker.spy(instance, "build_body")
+
+        mock_filter.return_value = filter_result
+
+        result = instance.build(sample_request, sample_response, sample_details)
+
+        assert result == expected
+        mock_filter.assert_called_once_with(sample_request, sample_response, sample_details)
+
+        if filter_result:
+            spy_build_metadata.assert_called_once_with(sample_request, sample_response, sample_details)
+            spy_build_body.assert_called_once_with(sample_request, sample_response, sample_details)
+        else:
+            spy_build_metadata.assert_not_called()
+            spy_build_body.assert_not_called()
+
+    def test_build_unfiltered_builds_message_without_filter(
+        self,
+        mocker: MockerFixture,
+        sample_request: EnhancedRequest,
+        sample_response: EnhancedResponse,
+        sample_details: DetailsType,
+    ) -> None:
+        instance = SampleBrokerHttpMessageBuilder()
+        mock_filter = mocker.patch.object(instance, "filter", return_value=False)
+
+        result = instance.build_unfiltered(sample_request, sample_response, sample_details)
+
+        assert result == BrokerMessage(metadata={"key": "value"}, body="body")
+        mock_filter.assert_not_called()
+
     def test_filter_default_returns_true(
         self, sample_request: EnhancedRequest, sample_response: EnhancedResponse, sample_details: DetailsType
     ) -> None:
@@ -510,6 +684,33 @@ class TestHttpClientBase:
 
         assert extra == expected_extra
 
+    def test_request_log_does_not_modify_details(
+        self, sample_request: EnhancedRequest, sample_details: DetailsType
+    ) -> None:
+        expected_details = dict(sample_details)
+
+        SampleHttpClient().request_log(sample_request, sample_details)
+
+        assert sample_details == expected_details
+
+    def test_request_log_with_target_uses_target(
+        self, sample_request: EnhancedRequest, sample_details: DetailsType
+    ) -> None:
+        message, _ = SampleHttpClient().request_log(
+            sample_request, sample_details, target="GET http://example.com/logged"
+        )
+
+        assert message == "Sending HTTP request [REQUEST-TEST]: GET http://example.com/logged"
+
+    def test_response_log_with_target_uses_target(
+        self, sample_response: EnhancedResponse, sample_details: DetailsType
+    ) -> None:
+        message, _ = SampleHttpClient().response_log(
+            sample_response, sample_details, target="GET http://example.com/logged"
+        )
+
+        assert message == "HTTP response received [REQUEST-TEST]: GET http://example.com/logged -> 200"
+
 
 class TestHttpClient:
     @pytest.fixture(autouse=True)
@@ -524,6 +725,9 @@ class TestHttpClient:
         HttpClient.proxy = None
         HttpClient.cert = None
         HttpClient.timeout = 5.0
+        HttpClient.limits = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0)
+        HttpClient.http2 = True
+        HttpClient.cache = False
 
         HttpClient.retry_strategy = None
         HttpClient.request_log_config = HttpRequestLogConfig()
@@ -532,6 +736,10 @@ class TestHttpClient:
         HttpClient.broker_message_builder = None
 
         HttpClient._global_client = None
+        HttpClient._global_client_key = None
+        HttpClient._close_global_registered = False
+        HttpClient._client = None
+        _warm_clients.clear()
 
     @pytest.fixture
     def mock_httpx_client(self, mocker: MockerFixture) -> MockerFixture:
@@ -549,6 +757,11 @@ class TestHttpClient:
         assert HttpClient.proxy is None
         assert HttpClient.cert is None
         assert HttpClient.timeout == 5.0
+        assert HttpClient.limits == httpx.Limits(
+            max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0
+        )
+        assert HttpClient.http2 is True
+        assert HttpClient.cache is False
 
         assert HttpClient.retry_strategy is None
         assert HttpClient.request_log_config == HttpRequestLogConfig()
@@ -557,6 +770,9 @@ class TestHttpClient:
         assert HttpClient.broker_message_builder is None
 
         assert HttpClient._global_client is None
+        assert HttpClient._global_client_key is None
+        assert HttpClient._close_global_registered is False
+        assert HttpClient._client is None
 
     def test_configure_sets_only_specified_class_attributes(self) -> None:
         HttpClient.configure(
@@ -573,6 +789,11 @@ class TestHttpClient:
         assert HttpClient.proxy is None
         assert HttpClient.cert is None
         assert HttpClient.timeout == 5.0
+        assert HttpClient.limits == httpx.Limits(
+            max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0
+        )
+        assert HttpClient.http2 is True
+        assert HttpClient.cache is False
 
         assert HttpClient.retry_strategy is None
         assert HttpClient.request_log_config == HttpRequestLogConfig()
@@ -581,6 +802,7 @@ class TestHttpClient:
         assert HttpClient.broker_message_builder is None
 
         assert HttpClient._global_client is None
+        assert HttpClient._client is None
 
     def test_init_sets_only_specified_instance_attributes(self) -> None:
         client = HttpClient(
@@ -597,6 +819,9 @@ class TestHttpClient:
         assert client.proxy is None
         assert client.cert is None
         assert client.timeout == 5.0
+        assert client.limits == httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0)
+        assert client.http2 is True
+        assert client.cache is False
 
         assert client.retry_strategy is None
         assert client.request_log_config == HttpRequestLogConfig()
@@ -605,6 +830,7 @@ class TestHttpClient:
         assert client.broker_message_builder is None
 
         assert client._global_client is None
+        assert client._client is None
         assert client._local_client is None
 
     def test_open_global_unopened_sets_global_client(self, mock_httpx_client: MagicMock) -> None:
@@ -620,6 +846,8 @@ class TestHttpClient:
             proxy=HttpClient.proxy,
             cert=HttpClient.cert,
             timeout=HttpClient.timeout,
+            limits=HttpClient.limits,
+            http2=HttpClient.http2,
         )
 
     def test_open_global_opened_does_not_set_global_client(self, mock_httpx_client: MagicMock) -> None:
@@ -636,8 +864,62 @@ class TestHttpClient:
             proxy=HttpClient.proxy,
             cert=HttpClient.cert,
             timeout=HttpClient.timeout,
+            limits=HttpClient.limits,
+            http2=HttpClient.http2,
         )
 
+    def test_open_global_registers_close_global_at_exit(
+        self, mocker: MockerFixture, mock_httpx_client: MagicMock
+    ) -> None:
+        mock_atexit_register = mocker.patch("atexit.register")
+
+        HttpClient.open_global()
+        HttpClient.open_global()
+
+        mock_atexit_register.assert_called_once_with(HttpClient.close_global)
+
+    def test_open_global_subclass_registers_own_close_global_at_exit(
+        self, mocker: MockerFixture, mock_httpx_client: MagicMock
+    ) -> None:
+        class SubHttpClient(HttpClient):
+            _global_client = None
+            _global_client_key = None
+            _client = None
+
+        mock_atexit_register = mocker.patch("atexit.register")
+
+        HttpClient.open_global()
+        SubHttpClient.open_global()
+
+        assert mock_atexit_register.call_args_list == [
+            mocker.call(HttpClient.close_global),
+            mocker.call(SubHttpClient.close_global),
+        ]
+
+    def test_open_global_reopened_with_other_settings_registers_close_global_at_exit_once(
+        self, mocker: MockerFixture, mock_httpx_client: MagicMock
+    ) -> None:
+        mock_atexit_register = mocker.patch("atexit.register")
+
+        HttpClient.open_global()
+        HttpClient.close_global(keep_warm=True)
+        HttpClient.configure(base_url="http://example.com")
+        HttpClient.open_global()
+
+        assert mock_httpx_client.call_count == 2
+        mock_atexit_register.assert_called_once_with(HttpClient.close_global)
+
+    def test_open_global_concurrently_sets_global_client_once(self, mock_httpx_client: MagicMock) -> None:
+        # Slow down client creation to make threads race for it.
+        mock_httpx_client.side_effect = lambda **_: time.sleep(0.01) or MagicMock()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(8):
+                executor.submit(HttpClient.open_global)
+
+        assert HttpClient._global_client is not None
+        mock_httpx_client.assert_called_once()
+
     def test_close_global_opened_closes_global_client(self, mock_httpx_client: MagicMock) -> None:
         HttpClient.open_global()
         HttpClient.close_global()
@@ -645,10 +927,34 @@ class TestHttpClient:
         assert HttpClient._global_client is not None
         mock_httpx_client.return_value.close.assert_called_once()
 
+    def test_close_global_keep_warm_keeps_global_client_open_for_reopening(self, mock_httpx_client: MagicMock) -> None:
+        HttpClient.open_global()
+        global_client = HttpClient._global_client
+        HttpClient.close_global(keep_warm=True)
+
+        assert HttpClient._global_client is None
+        assert HttpClient._client is None
+        mock_httpx_client.return_value.close.assert_not_called()
+
+        HttpClient.open_global()
+
+        assert HttpClient._global_client is global_client
+        mock_httpx_client.assert_called_once()
+
+    def test_open_global_with_other_settings_does_not_reuse_warm_client(self, mock_httpx_client: MagicMock) -> None:
+        HttpClient.open_global()
+        HttpClient.close_global(keep_warm=True)
+        HttpClient.configure(base_url="http://example.com")
+        HttpClient.open_global()
+
+        assert mock_httpx_client.call_count == 2
+        assert len(_warm_clients) == 1
+
     def test_close_global_unopened_does_not_close_global_client(self, mock_httpx_client: MagicMock) -> None:
         HttpClient.close_global()
 
         assert HttpClient._global_client is None
+        assert HttpClient._client is None
         mock_httpx_client.return_value.close.assert_not_called()
 
     def test_open_unopened_sets_local_client(self, mock_httpx_client: MagicMock) -> None:
@@ -665,6 +971,8 @@ class TestHttpClient:
             proxy=client.proxy,
             cert=client.cert,
             timeout=client.timeout,
+            limits=client.limits,
+            http2=client.http2,
         )
 
     def test_open_opened_does_not_set_local_client(self, mock_httpx_client: MagicMock) -> None:
@@ -682,8 +990,63 @@ class TestHttpClient:
             proxy=client.proxy,
             cert=client.cert,
             timeout=client.timeout,
+            limits=client.limits,
+            http2=client.http2,
         )
 
+    def test_open_closes_local_client_on_garbage_collection(self, mock_httpx_client: MagicMock) -> None:
+        client = HttpClient()
+        client.open()
+
+        del client
+        gc.collect()
+
+        mock_httpx_client.return_value.close.assert_called_once()
+
+    def test_open_with_cache_sets_local_client_with_cache_transport(
+        self, mocker: MockerFixture, mock_httpx_client: MagicMock
+    ) -> None:
+        mock_hishel = mocker.patch("clients.http.base.hishel")
+        mock_http_transport = mocker.patch("httpx.HTTPTransport")
+
+        client = HttpClient(cache=True)
+        client.open()
+
+        mock_http_transport.assert_called_once_with(
+            cert=client.cert, limits=client.limits, proxy=client.proxy, http2=client.http2
+        )
+        mock_hishel.CacheTransport.assert_called_once_with(
+            transport=mock_http_transport.return_value, storage=mock_hishel.InMemoryStorage.return_value
+        )
+        mock_httpx_client.assert_called_once_with(
+            base_url=client.base_url,
+            params=client.base_params,
+            headers=client.base_headers,
+            cookies=client.cookies,
+            auth=client.auth,
+            timeout=client.timeout,
+            transport=mock_hishel.CacheTransport.return_value,
+        )
+
+    def test_open_with_cache_storage_sets_local_client_with_cache_storage(
+        self, mocker: MockerFixture, mock_httpx_client: MagicMock
+    ) -> None:
+        mock_hishel = mocker.patch("clients.http.base.hishel")
+        mock_http_transport = mocker.patch("httpx.HTTPTransport")
+        mock_storage = MagicMock()
+
+        HttpClient(cache=mock_storage).open()
+
+        mock_hishel.CacheTransport.assert_called_once_with(
+            transport=mock_http_transport.return_value, storage=mock_storage
+        )
+
+    def test_open_with_cache_without_hishel_raises_error(self, mocker: MockerFixture) -> None:
+        mocker.patch("clients.http.base.hishel", None)
+
+        with pytest.raises(ImportError, match="hishel"):
+            HttpClient(cache=True).open()
+
     def test_close_opened_closes_local_client(self, mock_httpx_client: MagicMock) -> None:
         client = HttpClient()
         client.open()
@@ -699,27 +1062,33 @@ class TestHttpClient:
         assert client._local_client is None
         mock_httpx_client.return_value.close.assert_not_called()
 
-    def test_client_property_returns_global_client(self) -> None:
+    def test_client_returns_global_client(self) -> None:
         client = HttpClient()
         HttpClient.open_global()
 
         assert client._client is HttpClient._global_client
 
-    def test_client_property_returns_local_client(self) -> None:
+    def test_client_returns_local_client(self) -> None:
         client = HttpClient()
         client.open()
 
         assert client._client is client._local_client
 
-    def test_client_property_returns_local_client_over_global_client(self) -> None:
+    def test_client_returns_local_client_over_global_client(self) -> None:
         client = HttpClient()
         HttpClient.open_global()
         client.open()
 
         assert client._client is client._local_client
 
-    def test_client_property_opens_local_client_and_returns_it(self, mock_httpx_client: MagicMock) -> None:
+    def test_request_unopened_opens_local_client(self, mock_httpx_client: MagicMock) -> None:
+        original_request = Request("GET", "http://example.com")
+        original_response = Response(200, request=original_request)
+        original_response.elapsed = dt.timedelta(seconds=1)
+        mock_httpx_client.return_value.send.return_value = original_response
+
         client = HttpClient()
+        client.request("GET", "http://example.com")
 
         assert client._client is client._local_client
         mock_httpx_client.assert_called_once_with(
@@ -731,6 +1100,8 @@ class TestHttpClient:
             proxy=client.proxy,
             cert=client.cert,
             timeout=client.timeout,
+            limits=client.limits,
+            http2=client.http2,
         )
 
     def test_enter_opens_local_client_and_returns_self(self, mock_httpx_client: MagicMock) -> None:
@@ -748,8 +1119,10 @@ class TestHttpClient:
             proxy=client.proxy,
             cert=client.cert,
             timeout=client.timeout,
+            limits=client.limits,
+            http2=client.http2,
         )
-        mock_httpx_client.return_value.__enter__.assert_called_once()
+        mock_httpx_client.return_value.__enter__.assert_not_called()
 
     def test_exit_closes_local_client(self, mock_httpx_client: MagicMock) -> None:
         client = HttpClient()
@@ -758,12 +1131,13 @@ class TestHttpClient:
 
         assert client._local_client is not None
 
-        mock_httpx_client.return_value.__exit__.assert_called_once()
+        mock_httpx_client.return_value.__exit__.assert_not_called()
         mock_httpx_client.return_value.close.assert_called_once()
 
     def test_send_request_sends_request_and_returns_response(
         self, mocker: MockerFixture, mock_httpx_client: MagicMock
     ) -> None:
+        mocker.patch.object(http_clients_logger, "isEnabledFor", return_value=True)
         spy_request_log = mocker.spy(HttpClient, "request_log")
         spy_response_log = mocker.spy(HttpClient, "response_log")
 
@@ -786,8 +1160,57 @@ class TestHttpClient:
         assert response.origin is original_response
 
         mock_httpx_client.return_value.send.assert_called_once_with(original_request, auth=None)
-        spy_request_log.assert_called_once_with(client, request, details)
-        spy_response_log.assert_called_once_with(client, response, details)
+        spy_request_log.assert_called_once_with(client, request, details, target="GET http://example.com")
+        spy_response_log.assert_called_once_with(client, response, details, target="GET http://example.com")
+
+    def test_send_request_with_info_logs_disabled_does_not_build_logs(
+        self, mocker: MockerFixture, mock_httpx_client: MagicMock
+    ) -> None:
+        mocker.patch.object(http_clients_logger, "isEnabledFor", return_value=False)
+        spy_request_log = mocker.spy(HttpClient, "request_log")
+        spy_response_log = mocker.spy(HttpClient, "response_log")
+
+        original_request = Request("GET", "http://example.com")
+        mock_httpx_client.return_value.send.return_value = Response(200, request=original_request)
+
+        with HttpClient() as client:
+            client._send_request(EnhancedRequest(original_request), details={"request_label": "REQUEST-TEST"})
+
+        spy_request_log.assert_not_called()
+        spy_response_log.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("headers", "expected_content_type"),
+        [(None, "application/json"), ({"Content-Type": "application/vnd.api+json"}, "application/vnd.api+json")],
+    )
+    def test_request_encodes_json_body(self, headers: dict[str, str] | None, expected_content_type: str) -> None:
+        sent_requests = []
+        transport = httpx.MockTransport(lambda request: sent_requests.append(request) or Response(200))
+
+        # Mocked responses are never read, so their elapsed time isn't available.
+        client = HttpClient(response_log_config=HttpResponseLogConfig(response_elapsed_time=False))
+        client._local_client = client._client = httpx.Client(transport=transport)
+        client.post("http://example.com", headers=headers, json={"key": "value"})
+
+        assert sent_requests[0].content == b'{"key":"value"}'
+        assert sent_requests[0].headers["Content-Type"] == expected_content_type
+
+    @pytest.mark.parametrize(
+        ("json_body", "expected_content"),
+        [({1: "a"}, b'{"1":"a"}'), ({"n": 2**70}, b'{"n": 1180591620717411303424}')],
+    )
+    def test_request_encodes_json_body_orjson_rejects_by_default(
+        self, json_body: dict[Any, Any], expected_content: bytes
+    ) -> None:
+        sent_requests = []
+        transport = httpx.MockTransport(lambda request: sent_requests.append(request) or Response(200))
+
+        client = HttpClient(response_log_config=HttpResponseLogConfig(response_elapsed_time=False))
+        client._local_client = client._client = httpx.Client(transport=transport)
+        client.post("http://example.com", json=json_body)
+
+        assert sent_requests[0].content == expected_content
+        assert sent_requests[0].headers["Content-Type"] == "application/json"
 
     def test_request_sends_request_and_returns_response(self, mock_httpx_client: MagicMock) -> None:
         original_request = Request("GET", "http://example.com")
@@ -996,6 +1419,14 @@ class TestHttpClient:
         )
 
 
+class TestDefaultClient:
+    def test_is_http_client(self) -> None:
+        assert isinstance(default_client, HttpClient)
+
+    def test_does_not_open_local_client_on_import(self) -> None:
+        assert default_client._local_client is None
+
+
 class TestAsyncHttpClient:
     @pytest.fixture(autouse=True)
     def reset_class_attributes(self) -> Generator[None, None, None]:
@@ -1009,6 +1440,12 @@ class TestAsyncHttpClient:
         AsyncHttpClient.proxy = None
         AsyncHttpClient.cert = None
         AsyncHttpClient.timeout = 5.0
+        AsyncHttpClient.limits = httpx.Limits(
+            max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0
+        )
+        AsyncHttpClient.http2 = True
+        AsyncHttpClient.aiohttp_transport = False
+        AsyncHttpClient.cache = False
 
         AsyncHttpClient.retry_strategy = None
         AsyncHttpClient.request_log_config = HttpRequestLogConfig()
@@ -1017,6 +1454,7 @@ class TestAsyncHttpClient:
         AsyncHttpClient.broker_message_builder = None
 
         AsyncHttpClient._global_client = None
+        AsyncHttpClient._client = None
 
     @pytest.fixture
     def mock_httpx_async_client(self, mocker: MockerFixture) -> MockerFixture:
@@ -1034,6 +1472,12 @@ class TestAsyncHttpClient:
         assert AsyncHttpClient.proxy is None
         assert AsyncHttpClient.cert is None
         assert AsyncHttpClient.timeout == 5.0
+        assert AsyncHttpClient.limits == httpx.Limits(
+            max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0
+        )
+        assert AsyncHttpClient.http2 is True
+        assert AsyncHttpClient.aiohttp_transport is False
+        assert AsyncHttpClient.cache is False
 
         assert AsyncHttpClient.retry_strategy is None
         assert AsyncHttpClient.request_log_config == HttpRequestLogConfig()
@@ -1042,6 +1486,7 @@ class TestAsyncHttpClient:
         assert AsyncHttpClient.broker_message_builder is None
 
         assert AsyncHttpClient._global_client is None
+        assert AsyncHttpClient._client is None
 
     def test_configure_sets_only_specified_class_attributes(self) -> None:
         AsyncHttpClient.configure(
@@ -1058,6 +1503,12 @@ class TestAsyncHttpClient:
         assert AsyncHttpClient.proxy is None
         assert AsyncHttpClient.cert is None
         assert AsyncHttpClient.timeout == 5.0
+        assert AsyncHttpClient.limits == httpx.Limits(
+            max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0
+        )
+        assert AsyncHttpClient.http2 is True
+        assert AsyncHttpClient.aiohttp_transport is False
+        assert AsyncHttpClient.cache is False
 
         assert AsyncHttpClient.retry_strategy is None
         assert AsyncHttpClient.request_log_config == HttpRequestLogConfig()
@@ -1066,6 +1517,7 @@ class TestAsyncHttpClient:
         assert AsyncHttpClient.broker_message_builder is None
 
         assert AsyncHttpClient._global_client is None
+        assert AsyncHttpClient._client is None
 
     def test_init_sets_only_specified_instance_attributes(self) -> None:
         client = AsyncHttpClient(
@@ -1082,6 +1534,10 @@ class TestAsyncHttpClient:
         assert client.proxy is None
         assert client.cert is None
         assert client.timeout == 5.0
+        assert client.limits == httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0)
+        assert client.http2 is True
+        assert client.aiohttp_transport is False
+        assert client.cache is False
 
         assert client.retry_strategy is None
         assert client.request_log_config == HttpRequestLogConfig()
@@ -1090,6 +1546,7 @@ class TestAsyncHttpClient:
         assert client.broker_message_builder is None
 
         assert client._global_client is None
+        assert client._client is None
         assert client._local_client is None
 
     def test_open_global_unopened_sets_global_client(self, mock_httpx_async_client: MagicMock) -> None:
@@ -1105,6 +1562,8 @@ class TestAsyncHttpClient:
             proxy=AsyncHttpClient.proxy,
             cert=AsyncHttpClient.cert,
             timeout=AsyncHttpClient.timeout,
+            limits=AsyncHttpClient.limits,
+            http2=AsyncHttpClient.http2,
         )
 
     def test_open_global_opened_does_not_set_global_client(self, mock_httpx_async_client: MagicMock) -> None:
@@ -1121,8 +1580,80 @@ class TestAsyncHttpClient:
             proxy=AsyncHttpClient.proxy,
             cert=AsyncHttpClient.cert,
             timeout=AsyncHttpClient.timeout,
+            limits=AsyncHttpClient.limits,
+            http2=AsyncHttpClient.http2,
         )
 
+    def test_open_with_aiohttp_transport_sets_local_client_with_aiohttp_transport(
+        self, mocker: MockerFixture, mock_httpx_async_client: MagicMock
+    ) -> None:
+        mock_aiohttp_transport = mocker.patch("clients.http.base.AiohttpTransport")
+
+        client = AsyncHttpClient(aiohttp_transport=True)
+        client.open()
+
+        mock_aiohttp_transport.assert_called_once_with(cert=client.cert, limits=client.limits, proxy=None)
+        mock_httpx_async_client.assert_called_once_with(
+            base_url=client.base_url,
+            params=client.base_params,
+            headers=client.base_headers,
+            cookies=client.cookies,
+            auth=client.auth,
+            timeout=client.timeout,
+            transport=mock_aiohttp_transport.return_value,
+        )
+
+    def test_open_with_aiohttp_transport_without_httpx_aiohttp_raises_error(self, mocker: MockerFixture) -> None:
+        mocker.patch("clients.http.base.AiohttpTransport", None)
+
+        with pytest.raises(ImportError, match="httpx-aiohttp"):
+            AsyncHttpClient(aiohttp_transport=True).open()
+
+    def test_open_with_cache_sets_local_client_with_cache_transport(
+        self, mocker: MockerFixture, mock_httpx_async_client: MagicMock
+    ) -> None:
+        mock_hishel = mocker.patch("clients.http.base.hishel")
+        mock_http_transport = mocker.patch("httpx.AsyncHTTPTransport")
+
+        client = AsyncHttpClient(cache=True)
+        client.open()
+
+        mock_http_transport.assert_called_once_with(
+            cert=client.cert, limits=client.limits, proxy=client.proxy, http2=client.http2
+        )
+        mock_hishel.AsyncCacheTransport.assert_called_once_with(
+            transport=mock_http_transport.return_value, storage=mock_hishel.AsyncInMemoryStorage.return_value
+        )
+        mock_httpx_async_client.assert_called_once_with(
+            base_url=client.base_url,
+            params=client.base_params,
+            headers=client.base_headers,
+            cookies=client.cookies,
+            auth=client.auth,
+            timeout=client.timeout,
+            transport=mock_hishel.AsyncCacheTransport.return_value,
+        )
+
+    def test_open_with_cache_and_aiohttp_transport_caches_aiohttp_transport(
+        self, mocker: MockerFixture, mock_httpx_async_client: MagicMock
+    ) -> None:
+        mock_hishel = mocker.patch("clients.http.base.hishel")
+        mock_aiohttp_transport = mocker.patch("clients.http.base.AiohttpTransport")
+        mock_storage = MagicMock()
+
+        AsyncHttpClient(cache=mock_storage, aiohttp_transport=True).open()
+
+        mock_hishel.AsyncCacheTransport.assert_called_once_with(
+            transport=mock_aiohttp_transport.return_value, storage=mock_storage
+        )
+        assert mock_httpx_async_client.call_args.kwargs["transport"] == mock_hishel.AsyncCacheTransport.return_value
+
+    def test_open_with_cache_without_hishel_raises_error(self, mocker: MockerFixture) -> None:
+        mocker.patch("clients.http.base.hishel", None)
+
+        with pytest.raises(ImportError, match="hishel"):
+            AsyncHttpClient(cache=True).open()
+
     @pytest.mark.asyncio
     async def test_close_global_opened_closes_global_client(self, mock_httpx_async_client: MagicMock) -> None:
         AsyncHttpClient.open_global()
@@ -1136,6 +1667,7 @@ class TestAsyncHttpClient:
         await AsyncHttpClient.close_global()
 
         assert AsyncHttpClient._global_client is None
+        assert AsyncHttpClient._client is None
         mock_httpx_async_client.return_value.aclose.assert_not_called()
 
     def test_open_unopened_sets_local_client(self, mock_httpx_async_client: MagicMock) -> None:
@@ -1152,6 +1684,8 @@ class TestAsyncHttpClient:
             proxy=client.proxy,
             cert=client.cert,
             timeout=client.timeout,
+            limits=client.limits,
+            http2=client.http2,
         )
 
     def test_open_opened_does_not_set_local_client(self, mock_httpx_async_client: MagicMock) -> None:
@@ -1169,6 +1703,8 @@ class TestAsyncHttpClient:
             proxy=client.proxy,
             cert=client.cert,
             timeout=client.timeout,
+            limits=client.limits,
+            http2=client.http2,
         )
 
     @pytest.mark.asyncio
@@ -1180,6 +1716,15 @@ class TestAsyncHttpClient:
         assert client._local_client is not None
         mock_httpx_async_client.return_value.aclose.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_close_flushes_broker_messages(self, mocker: MockerFixture) -> None:
+        client = AsyncHttpClient()
+        mock_flush = mocker.patch.object(client, "flush")
+
+        await client.close()
+
+        mock_flush.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_close_unopened_does_not_close_local_client(self, mock_httpx_async_client: MagicMock) -> None:
         client = AsyncHttpClient()
@@ -1188,27 +1733,34 @@ class TestAsyncHttpClient:
         assert client._local_client is None
         mock_httpx_async_client.return_value.aclose.assert_not_called()
 
-    def test_client_property_returns_global_client(self) -> None:
+    def test_client_returns_global_client(self) -> None:
         client = AsyncHttpClient()
         AsyncHttpClient.open_global()
 
         assert client._client is AsyncHttpClient._global_client
 
-    def test_client_property_returns_local_client(self) -> None:
+    def test_client_returns_local_client(self) -> None:
         client = AsyncHttpClient()
         client.open()
 
         assert client._client is client._local_client
 
-    def test_client_property_returns_local_client_over_global_client(self) -> None:
+    def test_client_returns_local_client_over_global_client(self) -> None:
         client = AsyncHttpClient()
         AsyncHttpClient.open_global()
         client.open()
 
         assert client._client is client._local_client
 
-    def test_client_property_opens_local_client_and_returns_it(self, mock_httpx_async_client: MagicMock) -> None:
+    @pytest.mark.asyncio
+    async def test_request_unopened_opens_local_client(self, mock_httpx_async_client: MagicMock) -> None:
+        original_request = Request("GET", "http://example.com")
+        original_response = Response(200, request=original_request)
+        original_response.elapsed = dt.timedelta(seconds=1)
+        mock_httpx_async_client.return_value.send.return_value = original_response
+
         client = AsyncHttpClient()
+        await client.request("GET", "http://example.com")
 
         assert client._client is client._local_client
         mock_httpx_async_client.assert_called_once_with(
@@ -1220,6 +1772,8 @@ class TestAsyncHttpClient:
             proxy=client.proxy,
             cert=client.cert,
             timeout=client.timeout,
+            limits=client.limits,
+            http2=client.http2,
         )
 
     @pytest.mark.asyncio
@@ -1238,8 +1792,10 @@ class TestAsyncHttpClient:
             proxy=client.proxy,
             cert=client.cert,
             timeout=client.timeout,
+            limits=client.limits,
+            http2=client.http2,
         )
-        mock_httpx_async_client.return_value.__aenter__.assert_called_once()
+        mock_httpx_async_client.return_value.__aenter__.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_aexit_closes_local_client(self, mock_httpx_async_client: MagicMock) -> None:
@@ -1249,13 +1805,14 @@ class TestAsyncHttpClient:
 
         assert client._local_client is not None
 
-        mock_httpx_async_client.return_value.__aexit__.assert_called_once()
+        mock_httpx_async_client.return_value.__aexit__.assert_not_called()
         mock_httpx_async_client.return_value.aclose.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_send_request_sends_request_and_returns_response(
         self, mocker: MockerFixture, mock_httpx_async_client: MagicMock
     ) -> None:
+        mocker.patch.object(http_clients_logger, "isEnabledFor", return_value=True)
         spy_request_log = mocker.spy(AsyncHttpClient, "request_log")
         spy_response_log = mocker.spy(AsyncHttpClient, "response_log")
 
@@ -1278,8 +1835,56 @@ class TestAsyncHttpClient:
         assert response.origin is original_response
 
         mock_httpx_async_client.return_value.send.assert_called_once_with(original_request, auth=None)
-        spy_request_log.assert_called_once_with(client, request, details)
-        spy_response_log.assert_called_once_with(client, response, details)
+        spy_request_log.assert_called_once_with(client, request, details, target="GET http://example.com")
+        spy_response_log.assert_called_once_with(client, response, details, target="GET http://example.com")
+
+    @pytest.mark.asyncio
+    async def test_send_request_with_info_logs_disabled_does_not_build_logs(
+        self, mocker: MockerFixture, mock_httpx_async_client: MagicMock
+    ) -> None:
+        mocker.patch.object(http_clients_logger, "isEnabledFor", return_value=False)
+        spy_request_log = mocker.spy(AsyncHttpClient, "request_log")
+        spy_response_log = mocker.spy(AsyncHttpClient, "response_log")
+
+        original_request = Request("GET", "http://example.com")
+        mock_httpx_async_client.return_value.send.return_value = Response(200, request=original_request)
+
+        async with AsyncHttpClient() as client:
+            await client._send_request(EnhancedRequest(original_request), details={"request_label": "REQUEST-TEST"})
+
+        spy_request_log.assert_not_called()
+        spy_response_log.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_request_encodes_json_body(self) -> None:
+        sent_requests = []
+        transport = httpx.MockTransport(lambda request: sent_requests.append(request) or Response(200))
+
+        # Mocked responses are never read, so their elapsed time isn't available.
+        client = AsyncHttpClient(response_log_config=HttpResponseLogConfig(response_elapsed_time=False))
+        client._local_client = client._client = httpx.AsyncClient(transport=transport)
+        await client.post("http://example.com", json={"key": "value"})
+
+        assert sent_requests[0].content == b'{"key":"value"}'
+        assert sent_requests[0].headers["Content-Type"] == "application/json"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("json_body", "expected_content"),
+        [({1: "a"}, b'{"1":"a"}'), ({"n": 2**70}, b'{"n": 1180591620717411303424}')],
+    )
+    async def test_request_encodes_json_body_orjson_rejects_by_default(
+        self, json_body: dict[Any, Any], expected_content: bytes
+    ) -> None:
+        sent_requests = []
+        transport = httpx.MockTransport(lambda request: sent_requests.append(request) or Response(200))
+
+        client = AsyncHttpClient(response_log_config=HttpResponseLogConfig(response_elapsed_time=False))
+        client._local_client = client._client = httpx.AsyncClient(transport=transport)
+        await client.post("http://example.com", json=json_body)
+
+        assert sent_requests[0].content == expected_content
+        assert sent_requests[0].headers["Content-Type"] == "application/json"
 
     @pytest.mark.asyncio
     async def test_request_sends_request_and_returns_response(self, mock_httpx_async_client: MagicMock) -> None:
@@ -1314,7 +1919,7 @@ class TestAsyncHttpClient:
 
     @pytest.mark.asyncio
     async def test_request_with_broker_client_sends_message_to_broker_and_returns_response(
-        self, mock_httpx_async_client: MagicMock
+        self, mocker: MockerFixture, mock_httpx_async_client: MagicMock
     ) -> None:
         original_request = Request("GET", "http://example.com")
         original_response = Response(200, request=original_request)
@@ -1322,19 +1927,177 @@ class TestAsyncHttpClient:
         mock_httpx_async_client.return_value.send.return_value = original_response
 
         mock_broker_client = AsyncMock(spec=AsyncBrokerClient)
-        mock_broker_message_builder = AsyncMock(spec=BrokerHttpMessageBuilder)
-        mock_broker_message_builder.build.return_value = "message"
+        broker_message_builder = SampleBrokerHttpMessageBuilder()
+        spy_filter = mocker.spy(broker_message_builder, "filter")
 
         async with AsyncHttpClient(
-            broker_client=mock_broker_client, broker_message_builder=mock_broker_message_builder
+            broker_client=mock_broker_client, broker_message_builder=broker_message_builder
         ) as client:
             response = await client.request("GET", "http://example.com")
 
         assert isinstance(response, EnhancedResponse)
         assert response.origin is original_response
 
-        mock_broker_message_builder.build.assert_called_once()
-        mock_broker_client.send_message.assert_called_once_with(message="message")
+        spy_filter.assert_called_once()
+        mock_broker_client.send_message.assert_awaited_once_with(
+            message=BrokerMessage(metadata={"key": "value"}, body="body")
+        )
+
+    @pytest.mark.asyncio
+    async def test_request_with_broker_message_builder_overriding_build_uses_build(
+        self, mock_httpx_async_client: MagicMock
+    ) -> None:
+        class CustomBrokerHttpMessageBuilder(SampleBrokerHttpMessageBuilder):
+            def build(
+                self, request: EnhancedRequest, response: EnhancedResponse, details: DetailsType
+            ) -> BrokerMessage | None:
+                return BrokerMessage(metadata=None, body="custom")
+
+        original_request = Request("GET", "http://example.com")
+        original_response = Response(200, request=original_request)
+        original_response.elapsed = dt.timedelta(seconds=1)
+        mock_httpx_async_client.return_value.send.return_value = original_response
+
+        mock_broker_client = AsyncMock(spec=AsyncBrokerClient)
+
+        async with AsyncHttpClient(
+            broker_client=mock_broker_client, broker_message_builder=CustomBrokerHttpMessageBuilder()
+        ) as client:
+            await client.request("GET", "http://example.com")
+
+        mock_broker_client.send_message.assert_awaited_once_with(message=BrokerMessage(metadata=None, body="custom"))
+
+    @pytest.mark.asyncio
+    async def test_request_with_broker_client_returns_response_before_message_is_sent(
+        self, mock_httpx_async_client: MagicMock
+    ) -> None:
+        original_request = Request("GET", "http://example.com")
+        original_response = Response(200, request=original_request)
+        original_response.elapsed = dt.timedelta(seconds=1)
+        mock_httpx_async_client.return_value.send.return_value = original_response
+
+        broker_available = asyncio.Event()
+        message_sent = asyncio.Event()
+
+        async def send_message(**_: Any) -> None:
+            await broker_available.wait()
+            message_sent.set()
+
+        mock_broker_client = AsyncMock(spec=AsyncBrokerClient)
+        mock_broker_client.send_message.side_effect = send_message
+        mock_broker_message_builder = AsyncMock(spec=BrokerHttpMessageBuilder)
+
+        client = AsyncHttpClient(broker_client=mock_broker_client, broker_message_builder=mock_broker_message_builder)
+        response = await client.request("GET", "http://example.com")
+
+        assert response.origin is original_response
+        assert not message_sent.is_set()
+
+        broker_available.set()
+        await client.close()
+
+        assert message_sent.is_set()
+        assert not client._broker_tasks
+
+    @pytest.mark.asyncio
+    async def test_flush_waits_only_for_own_broker_messages(self, mock_httpx_async_client: MagicMock) -> None:
+        original_request = Request("GET", "http://example.com")
+        original_response = Response(200, request=original_request)
+        original_response.elapsed = dt.timedelta(seconds=1)
+        mock_httpx_async_client.return_value.send.return_value = original_response
+
+        broker_available = asyncio.Event()
+
+        async def send_message(**_: Any) -> None:
+            await broker_available.wait()
+
+        mock_broker_client = AsyncMock(spec=AsyncBrokerClient)
+        mock_broker_client.send_message.side_effect = send_message
+        mock_broker_message_builder = AsyncMock(spec=BrokerHttpMessageBuilder)
+
+        client = AsyncHttpClient(broker_client=mock_broker_client, broker_message_builder=mock_broker_message_builder)
+        other_client = AsyncHttpClient()
+        await client.request("GET", "http://example.com")
+
+        await asyncio.wait_for(other_client.flush(), timeout=1)
+
+        assert client._broker_tasks
+        assert not other_client._broker_tasks
+
+        broker_available.set()
+        await client.flush()
+
+        assert not client._broker_tasks
+
+    @pytest.mark.asyncio
+    async def test_request_with_failing_broker_client_logs_error(
+        self, mocker: MockerFixture, mock_httpx_async_client: MagicMock
+    ) -> None:
+        mock_logger_error = mocker.patch.object(http_clients_logger, "error")
+
+        original_request = Request("GET", "http://example.com")
+        original_response = Response(200, request=original_request)
+        original_response.elapsed = dt.timedelta(seconds=1)
+        mock_httpx_async_client.return_value.send.return_value = original_response
+
+        error = Exception("Broker is unavailable")
+        mock_broker_client = AsyncMock(spec=AsyncBrokerClient)
+        mock_broker_client.send_message.side_effect = error
+        mock_broker_message_builder = AsyncMock(spec=BrokerHttpMessageBuilder)
+
+        async with AsyncHttpClient(
+            broker_client=mock_broker_client, broker_message_builder=mock_broker_message_builder
+        ) as client:
+            await client.request("GET", "http://example.com")
+
+        mock_logger_error.assert_called_once_with("Failed to send HTTP request message to broker", exc_info=error)
+
+    @pytest.mark.asyncio
+    async def test_request_with_broker_client_builds_message_outside_event_loop_thread(
+        self, mock_httpx_async_client: MagicMock
+    ) -> None:
+        original_request = Request("GET", "http://example.com")
+        original_response = Response(200, request=original_request)
+        original_response.elapsed = dt.timedelta(seconds=1)
+        mock_httpx_async_client.return_value.send.return_value = original_response
+
+        build_threads = []
+        mock_broker_client = AsyncMock(spec=AsyncBrokerClient)
+        mock_broker_message_builder = AsyncMock(spec=BrokerHttpMessageBuilder)
+        mock_broker_message_builder.build_unfiltered.side_effect = lambda *_: build_threads.append(
+            threading.current_thread()
+        )
+
+        async with AsyncHttpClient(
+            broker_client=mock_broker_client, broker_message_builder=mock_broker_message_builder
+        ) as client:
+            await client.request("GET", "http://example.com")
+
+        assert len(build_threads) == 1
+        assert build_threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_request_with_filtered_out_broker_message_does_not_build_message(
+        self, mock_httpx_async_client: MagicMock
+    ) -> None:
+        original_request = Request("GET", "http://example.com")
+        original_response = Response(200, request=original_request)
+        original_response.elapsed = dt.timedelta(seconds=1)
+        mock_httpx_async_client.return_value.send.return_value = original_response
+
+        mock_broker_client = AsyncMock(spec=AsyncBrokerClient)
+        mock_broker_message_builder = AsyncMock(spec=BrokerHttpMessageBuilder)
+        mock_broker_message_builder.filter.return_value = False
+
+        async with AsyncHttpClient(
+            broker_client=mock_broker_client, broker_message_builder=mock_broker_message_builder
+        ) as client:
+            await client.request("GET", "http://example.com")
+
+        assert not client._broker_tasks
+        mock_broker_message_builder.build.assert_not_called()
+        mock_broker_message_builder.build_unfiltered.assert_not_called()
+        mock_broker_client.send_message.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_sends_get_request_and_returns_response(
@@ -0,0 +1,21 @@
+import httpx
+import pytest
+
+import clients.http
+from clients.http.base import HttpClient
+from clients.http.supplier import SupplierClient
+
+
+class TestLazyImports:
+    def test_exports_names_from_their_modules(self) -> None:
+        assert clients.http.Auth is httpx.Auth
+        assert clients.http.HttpClient is HttpClient
+        assert clients.http.SupplierClient is SupplierClient
+
+    def test_all_names_are_importable(self) -> None:
+        for name in clients.http.__all__:
+            assert getattr(clients.http, name) is not None
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+            clients.http.Unknown  # noqa: B018
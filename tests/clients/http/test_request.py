@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import pytest
 
 from clients.http.request import EnhancedRequest, Request
@@ -12,6 +14,9 @@ class TestEnhancedRequest:
     def sample_enhanced_request(self, sample_request: Request) -> EnhancedRequest:
         return EnhancedRequest(sample_request)
 
+    def test_has_no_instance_dict(self, sample_enhanced_request: EnhancedRequest) -> None:
+        assert not hasattr(sample_enhanced_request, "__dict__")
+
     def test_origin_property(self, sample_request: Request, sample_enhanced_request: EnhancedRequest) -> None:
         assert sample_enhanced_request.origin == sample_request
 
@@ -21,6 +26,9 @@ class TestEnhancedRequest:
     def test_url_property(self, sample_request: Request, sample_enhanced_request: EnhancedRequest) -> None:
         assert sample_enhanced_request.url == str(sample_request.url)
 
+    def test_url_property_is_cached(self, sample_enhanced_request: EnhancedRequest) -> None:
+        assert sample_enhanced_request.url is sample_enhanced_request.url
+
     def test_headers_property(self, sample_request: Request, sample_enhanced_request: EnhancedRequest) -> None:
         assert sample_enhanced_request.headers == dict(sample_request.headers)
 
@@ -29,3 +37,15 @@ class TestEnhancedRequest:
 
     def test_text_property(self, sample_request: Request, sample_enhanced_request: EnhancedRequest) -> None:
         assert sample_enhanced_request.text == sample_request.content.decode()
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({}, None),
+            ({"Content-Type": "application/xml"}, None),
+            ({"Content-Type": "application/xml; charset=UTF-16"}, "utf-16"),
+            ({"Content-Type": 'text/xml; charset="windows-1252"'}, "windows-1252"),
+        ],
+    )
+    def test_charset_property(self, headers: dict[str, str], expected: str | None) -> None:
+        assert EnhancedRequest(Request("POST", "https://httpbin.org/post", headers=headers)).charset == expected
@@ -1,4 +1,5 @@
 import datetime as dt
+import math
 
 import pytest
 from pytest_mock import MockerFixture
@@ -18,6 +19,9 @@ class TestEnhancedResponse:
     def sample_enhanced_response(self, sample_response: Response) -> EnhancedResponse:
         return EnhancedResponse(sample_response)
 
+    def test_has_no_instance_dict(self, sample_enhanced_response: EnhancedResponse) -> None:
+        assert not hasattr(sample_enhanced_response, "__dict__")
+
     def test_origin_property(self, sample_response: Response, sample_enhanced_response: EnhancedResponse) -> None:
         assert sample_enhanced_response.origin == sample_response
 
@@ -30,6 +34,39 @@ class TestEnhancedResponse:
     def test_cookies_property(self, sample_response: Response, sample_enhanced_response: EnhancedResponse) -> None:
         assert sample_enhanced_response.cookies == dict(sample_response.cookies)
 
+    def test_get_header(self) -> None:
+        enhanced_response = EnhancedResponse(Response(200, headers={"Content-Type": "application/json"}))
+
+        assert enhanced_response.get_header("content-type") == "application/json"
+        assert enhanced_response.get_header("X-Missing") is None
+        assert enhanced_response.get_header("X-Missing", "default") == "default"
+
+    def test_headers_property_is_cached(self, sample_enhanced_response: EnhancedResponse) -> None:
+        headers = sample_enhanced_response.headers
+
+        assert sample_enhanced_response._headers == headers
+        assert sample_enhanced_response._headers is not headers
+
+    def test_cookies_property_is_cached(self, sample_enhanced_response: EnhancedResponse) -> None:
+        cookies = sample_enhanced_response.cookies
+
+        assert sample_enhanced_response._cookies == cookies
+        assert sample_enhanced_response._cookies is not cookies
+
+    def test_headers_property_returns_copies(self, sample_enhanced_response: EnhancedResponse) -> None:
+        headers = sample_enhanced_response.headers
+        headers["X-Test"] = "value"
+
+        assert type(headers) is dict
+        assert "X-Test" not in sample_enhanced_response.headers
+
+    def test_cookies_property_returns_copies(self, sample_enhanced_response: EnhancedResponse) -> None:
+        cookies = sample_enhanced_response.cookies
+        cookies["test"] = "value"
+
+        assert type(cookies) is dict
+        assert "test" not in sample_enhanced_response.cookies
+
     def test_request_property(self, sample_response: Response, sample_enhanced_response: EnhancedResponse) -> None:
         assert sample_enhanced_response.request == sample_response.request
 
@@ -64,12 +101,45 @@ class TestEnhancedResponse:
     def test_text_property(self, sample_response: Response, sample_enhanced_response: EnhancedResponse) -> None:
         assert sample_enhanced_response.text == sample_response.text
 
-    def test_json(
+    def test_iter_text(self) -> None:
+        enhanced_response = EnhancedResponse(Response(200, text="abcde"))
+
+        assert list(enhanced_response.iter_text(chunk_size=2)) == ["ab", "cd", "e"]
+
+    def test_json(self) -> None:
+        enhanced_response = EnhancedResponse(Response(200, json={"key": ["value", 1, None]}))
+
+        assert enhanced_response.json() == {"key": ["value", 1, None]}
+
+    def test_json_with_kwargs(
         self, mocker: MockerFixture, sample_response: Response, sample_enhanced_response: EnhancedResponse
     ) -> None:
         mock_sample_response_json = mocker.patch.object(sample_response, "json")
-        sample_enhanced_response.json()
-        mock_sample_response_json.assert_called_once()
+        sample_enhanced_response.json(parse_float=str)
+        mock_sample_response_json.assert_called_once_with(parse_float=str)
+
+    def test_json_with_big_integer_keeps_precision(self) -> None:
+        enhanced_response = EnhancedResponse(Response(200, content=b'{"id": 123456789012345678901234567890}'))
+
+        assert enhanced_response.json() == {"id": 123456789012345678901234567890}
+
+    def test_json_with_nan_and_infinity(self) -> None:
+        enhanced_response = EnhancedResponse(Response(200, content=b'{"nan": NaN, "inf": Infinity}'))
+
+        result = enhanced_response.json()
+
+        assert math.isnan(result["nan"])
+        assert result["inf"] == math.inf
+
+    @pytest.mark.parametrize("encoding", ["utf-16", "utf-32"])
+    def test_json_with_non_utf8_body(self, encoding: str) -> None:
+        enhanced_response = EnhancedResponse(Response(200, content='{"key": "välue"}'.encode(encoding)))
+
+        assert enhanced_response.json() == {"key": "välue"}
+
+    def test_json_invalid_body_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):  # noqa: PT011
+            EnhancedResponse(Response(200, content=b"not json")).json()
 
     def test_xml(self, mocker: MockerFixture, sample_enhanced_response: EnhancedResponse) -> None:
         mock_xmltodict_parse = mocker.patch("xmltodict.parse")
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import base64
 import datetime as dt
+import json
+import zlib
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
@@ -140,11 +143,58 @@ class TestSQSSupplierMessageBuilder:
         except Exception:
             pytest.fail("Invalid TimeStamp")
 
+    def test_build_metadata_formats_utc_timestamp(
+        self, mocker: MockerFixture, sample_request: EnhancedRequest, sample_response: EnhancedResponse
+    ) -> None:
+        mocker.patch("time.time", return_value=0.5)
+        details = {"request_label": "REQUEST-TEST", "supplier_label": "SUPPLIER-LABEL", "trace_id": "123"}
+
+        result = SQSSupplierMessageBuilder().build_metadata(sample_request, sample_response, details)
+
+        assert result["TimeStamp"]["StringValue"] == "1970-01-01 00:00:00"
+
     def test_build_body(
         self, sample_request: EnhancedRequest, sample_response: EnhancedResponse, sample_details: DetailsType
     ) -> None:
         result = SQSSupplierMessageBuilder().build_body(sample_request, sample_response, sample_details)
-        assert result == '{"request": "eJwDAAAAAAE=", "response": "eJwDAAAAAAE="}'
+        assert result == '{"request":"eAEDAAAAAAE=","response":"eAEDAAAAAAE="}'
+
+    def test_build_body_with_compression_level(
+        self, sample_request: EnhancedRequest, sample_response: EnhancedResponse, sample_details: DetailsType
+    ) -> None:
+        result = SQSSupplierMessageBuilder(compression_level=6).build_body(
+            sample_request, sample_response, sample_details
+        )
+        assert result == '{"request":"eJwDAAAAAAE=","response":"eJwDAAAAAAE="}'
+
+    def test_build_body_masks_sensitive_request_data(
+        self, sample_response: EnhancedResponse, sample_details: DetailsType
+    ) -> None:
+        request = EnhancedRequest(
+            Request("POST", "http://example.com", content=b'<Card CardNumber="123456789" SeriesCode="123"/>')
+        )
+
+        result = SQSSupplierMessageBuilder().build_body(request, sample_response, sample_details)
+
+        masked_request = zlib.decompress(base64.b64decode(json.loads(result)["request"]))
+        assert masked_request == b'<Card CardNumber="*****6789" SeriesCode="***"/>'
+
+    def test_build_body_masks_sensitive_request_data_in_request_charset(
+        self, sample_response: EnhancedResponse, sample_details: DetailsType
+    ) -> None:
+        request = EnhancedRequest(
+            Request(
+                "POST",
+                "http://example.com",
+                headers={"Content-Type": "application/xml; charset=utf-16"},
+                content='<Card CardNumber="123456789" SeriesCode="123"/>'.encode("utf-16"),
+            )
+        )
+
+        result = SQSSupplierMessageBuilder().build_body(request, sample_response, sample_details)
+
+        masked_request = zlib.decompress(base64.b64decode(json.loads(result)["request"]))
+        assert masked_request.decode("utf-16") == '<Card CardNumber="*****6789" SeriesCode="***"/>'
 
 
 class SampleSupplierClient(SupplierClientBase):
@@ -310,6 +360,18 @@ class TestSupplierClientBase:
 
         assert extra == expected_extra
 
+    def test_request_log_message(self, sample_request: EnhancedRequest, sample_details: DetailsType) -> None:
+        message, _ = SampleSupplierClient().request_log(sample_request, sample_details)
+
+        assert message == "Sending HTTP request [REQUEST-TEST] to [SUPPLIER-LABEL] supplier: GET http://example.com"
+
+    def test_response_log_message(self, sample_response: EnhancedResponse, sample_details: DetailsType) -> None:
+        message, _ = SampleSupplierClient().response_log(sample_response, sample_details)
+
+        assert message == (
+            "HTTP response received [REQUEST-TEST] from [SUPPLIER-LABEL] supplier: GET http://example.com -> 200"
+        )
+
 
 class TestSupplierClient:
     @pytest.fixture(autouse=True)
@@ -327,6 +389,9 @@ class TestSupplierClient:
         SupplierClient.proxy = None
         SupplierClient.cert = None
         SupplierClient.timeout = 5.0
+        SupplierClient.limits = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0)
+        SupplierClient.http2 = True
+        SupplierClient.cache = False
 
         SupplierClient.retry_strategy = None
         SupplierClient.request_log_config = SupplierRequestLogConfig()
@@ -335,6 +400,9 @@ class TestSupplierClient:
         SupplierClient.broker_message_builder = None
 
         SupplierClient._global_client = None
+        SupplierClient._global_client_key = None
+        SupplierClient._close_global_registered = False
+        SupplierClient._client = None
 
     @pytest.fixture
     def mock_httpx_client(self, mocker: MockerFixture) -> MockerFixture:
@@ -364,6 +432,11 @@ class TestSupplierClient:
         assert SupplierClient.proxy is None
         assert SupplierClient.cert is None
         assert SupplierClient.timeout == 5.0
+        assert SupplierClient.limits == httpx.Limits(
+            max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0
+        )
+        assert SupplierClient.http2 is True
+        assert SupplierClient.cache is False
 
         assert SupplierClient.retry_strategy is None
         assert SupplierClient.request_log_config == SupplierRequestLogConfig()
@@ -372,6 +445,9 @@ class TestSupplierClient:
         assert SupplierClient.broker_message_builder is None
 
         assert SupplierClient._global_client is None
+        assert SupplierClient._global_client_key is None
+        assert SupplierClient._close_global_registered is False
+        assert SupplierClient._client is None
 
     def test_init_sets_only_specified_instance_attributes(self) -> None:
         client = SupplierClient(
@@ -391,6 +467,9 @@ class TestSupplierClient:
         assert client.proxy is None
         assert client.cert is None
         assert client.timeout == 5.0
+        assert client.limits == httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0)
+        assert client.http2 is True
+        assert client.cache is False
 
         assert client.retry_strategy is None
         assert client.request_log_config == SupplierRequestLogConfig()
@@ -399,6 +478,7 @@ class TestSupplierClient:
         assert client.broker_message_builder is None
 
         assert client._global_client is None
+        assert client._client is None
         assert client._local_client is None
 
     def test_request_sends_request_and_returns_response(
@@ -419,6 +499,24 @@ class TestSupplierClient:
 
         spy_tracer_trace.assert_called_once()
 
+    def test_request_within_active_trace_uses_its_trace_id(
+        self, mocker: MockerFixture, mock_httpx_client: MagicMock
+    ) -> None:
+        original_request = Request("GET", "http://example.com")
+        original_response = Response(200, request=original_request)
+        original_response.elapsed = dt.timedelta(seconds=1)
+        mock_httpx_client.return_value.send.return_value = original_response
+
+        details = {"order_id": "123"}
+        with tracer.trace("parent") as parent_span:
+            spy_tracer_trace = mocker.spy(tracer, "trace")
+
+            with SupplierClient() as client:
+                client.request("GET", "http://example.com", details=details)
+
+        assert details["trace_id"] == parent_span.trace_id
+        spy_tracer_trace.assert_not_called()
+
     def test_get_sends_get_request_and_returns_response(
         self, mocker: MockerFixture, mock_httpx_client: MagicMock
     ) -> None:
@@ -594,6 +692,12 @@ class TestAsyncSupplierClient:
         AsyncSupplierClient.proxy = None
         AsyncSupplierClient.cert = None
         AsyncSupplierClient.timeout = 5.0
+        AsyncSupplierClient.limits = httpx.Limits(
+            max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0
+        )
+        AsyncSupplierClient.http2 = True
+        AsyncSupplierClient.aiohttp_transport = False
+        AsyncSupplierClient.cache = False
 
         AsyncSupplierClient.retry_strategy = None
         AsyncSupplierClient.request_log_config = SupplierRequestLogConfig()
@@ -602,6 +706,7 @@ class TestAsyncSupplierClient:
         AsyncSupplierClient.broker_message_builder = None
 
         AsyncSupplierClient._global_client = None
+        AsyncSupplierClient._client = None
 
     @pytest.fixture
     def mock_httpx_async_client(self, mocker: MockerFixture) -> MockerFixture:
@@ -631,6 +736,12 @@ class TestAsyncSupplierClient:
         assert AsyncSupplierClient.proxy is None
         assert AsyncSupplierClient.cert is None
         assert AsyncSupplierClient.timeout == 5.0
+        assert AsyncSupplierClient.limits == httpx.Limits(
+            max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0
+        )
+        assert AsyncSupplierClient.http2 is True
+        assert AsyncSupplierClient.aiohttp_transport is False
+        assert AsyncSupplierClient.cache is False
 
         assert AsyncSupplierClient.retry_strategy is None
         assert AsyncSupplierClient.request_log_config == SupplierRequestLogConfig()
@@ -639,6 +750,7 @@ class TestAsyncSupplierClient:
         assert AsyncSupplierClient.broker_message_builder is None
 
         assert AsyncSupplierClient._global_client is None
+        assert AsyncSupplierClient._client is None
 
     def test_init_sets_only_specified_instance_attributes(self) -> None:
         client = AsyncSupplierClient(
@@ -658,6 +770,10 @@ class TestAsyncSupplierClient:
         assert client.proxy is None
         assert client.cert is None
         assert client.timeout == 5.0
+        assert client.limits == httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0)
+        assert client.http2 is True
+        assert client.aiohttp_transport is False
+        assert client.cache is False
 
         assert client.retry_strategy is None
         assert client.request_log_config == SupplierRequestLogConfig()
@@ -666,6 +782,7 @@ class TestAsyncSupplierClient:
         assert client.broker_message_builder is None
 
         assert client._global_client is None
+        assert client._client is None
         assert client._local_client is None
 
     @pytest.mark.asyncio
@@ -687,6 +804,25 @@ class TestAsyncSupplierClient:
 
         spy_tracer_trace.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_request_within_active_trace_uses_its_trace_id(
+        self, mocker: MockerFixture, mock_httpx_async_client: MagicMock
+    ) -> None:
+        original_request = Request("GET", "http://example.com")
+        original_response = Response(200, request=original_request)
+        original_response.elapsed = dt.timedelta(seconds=1)
+        mock_httpx_async_client.return_value.send.return_value = original_response
+
+        details = {"order_id": "123"}
+        with tracer.trace("parent") as parent_span:
+            spy_tracer_trace = mocker.spy(tracer, "trace")
+
+            async with AsyncSupplierClient() as client:
+                await client.request("GET", "http://example.com", details=details)
+
+        assert details["trace_id"] == parent_span.trace_id
+        spy_tracer_trace.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_sends_get_request_and_returns_response(
         self, mocker: MockerFixture, mock_httpx_async_client: MagicMock
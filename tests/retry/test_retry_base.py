@@ -245,6 +245,35 @@ class TestRetryStrategyBase:
         assert instance._retrying_kwargs["after"] == instance.after
         assert instance._retrying_kwargs["retry_error_callback"] == instance.error_callback
 
+    def test_wait_property_with_exponential_doubles_delay_up_to_max_delay(self) -> None:
+        instance = RetryStrategyBase(delay=1, exponential=True, max_delay=3)
+
+        delays = []
+        for attempt_number in (1, 2, 3):
+            retry_state = RetryState(None, None, (), {})
+            retry_state.attempt_number = attempt_number
+            delays.append(instance._wait(retry_state))
+
+        assert delays == [1, 2, 3]
+
+    def test_wait_property_with_jitter_adds_random_delay(self, sample_retry_state: RetryState) -> None:
+        instance = RetryStrategyBase(delay=1, jitter=0.5)
+
+        assert all(1 <= instance._wait(sample_retry_state) <= 1.5 for _ in range(10))
+
+    def test_wait_property_with_full_jitter_waits_up_to_delay(self, sample_retry_state: RetryState) -> None:
+        instance = RetryStrategyBase(delay=1, full_jitter=True)
+
+        assert all(0 <= instance._wait(sample_retry_state) <= 1 for _ in range(10))
+
+    def test_wait_property_with_exponential_full_jitter_waits_up_to_capped_delay(self) -> None:
+        instance = RetryStrategyBase(delay=1, exponential=True, max_delay=3, full_jitter=True)
+
+        for attempt_number, max_delay in ((1, 1), (2, 2), (3, 3), (4, 3)):
+            retry_state = RetryState(None, None, (), {})
+            retry_state.attempt_number = attempt_number
+            assert all(0 <= instance._wait(retry_state) <= max_delay for _ in range(10))
+
     def test_raise_retry_error_with_exception_raises_error_with_context(self, sample_retry_state: RetryState) -> None:
         base_instance = RetryStrategyBase()
 
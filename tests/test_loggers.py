@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import logging
+from logging.handlers import QueueHandler
+from typing import TYPE_CHECKING
+
+import pytest
+
+from loggers import enqueue_handlers
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+class TestEnqueueHandlers:
+    @pytest.fixture
+    def logger(self) -> Generator[logging.Logger, None, None]:
+        logger = logging.getLogger("tests.loggers")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        yield logger
+        logger.handlers.clear()
+
+    def test_replaces_handlers_with_queue_handler(self, logger: logging.Logger) -> None:
+        handler = logging.NullHandler()
+        logger.addHandler(handler)
+
+        listener = enqueue_handlers(logger)
+
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], QueueHandler)
+        assert listener.handlers == (handler,)
+
+    def test_listener_passes_records_to_original_handlers(self, logger: logging.Logger) -> None:
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.addHandler(handler)
+
+        listener = enqueue_handlers(logger)
+        listener.start()
+        logger.info("Message %s", "text", extra={"request": {"name": "REQUEST"}})
+        listener.stop()
+
+        assert len(records) == 1
+        assert records[0].getMessage() == "Message text"
+        assert records[0].request == {"name": "REQUEST"}
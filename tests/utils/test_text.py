@@ -1,6 +1,9 @@
+import base64
+import zlib
+
 import pytest
 
-from utils.text import compress_and_encode, mask_card_number, mask_pattern, mask_series_code
+from utils.text import compress_and_encode, mask_card_number, mask_pattern, mask_sensitive_data, mask_series_code
 
 
 class TestTextUtils:
@@ -34,6 +37,49 @@ class TestTextUtils:
     def test_mask_series_code_no_match_returns_input_text(self, text: str) -> None:
         assert mask_series_code(text) == text
 
+    def test_mask_sensitive_data_match_returns_masked_text(self) -> None:
+        text = '<Card CardNumber="123456789" SeriesCode="123"/><Card CardNumber="9876543210" SeriesCode="4567"/>'
+        masked_text = mask_sensitive_data(text)
+
+        assert masked_text == mask_card_number(mask_series_code(text))
+        assert masked_text == (
+            '<Card CardNumber="*****6789" SeriesCode="***"/><Card CardNumber="******3210" SeriesCode="****"/>'
+        )
+
+    def test_mask_sensitive_data_bytes_match_returns_masked_bytes(self) -> None:
+        text = b'<Card CardNumber="123456789" SeriesCode="123"/>'
+
+        assert mask_sensitive_data(text) == b'<Card CardNumber="*****6789" SeriesCode="***"/>'
+
+    @pytest.mark.parametrize("encoding", ["utf-16", "utf-32", "cp500"])
+    def test_mask_sensitive_data_bytes_in_encoding_returns_masked_bytes_in_encoding(self, encoding: str) -> None:
+        text = '<Card CardNumber="123456789" SeriesCode="123"/>'.encode(encoding)
+
+        masked_text = mask_sensitive_data(text, encoding)
+
+        assert masked_text.decode(encoding) == '<Card CardNumber="*****6789" SeriesCode="***"/>'
+
+    def test_mask_sensitive_data_non_ascii_bytes_masks_non_ascii_digits(self) -> None:
+        text = '<Card CardNumber="١٢٣٤٥٦٧٨٩" Name="Zoë"/>'.encode()
+
+        masked_text = mask_sensitive_data(text)
+
+        assert masked_text.decode() == '<Card CardNumber="*****٦٧٨٩" Name="Zoë"/>'
+
+    def test_mask_sensitive_data_undecodable_bytes_keeps_them(self) -> None:
+        text = b'<Card CardNumber="123456789" Name="\xff"/>'
+
+        assert mask_sensitive_data(text) == b'<Card CardNumber="*****6789" Name="\xff"/>'
+
+    def test_mask_sensitive_data_bytes_in_unknown_encoding_reads_utf8(self) -> None:
+        text = b'<Card CardNumber="123456789"/>'
+
+        assert mask_sensitive_data(text, "unknown") == b'<Card CardNumber="*****6789"/>'
+
+    @pytest.mark.parametrize("text", ['CardNumber="abcdefghi"', 'Code="123456789"'])
+    def test_mask_sensitive_data_no_match_returns_input_text(self, text: str) -> None:
+        assert mask_sensitive_data(text) == text
+
     @pytest.mark.parametrize(
         ("text", "result"),
         [
@@ -43,3 +89,9 @@ class TestTextUtils:
     )
     def test_compress_and_encode(self, text: str, result: str) -> None:
         assert compress_and_encode(text) == result
+
+    def test_compress_and_encode_with_level(self) -> None:
+        result = compress_and_encode("This is a test string.", level=1)
+
+        assert zlib.decompress(base64.b64decode(result)) == b"This is a test string."
+        assert result != compress_and_encode("This is a test string.")
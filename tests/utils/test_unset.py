@@ -1,4 +1,4 @@
-from utils.unset import UNSET, setattr_if_not_unset
+from utils.unset import UNSET, setattr_if_not_unset, setattrs_if_not_unset
 
 
 class Object:
@@ -17,3 +17,11 @@ class TestUnsetUtils:
         setattr_if_not_unset(obj, "attr", UNSET)
 
         assert not hasattr(obj, "attr")
+
+    def test_setattrs_if_not_unset_sets_only_set_attributes(self) -> None:
+        obj = Object()
+        setattrs_if_not_unset(obj, first=1, second=UNSET, third=None)
+
+        assert obj.first == 1
+        assert not hasattr(obj, "second")
+        assert obj.third is None
@@ -1,22 +1,59 @@
 from __future__ import annotations
 
 import base64
+import codecs
 import re
 import zlib
+from functools import lru_cache
 
+CARD_NUMBER_PATTERN = r'(?<=CardNumber=")\d+(?=\d{4}")'
+SERIES_CODE_PATTERN = r'(?<=SeriesCode=")\d+(?=")'
 
-def mask_pattern(text: str, pattern: str) -> str:
+# Sensitive values are all masked the same way, so one alternation masks them in a single pass over the text.
+SENSITIVE_DATA_REGEX = re.compile(f"{CARD_NUMBER_PATTERN}|{SERIES_CODE_PATTERN}")
+# The patterns are ASCII-only, so ASCII bodies can be masked as bytes without decoding them first.
+SENSITIVE_DATA_BYTES_REGEX = re.compile(SENSITIVE_DATA_REGEX.pattern.encode())
+# ASCII bytes mean the same text in these encodings, so they can be masked as bytes.
+ASCII_COMPATIBLE_ENCODINGS = frozenset({"ascii", "utf-8"})
+
+
+@lru_cache(maxsize=32)
+def _normalize_encoding(encoding: str) -> str:
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        # Like HTTPX, read bodies in unknown encodings as UTF-8.
+        return "utf-8"
+
+
+def mask_pattern(text: str, pattern: str | re.Pattern[str]) -> str:
     return re.sub(pattern, lambda match: "*" * len(match.group()), text)
 
 
 def mask_card_number(text: str) -> str:
-    return mask_pattern(text, r'(?<=CardNumber=")\d+(?=\d{4}")')
+    return mask_pattern(text, CARD_NUMBER_PATTERN)
 
 
 def mask_series_code(text: str) -> str:
-    return mask_pattern(text, r'(?<=SeriesCode=")\d+(?=")')
+    return mask_pattern(text, SERIES_CODE_PATTERN)
+
+
+def mask_sensitive_data(text: str | bytes, encoding: str | None = None) -> str | bytes:
+    """Mask card numbers and series codes, like `mask_card_number` and `mask_series_code` together.
+
+    Bytes are read in `encoding` (UTF-8 by default) and returned in the same encoding.
+    """
+    if isinstance(text, bytes):
+        encoding = _normalize_encoding(encoding) if encoding else "utf-8"
+        if encoding in ASCII_COMPATIBLE_ENCODINGS and text.isascii():
+            return SENSITIVE_DATA_BYTES_REGEX.sub(lambda match: b"*" * len(match.group()), text)
+        # Other bodies are decoded, since the bytes pattern only matches ASCII digits in single-byte characters.
+        # Undecodable bytes are kept as they are.
+        masked_text = mask_pattern(text.decode(encoding, "surrogateescape"), SENSITIVE_DATA_REGEX)
+        return masked_text.encode(encoding, "surrogateescape")
+    return mask_pattern(text, SENSITIVE_DATA_REGEX)
 
 
-def compress_and_encode(text: str | bytes) -> str:
+def compress_and_encode(text: str | bytes, level: int = zlib.Z_DEFAULT_COMPRESSION) -> str:
     text_bytes = text if isinstance(text, bytes) else text.encode()
-    return base64.b64encode(zlib.compress(text_bytes)).decode()
+    return base64.b64encode(zlib.compress(text_bytes, level)).decode()
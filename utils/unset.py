@@ -13,3 +13,10 @@ UNSET = Unset()
 def setattr_if_not_unset(obj: object, name: str, value: Any | Unset) -> None:
     if value is not UNSET:
         setattr(obj, name, value)
+
+
+def setattrs_if_not_unset(obj: object, **values: Any | Unset) -> None:
+    # A single call with a loop is cheaper than a `setattr_if_not_unset` call per attribute.
+    for name, value in values.items():
+        if value is not UNSET:
+            setattr(obj, name, value)